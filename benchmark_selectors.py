@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+""" Micro-benchmark of the spiders' selectors on stored HTML pages. """
+
+import os
+import glob
+import time
+import argparse
+from typing import Any, Dict, List
+
+from scrapy.crawler import Crawler
+from scrapy.http import HtmlResponse, Request
+from scrapy.spiderloader import SpiderLoader
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.pipelines import get_data_folder
+from news_crawler.spiders import BaseSpider
+
+
+class ParselSelection(object):
+    """ Selects values with Scrapy's selectors on every call, i.e. without compiled evaluators or memoisation. """
+    def select(self, response, query):
+        return response.xpath(query).getall()
+
+    def select_first(self, response, query):
+        return response.xpath(query).get()
+
+    def select_strings(self, response, query):
+        return [node.xpath('string()').get().strip() for node in response.xpath(query)]
+
+    def is_excluded(self, response):
+        paywall = self._schema['paywall']
+        return bool(paywall and response.xpath(paywall))
+
+
+def extract(spider: BaseSpider, response: HtmlResponse) -> Dict[str, Any]:
+    """ Run the selection steps of `parse_item` on a page, without the date and keyword validation. """
+    paragraphs = spider.get_paragraphs(response)
+    creation_date = spider.get_creation_date(response)
+    return {
+            'excluded': spider.is_excluded(response),
+            'creation_date': creation_date,
+            'last_modified': spider.get_last_modified(response, creation_date) if creation_date else None,
+            'authors': spider.get_authors(response),
+            'news_keywords': spider.get_news_keywords(response),
+            'title': spider.get_title(response),
+            'description': spider.get_description(response),
+            'body': spider.get_body(response, paragraphs),
+            'recommendations': spider.get_recommendations(response),
+            }
+
+
+def run(spider: BaseSpider, pages: List[bytes], repeat: int) -> float:
+    """ Returns the mean time in milliseconds of the extraction of a page; a new response is built for each run. """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in pages:
+            extract(spider, HtmlResponse('https://www.example.de/', body=body, request=Request('https://www.example.de/'), encoding='utf-8'))
+    return (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Arguments for the selector benchmark.')
+    parser.add_argument('--spider',
+            required=True,
+            type=str,
+            help='The name of the spider whose selectors are benchmarked.'
+            )
+    parser.add_argument('--topic',
+            default='refugees_migration',
+            type=str,
+            help='The topic for which the pages have been stored, if no directory is given (default: refugees_migration).'
+            )
+    parser.add_argument('--html_dir',
+            default=None,
+            type=str,
+            help='The directory of the stored HTML pages (default: the directory written by HtmlWriterPipeline).'
+            )
+    parser.add_argument('--repeat',
+            default=5,
+            type=int,
+            help='How many times each page is parsed (default: 5).'
+            )
+    args = parser.parse_args()
+
+    html_dir = args.html_dir or os.path.join(get_data_folder(args.topic, args.spider), 'html')
+    pages = [open(file, 'rb').read() for file in sorted(glob.glob(os.path.join(html_dir, '*.html')))]
+    if not pages:
+        raise SystemExit('No HTML pages found in {}'.format(html_dir))
+
+    settings = get_project_settings()
+    spider_cls = SpiderLoader.from_settings(settings).load(args.spider)
+    baseline_cls = type('Parsel' + spider_cls.__name__, (ParselSelection, spider_cls), dict())
+    baseline = baseline_cls.from_crawler(Crawler(baseline_cls, settings))
+    compiled = spider_cls.from_crawler(Crawler(spider_cls, settings))
+
+    # Both variants must select the same values
+    for body in pages:
+        response = HtmlResponse('https://www.example.de/', body=body, request=Request('https://www.example.de/'), encoding='utf-8')
+        if extract(baseline, response) != extract(compiled, response):
+            raise SystemExit('The selections differ on a page of {}'.format(html_dir))
+
+    # Warm up, e.g. the evaluators compiled on first use
+    run(compiled, pages[:1], 1)
+    run(baseline, pages[:1], 1)
+
+    baseline_time = run(baseline, pages, args.repeat)
+    compiled_time = run(compiled, pages, args.repeat)
+    print('{} pages of {}, {} runs each'.format(len(pages), args.spider, args.repeat))
+    print('Scrapy selectors:             {:.3f} ms per page'.format(baseline_time))
+    print('Compiled, memoised selectors: {:.3f} ms per page'.format(compiled_time))
+    print('Saving:                       {:.3f} ms per page ({:.1f}%)'.format(baseline_time - compiled_time, 100 * (baseline_time - compiled_time) / baseline_time))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Command crawling several outlets at once for news_crawler project
+
+import os
+import json
+import logging
+from datetime import datetime
+from collections import OrderedDict
+from numbers import Number
+from twisted.internet import defer, task
+from scrapy.commands import ScrapyCommand
+from scrapy.crawler import Crawler
+from scrapy.exceptions import UsageError
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def get_domain(spidercls) -> str:
+    """ The domain crawled by a spider, i.e. its first allowed domain without `www.`, or its name if it has none. """
+    domains = getattr(spidercls, 'allowed_domains', None)
+    if not domains:
+        return spidercls.name
+    domain = domains[0].lower()
+    return domain[4:] if domain.startswith('www.') else domain
+
+
+def merge_stats(outlet_stats: List[Dict]) -> Dict:
+    """
+    Args:
+        outlet_stats (:obj:`List[Dict]`):
+            The crawl stats of each outlet.
+
+    Returns:
+        :obj:`Dict`:
+            The numeric stats summed over the outlets, except for maxima (e.g. `link_extractor/max_time_ms`), of which
+            the largest is taken. Other values (e.g. dates, finish reasons) are left out.
+    """
+    merged = dict()
+    for stats in outlet_stats:
+        for key, value in stats.items():
+            if not isinstance(value, Number) or isinstance(value, bool):
+                continue
+            if key not in merged:
+                merged[key] = value
+            elif 'max' in key.split('/')[-1]:
+                merged[key] = max(merged[key], value)
+            else:
+                merged[key] += value
+    return dict(sorted(merged.items()))
+
+
+class Command(ScrapyCommand):
+    """
+    Runs the spiders of several outlets in one process, such that they share a single reactor and startup, and the
+    outlets (i.e. different domains) are crawled in parallel. `DOWNLOAD_DELAY` and `CONCURRENT_REQUESTS_PER_DOMAIN`
+    apply per domain, since the downloader of each spider keeps a slot per domain; spiders crawling the same domain
+    (e.g. spiegel and spiegel_start) do not share their slots, hence they are run one after another.
+
+    The progress of all outlets is logged periodically, and the stats of all outlets are written into one summary
+    when the crawl ends, next to the stats persisted for each outlet.
+
+    Args:
+        crawlers (:obj:`Dict[str, Crawler]`):
+            The crawler of each outlet, by spider name.
+        start_time (:obj:`datetime`):
+            When the crawl started.
+    """
+
+    requires_project = True
+
+    def syntax(self):
+        return '[options] [<spider> ...]'
+
+    def short_desc(self):
+        return 'Run the spiders of several outlets (all if none is given) in one process'
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument('-x', '--exclude', dest='exclude', action='append', default=[], metavar='SPIDER',
+                help='leave out a spider (can be repeated)')
+        parser.add_argument('--interval', dest='interval', type=float, default=60,
+                help='seconds between two progress reports (default: 60)')
+        parser.add_argument('--summary', dest='summary', default=None, metavar='FILE',
+                help='file of the merged run summary (default: data/crawl_all/<start time>.json)')
+
+    def run(self, args, opts):
+        spider_loader = self.crawler_process.spider_loader
+        names = args or sorted(spider_loader.list())
+        unknown = [name for name in names + opts.exclude if name not in spider_loader.list()]
+        if unknown:
+            raise UsageError('Unknown spiders: {}'.format(', '.join(unknown)))
+        names = [name for name in names if name not in opts.exclude]
+        if not names:
+            raise UsageError('No spider to run')
+
+        # Spiders crawling the same domain are run one after another
+        groups = OrderedDict()
+        for name in names:
+            groups.setdefault(get_domain(spider_loader.load(name)), list()).append(name)
+
+        self.start_time = datetime.now()
+        self.crawlers = OrderedDict((name, self.crawler_process.create_crawler(name)) for name in names)
+        for group in groups.values():
+            self.crawl_one_by_one(group)
+
+        report = task.LoopingCall(self.report_progress)
+        report.start(opts.interval, now=False)
+        # The reactor is stopped once no crawl is left, including those started when another one of their group ends
+        self.crawler_process.start()
+        if report.running:
+            report.stop()
+
+        self.report_progress()
+        self.write_summary(opts.summary)
+        if self.crawler_process.bootstrap_failed:
+            self.exitcode = 1
+
+    @defer.inlineCallbacks
+    def crawl_one_by_one(self, names: List[str]):
+        for name in names:
+            try:
+                yield self.crawler_process.crawl(self.crawlers[name])
+            except Exception:
+                logger.exception('The crawl of {} failed'.format(name))
+
+    def get_state(self, crawler: Crawler) -> str:
+        if crawler.crawling:
+            return 'running'
+        return crawler.stats.get_value('finish_reason') or 'waiting'
+
+    def report_progress(self):
+        """ Log the pages, items, and state of each outlet, and the totals of the run. """
+        states = [self.get_state(crawler) for crawler in self.crawlers.values()]
+        lines = list()
+        for (name, crawler), state in zip(self.crawlers.items(), states):
+            stats = crawler.stats
+            lines.append('{:<24} {:<10} {:>8} pages {:>6} items'.format(name, state, stats.get_value('response_received_count', 0),
+                stats.get_value('item_scraped_count', 0)))
+        totals = merge_stats([crawler.stats.get_stats() for crawler in self.crawlers.values()])
+        logger.info('Crawled {} outlets ({} running, {} finished) in {}: {} pages, {} items\n{}'.format(len(self.crawlers),
+            states.count('running'), len(states) - states.count('running') - states.count('waiting'), datetime.now() - self.start_time,
+            totals.get('response_received_count', 0), totals.get('item_scraped_count', 0), '\n'.join(lines)))
+
+    def write_summary(self, path: str):
+        """ Write the stats of all outlets, and their totals, into one file. """
+        if path is None:
+            folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'data', 'crawl_all')
+            path = os.path.join(folder, '{:%Y-%m-%d_%H-%M-%S}.json'.format(self.start_time))
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        outlets = {name: crawler.stats.get_stats() for name, crawler in self.crawlers.items()}
+        summary = {
+                'start_time': self.start_time,
+                'finish_time': datetime.now(),
+                'outlets': outlets,
+                'totals': merge_stats(list(outlets.values())),
+                }
+        with open(path, 'w') as file:
+            json.dump(summary, file, sort_keys=True, indent=1, default=str)
+        logger.info('Wrote the run summary to {}'.format(path))
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+# Command supervising the crawls of outlets in separate processes for news_crawler project
+
+import os
+import re
+import sys
+import time
+import signal
+import logging
+import resource
+import threading
+import subprocess
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Lines logged by Scrapy's LogStats extension, and when a spider closes
+LOG_STATS = re.compile(r'Crawled (\d+) pages \(.*?\), scraped (\d+) items')
+CLOSING = re.compile(r'Closing spider \((\w+)\)')
+
+# Reasons for which a closed spider is resumed, besides crashes
+RESUMED_REASONS = ('memusage_exceeded',)
+
+
+def limit_resources(nice: int, memory: int):
+    """
+    Lower the scheduling priority of the current process, and limit its address space to twice the memory limit.
+
+    Args:
+        nice (:obj:`int`):
+            The increment of the scheduling priority.
+        memory (:obj:`int`):
+            The memory limit of the crawl in megabytes, or 0 for none.
+    """
+    os.nice(nice)
+    if memory:
+        limit = 2 * memory * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def main():
+    """ 
+    Entry point of the crawls' processes (`python -m news_crawler.commands.supervise <nice> <memory> crawl ...`), 
+    which limit their own resources before running Scrapy, since limiting them between fork and exec is not safe 
+    while the supervisor runs threads.
+    """
+    limit_resources(int(sys.argv[1]), int(sys.argv[2]))
+    sys.argv = ['scrapy'] + sys.argv[3:]
+    from scrapy.cmdline import execute
+    execute()
+
+
+class OutletProcess(object):
+    """
+    The crawl of an outlet in its own process, whose log is written to a file and scanned for its progress.
+
+    Args:
+        name (:obj:`str`):
+            The name of the outlet's spider.
+        job_dir (:obj:`str`):
+            The directory in which Scrapy persists the state of the crawl (`JOBDIR`), such that it is resumed by a restart.
+        log_path (:obj:`str`):
+            The file to which the log of the crawl is appended.
+        state (:obj:`str`):
+            `waiting`, `running`, `done` (the spider closed, e.g. on its timeout), `failed` (too many restarts), or `stopped`.
+        restarts (:obj:`int`):
+            The number of times the crawl has been resumed after a crash.
+        start_after (:obj:`float`):
+            The time before which the crawl is not (re)started.
+        pages, items (:obj:`int`):
+            The pages crawled and items scraped by all processes of the crawl, as logged by its job.
+        reason (:obj:`Optional[str]`):
+            The reason for which the spider of the current process closed, if it did.
+        process (:obj:`Optional[subprocess.Popen]`):
+            The current process.
+    """
+
+    def __init__(self, name: str, job_dir: str, log_path: str):
+        self.name = name
+        self.job_dir = job_dir
+        self.log_path = log_path
+        self.state = 'waiting'
+        self.restarts = 0
+        self.start_after = 0
+        self.pages = 0
+        self.items = 0
+        self.reason = None
+        self.process = None
+        self._reader = None
+
+    def start(self, args: List[str], env: Dict[str, str]):
+        self.reason = None
+        # In a session of its own, such that it does not receive the terminal's interrupt besides the one forwarded to it
+        self.process = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env,
+                start_new_session=True, universal_newlines=True, errors='replace')
+        self._reader = threading.Thread(target=self.read_log, daemon=True)
+        self._reader.start()
+        self.state = 'running'
+
+    def read_log(self):
+        with open(self.log_path, 'a') as log:
+            for line in self.process.stderr:
+                log.write(line)
+                match = LOG_STATS.search(line)
+                if match:
+                    # A resumed crawl logs the counts of its job, continued from its last checkpoint, which may be older
+                    # than the counts logged before it crashed
+                    self.pages, self.items = max(self.pages, int(match.group(1))), max(self.items, int(match.group(2)))
+                match = CLOSING.search(line)
+                if match:
+                    self.reason = match.group(1)
+
+    def poll(self) -> Optional[int]:
+        """ The exit code of the process once it has ended and its log has been read, or :obj:`None` while it runs. """
+        returncode = self.process.poll()
+        if returncode is not None:
+            self._reader.join()
+        return returncode
+
+
+class Command(ScrapyCommand):
+    """
+    Crawls each outlet in its own OS process, such that an outlet crashing or running out of memory during a long crawl
+    does not take the others down. As many outlets are crawled at once as there are cores (unless configured otherwise),
+    the others wait until a crawl ends. Each crawl is a Scrapy job (`JOBDIR`), such that a crashed crawl (or one closed for
+    exceeding its memory limit) is restarted where it stopped, i.e. with its pending requests and its dupefilter.
+
+    The memory of a crawl is capped by closing its spider when it exceeds the limit (Scrapy's `MEMUSAGE_LIMIT_MB`), which
+    saves its job for the restart, and by an address space limit of twice as much, in case it does not close in time. The
+    CPU is shared by running the crawls at a lower scheduling priority, and at most one per core.
+
+    Args:
+        outlets (:obj:`List[OutletProcess]`):
+            The crawl of each outlet.
+        stopping (:obj:`bool`):
+            Whether the crawls are being interrupted.
+    """
+
+    requires_project = True
+
+    def syntax(self):
+        return '[options] [<spider> ...]'
+
+    def short_desc(self):
+        return 'Crawl outlets (all if none is given) in separate processes, restarting them if they crash'
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument('-x', '--exclude', dest='exclude', action='append', default=[], metavar='SPIDER',
+                help='leave out a spider (can be repeated)')
+        parser.add_argument('--max-active', dest='max_active', type=int, default=os.cpu_count() or 1,
+                help='number of outlets crawled at once (default: number of cores)')
+        parser.add_argument('--memory', dest='memory', type=int, default=2048, metavar='MB',
+                help='memory limit of each crawl in megabytes, or 0 for none (default: 2048)')
+        parser.add_argument('--nice', dest='nice', type=int, default=10,
+                help='increment of the scheduling priority of the crawls (default: 10)')
+        parser.add_argument('--max-restarts', dest='max_restarts', type=int, default=5,
+                help='number of times a crawl is resumed after crashing (default: 5)')
+        parser.add_argument('--interval', dest='interval', type=float, default=60,
+                help='seconds between two progress reports (default: 60)')
+        parser.add_argument('--jobs-dir', dest='jobs_dir', default=None, metavar='DIR',
+                help='directory of the jobs and logs of the crawls (default: data/jobs)')
+
+    def run(self, args, opts):
+        spider_names = self.crawler_process.spider_loader.list()
+        names = args or sorted(spider_names)
+        unknown = [name for name in names + opts.exclude if name not in spider_names]
+        if unknown:
+            raise UsageError('Unknown spiders: {}'.format(', '.join(unknown)))
+        names = [name for name in names if name not in opts.exclude]
+        if not names:
+            raise UsageError('No spider to run')
+
+        jobs_dir = opts.jobs_dir or os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'data', 'jobs')
+        os.makedirs(jobs_dir, exist_ok=True)
+        self.outlets = [OutletProcess(name, os.path.join(jobs_dir, name), os.path.join(jobs_dir, name + '.log')) for name in names]
+        self.stopping = False
+        self.opts = opts
+
+        # Interrupted crawls are stopped gracefully, such that their jobs are saved
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        last_report = time.monotonic()
+        while any(outlet.state in ('waiting', 'running') for outlet in self.outlets):
+            for outlet in self.outlets:
+                if outlet.state == 'running':
+                    self.check(outlet)
+            self.start_waiting()
+            if time.monotonic() - last_report >= opts.interval:
+                self.report_progress()
+                last_report = time.monotonic()
+            time.sleep(1)
+        self.report_progress()
+        if any(outlet.state == 'failed' for outlet in self.outlets):
+            self.exitcode = 1
+
+    def get_args(self, outlet: OutletProcess) -> List[str]:
+        """ The command line of an outlet's crawl, with the settings given to this command. """
+        # The frontier is kept in the job's database, which is saved with each request rather than when the crawl closes
+        args = [sys.executable, '-m', 'news_crawler.commands.supervise', str(self.opts.nice), str(self.opts.memory), 'crawl', outlet.name, '-s', 'JOBDIR={}'.format(outlet.job_dir),
+                '-s', 'SCHEDULER=news_crawler.schedulers.SharedFrontierScheduler']
+        if self.opts.memory:
+            args += ['-s', 'MEMUSAGE_ENABLED=1', '-s', 'MEMUSAGE_LIMIT_MB={}'.format(self.opts.memory)]
+        for setting in self.opts.set:
+            args += ['-s', setting]
+        return args
+
+    def get_env(self) -> Dict[str, str]:
+        """ The environment of the crawls, in which the project is importable from any working directory. """
+        project_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..')
+        python_path = os.environ.get('PYTHONPATH')
+        return dict(os.environ, PYTHONPATH=project_dir + os.pathsep + python_path if python_path else project_dir)
+
+    def start_waiting(self):
+        """ Start the waiting crawls, as long as fewer than the maximum are running. """
+        active = sum(outlet.state == 'running' for outlet in self.outlets)
+        for outlet in self.outlets:
+            if self.stopping or active >= self.opts.max_active:
+                return
+            if outlet.state == 'waiting' and outlet.start_after <= time.monotonic():
+                logger.info('{} {}'.format('Resuming' if outlet.restarts else 'Starting', outlet.name))
+                outlet.start(self.get_args(outlet), self.get_env())
+                active += 1
+
+    def check(self, outlet: OutletProcess):
+        """ Once the crawl of an outlet has ended, schedule its restart if it crashed. """
+        returncode = outlet.poll()
+        if returncode is None:
+            return
+        if self.stopping:
+            outlet.state = 'stopped'
+        elif returncode == 0 and outlet.reason and outlet.reason not in RESUMED_REASONS:
+            outlet.state = 'done'
+            logger.info('{} finished ({})'.format(outlet.name, outlet.reason))
+        elif outlet.restarts < self.opts.max_restarts:
+            outlet.restarts += 1
+            # Restarts back off, such that a crawl crashing on start does not hog a slot
+            outlet.start_after = time.monotonic() + 30 * 2 ** (outlet.restarts - 1)
+            outlet.state = 'waiting'
+            logger.warning('{} ended (exit code {}, {}), resuming it later; see {}'.format(outlet.name, returncode,
+                outlet.reason or 'crashed', outlet.log_path))
+        else:
+            outlet.state = 'failed'
+            logger.error('{} ended (exit code {}, {}) after {} restarts; see {}'.format(outlet.name, returncode,
+                outlet.reason or 'crashed', outlet.restarts, outlet.log_path))
+
+    def stop(self, signum, frame):
+        """ Stop the running crawls gracefully, and start no more. """
+        if self.stopping:
+            return
+        logger.info('Stopping the crawls, their jobs are saved for resuming them')
+        self.stopping = True
+        for outlet in self.outlets:
+            if outlet.state == 'running':
+                outlet.process.send_signal(signal.SIGINT)
+            elif outlet.state == 'waiting':
+                outlet.state = 'stopped'
+
+    def report_progress(self):
+        """ Log the state, pages, and items of each outlet, and the totals. """
+        lines = ['{:<24} {:<8} {:>8} {:>8} {:>8}   {}'.format('outlet', 'state', 'restarts', 'pages', 'items', 'reason')]
+        for outlet in self.outlets:
+            lines.append('{:<24} {:<8} {:>8} {:>8} {:>8}   {}'.format(outlet.name, outlet.state, outlet.restarts, outlet.pages,
+                outlet.items, outlet.reason or ''))
+        states = [outlet.state for outlet in self.outlets]
+        logger.info('{} outlets ({} running, {} waiting, {} done, {} failed): {} pages, {} items\n{}'.format(len(states),
+            states.count('running'), states.count('waiting'), states.count('done'), states.count('failed'),
+            sum(outlet.pages for outlet in self.outlets), sum(outlet.items for outlet in self.outlets), '\n'.join(lines)))
+
+
+if __name__ == '__main__':
+    main()
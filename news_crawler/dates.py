@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# German date parsing for news_crawler project
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Month names and their abbreviations, in lower case
+MONTHS = {
+        'januar': 1, 'jänner': 1, 'jan': 1, 'februar': 2, 'feb': 2, 'märz': 3, 'maerz': 3, 'mär': 3, 'mrz': 3,
+        'april': 4, 'apr': 4, 'mai': 5, 'juni': 6, 'jun': 6, 'juli': 7, 'jul': 7, 'august': 8, 'aug': 8,
+        'september': 9, 'sept': 9, 'sep': 9, 'oktober': 10, 'okt': 10, 'november': 11, 'nov': 11, 'dezember': 12, 'dez': 12
+        }
+
+# Optional leading weekday, e.g. `Montag, ` or `Mo., `
+WEEKDAY = r'(?:(?:montag|dienstag|mittwoch|donnerstag|freitag|samstag|sonnabend|sonntag|mo|di|mi|do|fr|sa|so)\.?,?\s+)?'
+
+# Optional trailing time, e.g. ` um 10:00`, `, 16:00 Uhr`, or ` / 06:00`
+TIME = r'(?:,?\s*(?:um\s+|/\s*|-\s*)?(?P<hour>\d{1,2})[:.](?P<minute>\d{2})(?::(?P<second>\d{2}))?(?:\s*uhr)?)?'
+
+# Dates written as numbers (e.g. `12.03.2020 um 10:00`) or with the month's name (e.g. `12. März 2020`)
+DATE_PATTERNS = (
+        re.compile(WEEKDAY + r'(?P<day>\d{1,2})\.\s*(?P<month>\d{1,2})\.\s*(?P<year>\d{4}|\d{2})' + TIME, re.IGNORECASE),
+        re.compile(
+            WEEKDAY + r'(?P<day>\d{1,2})\.?\s+(?P<month>' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?\s+(?P<year>\d{4})' + TIME,
+            re.IGNORECASE
+            ),
+        )
+
+# How a date has been parsed, as recorded in the crawl stats
+PARSED_BY_PATTERN = 'pattern'
+PARSED_BY_DATEPARSER = 'dateparser'
+NOT_PARSED = 'failed'
+
+
+def _match_date(date: str) -> Optional[datetime]:
+    """ Parse a date matching one of the German date patterns, or return :obj:`None`. """
+    for pattern in DATE_PATTERNS:
+        match = pattern.fullmatch(date)
+        if not match:
+            continue
+        month = match.group('month')
+        year = int(match.group('year'))
+        try:
+            return datetime(
+                    year + 2000 if year < 100 else year,
+                    int(month) if month.isdigit() else MONTHS[month.lower()],
+                    int(match.group('day')),
+                    int(match.group('hour') or 0),
+                    int(match.group('minute') or 0),
+                    int(match.group('second') or 0)
+                    )
+        except ValueError:
+            # Not a valid date, e.g. 31.02.2020
+            return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_german_date(date: str) -> Tuple[Optional[datetime], str]:
+    """
+    Parse a German date with precompiled patterns, falling back to dateparser, restricted to German, for
+    the dates they do not match. Results are cached by the raw string, since pages of an outlet share
+    their dates (e.g. all articles of a day).
+
+    Args:
+        date (:obj:`str`):
+            The date, e.g. `12. März 2020`, `Mo, 02 Mär 2020 10:00`, or `12.03.2020 um 10:00`.
+
+    Returns:
+        :obj:`Tuple[Optional[datetime], str]`:
+            The parsed date, or :obj:`None` if it cannot be parsed, and how it has been parsed
+            (`PARSED_BY_PATTERN`, `PARSED_BY_DATEPARSER`, or `NOT_PARSED`).
+    """
+    parsed_date = _match_date(date)
+    if parsed_date:
+        return parsed_date, PARSED_BY_PATTERN
+
+    # Imported on first use, since importing dateparser is slow
+    import dateparser
+    parsed_date = dateparser.parse(date, languages=['de'])
+    return parsed_date, PARSED_BY_DATEPARSER if parsed_date else NOT_PARSED
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Duplicate request filtering for news_crawler project
+
+import os
+import math
+import struct
+from scrapy.dupefilters import RFPDupeFilter
+from scrapy.utils.job import job_dir
+from typing import BinaryIO, List, Optional, Tuple
+
+
+# Start of the file of a persisted filter, followed by its slices
+MAGIC = b'NCBLOOM1'
+
+# Capacity, error rate, number of fingerprints, number of bits, and number of hashes of a slice
+SLICE_HEADER = struct.Struct('<QdQQI')
+
+
+def next_prime(number: int) -> int:
+    """ The smallest prime number not below the given one. """
+    candidate = max(number, 2)
+    while any(candidate % divisor == 0 for divisor in range(2, math.isqrt(candidate) + 1)):
+        candidate += 1
+    return candidate
+
+
+def split_fingerprint(fingerprint: str) -> Tuple[int, int]:
+    """ Two 64-bit hashes taken from a request fingerprint (a hexadecimal SHA1 digest), from which its bits are derived. """
+    return int(fingerprint[:16], 16), int(fingerprint[16:32], 16) | 1
+
+
+class BloomSlice(object):
+    """
+    Bloom filter of a fixed capacity, whose bits are addressed by double hashing of a request fingerprint. The number
+    of bits is prime, such that the bits of a fingerprint are distinct.
+
+    Args:
+        capacity (:obj:`int`):
+            The number of fingerprints which can be added before the error rate is exceeded.
+        error_rate (:obj:`float`):
+            The probability that a fingerprint not added is taken for an added one, once the slice is full.
+        count (:obj:`int`):
+            The number of fingerprints added.
+        num_bits (:obj:`int`):
+            The size of the bit array.
+        num_hashes (:obj:`int`):
+            The number of bits set per fingerprint.
+        bits (:obj:`bytearray`):
+            The bit array.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, count: int = 0, num_bits: Optional[int] = None, num_hashes: Optional[int] = None, bits: Optional[bytearray] = None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = count
+        if num_bits is None:
+            num_bits = next_prime(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    def positions(self, hashes: Tuple[int, int]) -> List[int]:
+        """ The bits of a fingerprint, given by its two hashes (see `split_fingerprint`). """
+        num_bits = self.num_bits
+        first, second = hashes[0] % num_bits, hashes[1] % num_bits or 1
+        return [(first + i * second) % num_bits for i in range(self.num_hashes)]
+
+    def contains(self, hashes: Tuple[int, int]) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.positions(hashes))
+
+    def add(self, hashes: Tuple[int, int]):
+        bits = self.bits
+        for position in self.positions(hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter(object):
+    """
+    Set of request fingerprints kept in Bloom filters, taking about 1.44 * log2(1 / error_rate) bits per
+    fingerprint rather than a string each. When a filter is full, a filter twice as large with half the error
+    rate is added, such that the overall error rate stays about the configured one however many fingerprints
+    are added. Each lookup checks every filter, hence the capacity should be set such that few filters are added.
+
+    Args:
+        capacity (:obj:`int`):
+            The number of fingerprints of the first filter.
+        error_rate (:obj:`float`):
+            The maximum probability that a request not seen is taken for a seen one.
+        slices (:obj:`List[BloomSlice]`):
+            The filters, from the oldest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.slices = list()
+
+    def __contains__(self, fingerprint: str) -> bool:
+        hashes = split_fingerprint(fingerprint)
+        return any(bloom_slice.contains(hashes) for bloom_slice in self.slices)
+
+    def __len__(self) -> int:
+        return sum(bloom_slice.count for bloom_slice in self.slices)
+
+    def add(self, fingerprint: str) -> bool:
+        """ Add a fingerprint, unless it is (possibly) contained already, and return whether it was. """
+        hashes = split_fingerprint(fingerprint)
+        if any(bloom_slice.contains(hashes) for bloom_slice in self.slices):
+            return True
+        if not self.slices or self.slices[-1].is_full():
+            # The error rates of the slices sum up to the configured one
+            index = len(self.slices)
+            self.slices.append(BloomSlice(self.capacity * 2 ** index, self.error_rate / 2 ** (index + 1)))
+        self.slices[-1].add(hashes)
+        return False
+
+    def save(self, file: BinaryIO):
+        file.write(MAGIC)
+        file.write(struct.pack('<I', len(self.slices)))
+        for bloom_slice in self.slices:
+            file.write(SLICE_HEADER.pack(bloom_slice.capacity, bloom_slice.error_rate, bloom_slice.count, bloom_slice.num_bits, bloom_slice.num_hashes))
+            file.write(bloom_slice.bits)
+
+    def load(self, file: BinaryIO):
+        """ Take over the slices of a saved filter, such that the fingerprints it contains are seen. """
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Not a saved Bloom filter')
+        num_slices, = struct.unpack('<I', file.read(4))
+        slices = list()
+        for _ in range(num_slices):
+            capacity, error_rate, count, num_bits, num_hashes = SLICE_HEADER.unpack(file.read(SLICE_HEADER.size))
+            bits = bytearray(file.read((num_bits + 7) // 8))
+            if len(bits) != (num_bits + 7) // 8:
+                raise ValueError('Truncated Bloom filter')
+            slices.append(BloomSlice(capacity, error_rate, count, num_bits, num_hashes, bits))
+        self.slices = slices
+
+
+class BloomDupeFilter(RFPDupeFilter):
+    """
+    Duplicate request filter keeping the fingerprints of an outlet's requests in a scalable Bloom filter rather
+    than in a set of strings. The filter is lossy: a request not seen is taken for a seen one (and dropped) with the
+    probability of the error rate, hence it is only used if configured as `DUPEFILTER_CLASS`. If persisted, the filter is saved per outlet when the spider closes and loaded when it opens,
+    such that repeated crawls of an outlet (e.g. for another topic, or after a timeout) do not request the same
+    pages again; otherwise, it is saved in the `JOBDIR` of a paused or interrupted crawl, if any. The filter is only
+    saved when the spider closes cleanly, together with Scrapy's queues of pending requests: a filter saved during
+    the crawl would contain the requests which were pending when the crawl crashed, whose queue is lost, such that
+    the resumed crawl would never request them. Start URLs are always requested, since they are not filtered.
+
+    Args:
+        path (:obj:`Optional[str]`):
+            The file in which the filter is persisted, or :obj:`None` if it is only kept in memory.
+        fingerprints (:obj:`ScalableBloomFilter`):
+            The fingerprints of the requests seen.
+    """
+
+    def __init__(self, path: Optional[str], capacity: int, error_rate: float, debug: bool = False):
+        super(BloomDupeFilter, self).__init__(None, debug)
+        self.path = path
+        self.fingerprints = ScalableBloomFilter(capacity, error_rate)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        path = None
+        if settings.getbool('DUPEFILTER_PERSIST'):
+            folder = settings.get('DUPEFILTER_DIR') or os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', 'dupefilter')
+            path = os.path.join(folder, '{}.bloom'.format(crawler.spidercls.name))
+        elif job_dir(settings):
+            # Kept with the job's state, as Scrapy's dupefilter does, such that a resumed job does not request the same pages
+            path = os.path.join(job_dir(settings), 'requests.bloom')
+        return cls(path, settings.getint('DUPEFILTER_CAPACITY', 1000000), settings.getfloat('DUPEFILTER_ERROR_RATE', 0.001), settings.getbool('DUPEFILTER_DEBUG'))
+
+    def request_seen(self, request) -> bool:
+        # Looked up and added at once
+        return self.fingerprints.add(self.request_fingerprint(request))
+
+    def open(self):
+        if not self.path or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as file:
+                self.fingerprints.load(file)
+        except (ValueError, struct.error) as error:
+            self.logger.warning('Ignoring the invalid dupefilter {}: {}'.format(self.path, error))
+        else:
+            self.logger.info('Loaded {} request fingerprints from {}'.format(len(self.fingerprints), self.path))
+
+    def close(self, reason: str):
+        if self.path:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Written aside and renamed, such that an interrupted write does not lose the saved filter
+        with open(self.path + '.tmp', 'wb') as file:
+            self.fingerprints.save(file)
+        os.replace(self.path + '.tmp', self.path)
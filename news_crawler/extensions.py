@@ -2,15 +2,26 @@
 
 import os
 import json
+import time
+import zlib
+from fnmatch import fnmatchcase
+from numbers import Number
+from protego import Protego
+from weakref import WeakKeyDictionary
+from twisted.internet import task
 from scrapy import signals
-from scrapy.exceptions import NotConfigured
-from scrapy.utils.project import get_project_settings
-from typing import Dict
+from scrapy.exceptions import NotConfigured, StopDownload
+from scrapy.extensions.closespider import CloseSpider
+from scrapy.http import Headers, Request, Response
+from scrapy.utils.job import job_dir
+from typing import Dict, Optional
+
+from news_crawler.pipelines import get_data_folder
 
 
 class PersistStatsExtension(object):
     """ 
-    Persists spider core stats to json file. 
+    Persists spider core stats to json file, in the directory of each crawled topic. 
 
     Args:
         stats (:obj:`Dict`):
@@ -37,13 +48,381 @@ class PersistStatsExtension(object):
 
     def spider_opened(self, spider):
         # Check if directory exists for the given spider, and create it if it does not
-        settings = get_project_settings()
-        topic = settings.get('TOPIC')
-        folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', topic, spider.name)
-        if not os.path.isdir(folder):
-            os.makedirs(self.folder)
-        self.file = open(os.path.join(folder, 'core_stats.json'), 'w')
+        self.files = list()
+        for topic in spider.topics:
+            folder = get_data_folder(topic.name, spider.name)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            self.files.append(open(os.path.join(folder, 'core_stats.json'), 'w'))
+
+    def spider_closed(self, spider):
+        for file in self.files:
+            json.dump(self.stats.get_stats(), file, sort_keys=True, default=str)
+            file.close()
+
+
+class HeadFirstExtension(object):
+    """
+    Judges the pages of articles on their first bytes while they are streamed, i.e. on the head and the start of the body,
+    where outlets such as spiegel.de give the publication date and the paywall marker. If the page is out of date, 
+    paid, or not an article, the transfer is aborted, such that the rest of the page is neither downloaded nor parsed. 
+    Only spiders declaring `head_first` are judged (see `BaseSpider.judge_head`).
+
+    The bytes downloaded and saved by aborting pages are counted in the crawl stats, as well as the time spent 
+    judging the pages, such that it can be weighed against the saving.
+
+    Args:
+        stats (:obj:`Dict`):
+            The crawler statistics.
+        max_bytes (:obj:`int`):
+            The number of (decompressed) bytes on which a page is judged.
+        downloads (:obj:`WeakKeyDictionary`):
+            The state of each page being streamed and not judged yet, by request.
+    """
+
+    def __init__(self, stats: Dict, max_bytes: int):
+        self.stats = stats
+        self.max_bytes = max_bytes
+        self.downloads = WeakKeyDictionary()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('HEAD_FIRST_ENABLED'):
+            raise NotConfigured
+
+        ext = cls(crawler.stats, crawler.settings.getint('HEAD_FIRST_MAX_BYTES', 65536))
+        crawler.signals.connect(ext.headers_received, signal=signals.headers_received)
+        crawler.signals.connect(ext.bytes_received, signal=signals.bytes_received)
+        return ext
+
+    def headers_received(self, headers: Headers, body_length: int, request: Request, spider):
+        if not getattr(spider, 'head_first', False) or not spider.is_head_first(request):
+            return
+        encoding = headers.get('Content-Encoding', b'').lower()
+        if encoding in (b'gzip', b'x-gzip'):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == b'deflate':
+            decompressor = zlib.decompressobj()
+        elif encoding in (b'', b'identity'):
+            decompressor = None
+        else:
+            # E.g. brotli, which cannot be decompressed in parts here
+            return
+        self.downloads[request] = {
+                'headers': headers,
+                # Not an int if the server does not give the length
+                'expected_size': body_length if isinstance(body_length, int) else -1,
+                'decompressor': decompressor,
+                'chunks': list(),
+                'size': 0,
+                'received': 0,
+                }
+
+    def bytes_received(self, data: bytes, request: Request, spider):
+        download = self.downloads.get(request)
+        if download is None:
+            return
+        download['received'] += len(data)
+        if download['decompressor'] is not None:
+            try:
+                data = download['decompressor'].decompress(data)
+            except zlib.error:
+                del self.downloads[request]
+                return
+        download['chunks'].append(data)
+        download['size'] += len(data)
+        if download['size'] < self.max_bytes:
+            return
+
+        # Judged once, on the first bytes
+        del self.downloads[request]
+        start = time.perf_counter()
+        reason = spider.judge_head(request, download['headers'], b''.join(download['chunks'])[:self.max_bytes])
+        self.stats.inc_value('head_first/judged', spider=spider)
+        self.stats.inc_value('head_first/judge_time_ms', (time.perf_counter() - start) * 1000, spider=spider)
+        if not reason:
+            return
+
+        self.stats.inc_value('head_first/aborted/{}'.format(reason), spider=spider)
+        self.stats.inc_value('head_first/bytes_received', download['received'], spider=spider)
+        if download['expected_size'] > download['received']:
+            self.stats.inc_value('head_first/bytes_saved', download['expected_size'] - download['received'], spider=spider)
+        else:
+            # The saving is not known without the length of the page
+            self.stats.inc_value('head_first/unknown_size', spider=spider)
+        raise StopDownload(fail=False)
+
+
+# Stats which are counters, i.e. restored by adding the counts of a resumed job to those of its previous runs. The other stats 
+# are maxima (e.g. `link_extractor/max_time_ms`), which are kept if they are larger, or gauges (e.g. `throttle/<domain>/delay`, 
+# `recommendations/item_share`), which are restored as saved until they are set again.
+COUNTER_STATS = (
+        # Scrapy's
+        '*_count', '*_count/*', 'downloader/request_bytes', 'downloader/response_bytes', 'scheduler/*', 'dupefilter/*', 'retry/*',
+        'offsite/*', 'httperror/*', 'httpcache/*', 'robotstxt/*', 'urllength/*', 'spider_exceptions/*',
+        # This project's
+        'archive/*', 'dates/*', 'focused_crawl/*', 'head_first/*', 'link_dedup/requests_not_built', 'link_extractor/pages', 
+        'link_extractor/time_ms', 'prefilter/*', 'recommendations/already_scheduled', 'recommendations/invalid', 
+        'recommendations/not_allowed', 'recommendations/scheduled', 'rejected/*', 'sections/*', 'sitemaps/*', 
+        'throttle/*/responses', 'throttle/*/throttled', 'url_dates/*',
+        )
+
+
+def is_counter(key: str) -> bool:
+    """ Whether a stat is a counter (see `COUNTER_STATS`). """
+    return any(fnmatchcase(key, pattern) for pattern in COUNTER_STATS)
+
+
+def get_checkpoint_path(settings) -> Optional[str]:
+    """ The file of the checkpoints of a crawl run as a job (`JOBDIR`), or :obj:`None` if it is not or checkpoints are disabled. """
+    if not settings.getbool('CHECKPOINT_ENABLED') or not job_dir(settings):
+        return None
+    return os.path.join(job_dir(settings), 'checkpoint.json')
+
+
+def load_checkpoint(path: Optional[str]) -> Dict:
+    """ The last checkpoint of a job, or an empty one if the job is new (or its checkpoint cannot be read). """
+    if not path or not os.path.isfile(path):
+        return dict()
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except ValueError:
+        return dict()
+
+
+class CheckpointExtension(object):
+    """
+    Saves the progress of a crawl run as a job (`JOBDIR`) periodically and when the spider closes, i.e. its stats and the
+    time for which it has run, such that a job resumed after a crash continues them rather than starting from 0. The
+    counters of the stats are continued when the job is resumed, maxima are kept if they are larger, and other values 
+    (e.g. delays, shares) are restored as saved (see `COUNTER_STATS`). The item count
+    and timeout of the job are continued by `ResumableCloseSpider`. Pending requests and the requests seen are saved 
+    as they change by `SharedFrontierScheduler`; Scrapy's scheduler and the dupefilter only save them on a clean close.
+
+    Args:
+        stats (:obj:`Dict`):
+            The crawler statistics.
+        path (:obj:`str`):
+            The file of the checkpoints.
+        interval (:obj:`float`):
+            The time between two checkpoints, in seconds.
+        elapsed (:obj:`float`):
+            The time for which the job had run before it was resumed, in seconds.
+        started (:obj:`float`):
+            When the job was (re)started.
+    """
+
+    def __init__(self, stats: Dict, path: str, interval: float):
+        self.stats = stats
+        self.path = path
+        self.interval = interval
+        self.elapsed = 0
+        self.started = time.monotonic()
+        self.task = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        path = get_checkpoint_path(crawler.settings)
+        if path is None:
+            raise NotConfigured
+
+        ext = cls(crawler.stats, path, crawler.settings.getfloat('CHECKPOINT_INTERVAL', 300))
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        checkpoint = load_checkpoint(self.path)
+        self.elapsed = checkpoint.get('elapsed_time_seconds', 0)
+        for key, value in checkpoint.get('stats', dict()).items():
+            if key == 'elapsed_time_seconds' or key.startswith('memusage/'):
+                # Measured for each run
+                continue
+            if is_counter(key):
+                self.stats.inc_value(key, value, spider=spider)
+            elif 'max' in key.split('/')[-1]:
+                self.stats.max_value(key, value, spider=spider)
+            else:
+                self.stats.set_value(key, value, spider=spider)
+        if checkpoint:
+            spider.logger.info('Resuming the job after {:.0f} seconds, with {} items scraped'.format(self.elapsed, 
+                self.stats.get_value('item_scraped_count', 0, spider=spider)))
+        self.started = time.monotonic()
+        if self.interval:
+            self.task = task.LoopingCall(self.save)
+            self.task.start(self.interval, now=False)
+
+    def spider_closed(self, spider):
+        if self.task is not None and self.task.running:
+            self.task.stop()
+        self.save()
+
+    def save(self):
+        checkpoint = {
+                'elapsed_time_seconds': self.elapsed + time.monotonic() - self.started,
+                'stats': {key: value for key, value in self.stats.get_stats().items() if isinstance(value, Number) and not isinstance(value, bool)},
+                }
+        # Written aside and renamed, such that a crash while writing does not lose the last checkpoint
+        with open(self.path + '.tmp', 'w') as file:
+            json.dump(checkpoint, file, sort_keys=True)
+        os.replace(self.path + '.tmp', self.path)
+
+
+class ResumableCloseSpider(CloseSpider):
+    """
+    Closes the spider on the conditions of Scrapy's `CloseSpider` (e.g. `CLOSESPIDER_ITEMCOUNT`, `CLOSESPIDER_TIMEOUT`),
+    counting the items, pages, and time of a job (`JOBDIR`) since it was first started rather than since it was resumed,
+    as saved by `CheckpointExtension`.
+    """
+
+    def __init__(self, crawler):
+        super(ResumableCloseSpider, self).__init__(crawler)
+        checkpoint = load_checkpoint(get_checkpoint_path(crawler.settings))
+        stats = checkpoint.get('stats', dict())
+        self.counter['itemcount'] = stats.get('item_scraped_count', 0)
+        self.counter['pagecount'] = stats.get('response_received_count', 0)
+        if self.close_on.get('timeout'):
+            # Closed at once if the timeout has passed
+            self.close_on['timeout'] = max(self.close_on['timeout'] - checkpoint.get('elapsed_time_seconds', 0), 0)
+        if checkpoint:
+            crawler.signals.connect(self.close_if_reached, signal=signals.spider_opened)
+
+    def close_if_reached(self, spider):
+        from twisted.internet import reactor
+        for condition, reason in (('itemcount', 'closespider_itemcount'), ('pagecount', 'closespider_pagecount')):
+            if self.close_on.get(condition) and self.counter[condition] >= self.close_on[condition]:
+                reactor.callLater(0, self.crawler.engine.close_spider, spider, reason=reason)
+                return
+
+
+class AdaptiveThrottleExtension(object):
+    """
+    Adapts the download delay of each domain of an outlet to its responses, between a floor and a ceiling, rather than
+    applying the same `DOWNLOAD_DELAY` to large outlets and small blogs. The delay never goes below the `Crawl-delay`
+    which the domain's robots.txt gives. It is doubled whenever the server answers 429 (Too Many Requests) or 503
+    (Service Unavailable), or set to its `Retry-After` if longer. After prompt responses, it decreases step by step
+    towards the latency of the responses, such that each domain converges to the fastest rate at which it answers
+    without throttling the crawler or slowing down.
+
+    The delays reached are saved per outlet when the spider closes, and taken as start delays of the domains' slots when 
+    the outlet is crawled again. The delay, the responses, and the throttled responses of each domain are counted in the crawl stats.
+
+    Args:
+        crawler (:obj:`Crawler`):
+            The crawler whose downloader slots are throttled.
+        min_delay (:obj:`float`):
+            The floor of the delays, in seconds.
+        max_delay (:obj:`float`):
+            The ceiling of the delays, in seconds.
+        path (:obj:`str`):
+            The file in which the delays of the outlet are saved.
+        delays (:obj:`Dict[str, float]`):
+            The delay of each domain, as saved by the last crawl or reached by this one.
+        crawl_delays (:obj:`Dict[str, float]`):
+            The `Crawl-delay` given by the robots.txt of each domain.
+    """
+
+    # Statuses with which servers throttle crawlers
+    throttle_statuses = (429, 503)
+
+    # Factor by which the delay decreases after a prompt response
+    decrease = 0.9
+
+    def __init__(self, crawler, min_delay: float, max_delay: float, path: str):
+        self.crawler = crawler
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.path = path
+        self.delays = dict()
+        self.crawl_delays = dict()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool('ADAPTIVE_THROTTLE_ENABLED'):
+            raise NotConfigured
+
+        folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', 'throttle')
+        ext = cls(crawler, settings.getfloat('ADAPTIVE_THROTTLE_MIN_DELAY', 1), settings.getfloat('ADAPTIVE_THROTTLE_MAX_DELAY', 60), 
+                os.path.join(folder, '{}.json'.format(crawler.spidercls.name)))
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(ext.request_reached_downloader, signal=signals.request_reached_downloader)
+        crawler.signals.connect(ext.response_downloaded, signal=signals.response_downloaded)
+        return ext
+
+    def clamp(self, delay: float, domain: str) -> float:
+        return min(max(delay, self.min_delay, self.crawl_delays.get(domain, 0)), self.max_delay)
+
+    def spider_opened(self, spider):
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path) as file:
+                    delays = json.load(file)
+            except ValueError:
+                delays = None
+            if isinstance(delays, dict):
+                self.delays = delays
+            else:
+                spider.logger.warning('Could not read the saved delays {}, starting from the download delay'.format(self.path))
+
+    def request_reached_downloader(self, request: Request, spider):
+        """ Start each new downloader slot with the delay saved for its domain. """
+        domain = request.meta.get('download_slot')
+        slot = self.crawler.engine.downloader.slots.get(domain)
+        # A slot which has not downloaded yet, including one made again after the downloader dropped it for being idle
+        if slot is not None and not slot.lastseen:
+            slot.delay = self.clamp(self.delays.get(domain, slot.delay), domain)
 
     def spider_closed(self, spider):
-        json.dump(self.stats.get_stats(), self.file, sort_keys=True, default=str)
-        self.file.close()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.tmp', 'w') as file:
+            json.dump(self.delays, file, sort_keys=True, indent=1)
+        os.replace(self.path + '.tmp', self.path)
+
+    def get_crawl_delay(self, response: Response, request: Request) -> Optional[float]:
+        """ The `Crawl-delay` for the crawler's user agent in a robots.txt, if any. """
+        try:
+            robots = Protego.parse(response.body.decode('utf-8', errors='ignore'))
+        except Exception:
+            return None
+        user_agent = request.headers.get('User-Agent', b'*').decode('utf-8', errors='ignore')
+        return robots.crawl_delay(user_agent)
+
+    def get_retry_after(self, response: Response) -> float:
+        """ The seconds for which a throttling server asks to wait, or 0 if it does not say (or gives a date). """
+        retry_after = response.headers.get('Retry-After', b'').strip()
+        return float(retry_after) if retry_after.isdigit() else 0
+
+    def response_downloaded(self, response: Response, request: Request, spider):
+        domain = request.meta.get('download_slot')
+        slot = self.crawler.engine.downloader.slots.get(domain)
+        if slot is None:
+            return
+        stats = self.crawler.stats
+
+        if response.url.endswith('/robots.txt'):
+            if response.status == 200:
+                crawl_delay = self.get_crawl_delay(response, request)
+                if crawl_delay:
+                    self.crawl_delays[domain] = crawl_delay
+                    stats.set_value('throttle/{}/crawl_delay'.format(domain), crawl_delay, spider=spider)
+                    slot.delay = self.clamp(slot.delay, domain)
+            return
+
+        delay = self.delays.get(domain, slot.delay)
+        latency = request.meta.get('download_latency')
+        stats.inc_value('throttle/{}/responses'.format(domain), spider=spider)
+        if response.status in self.throttle_statuses:
+            stats.inc_value('throttle/{}/throttled'.format(domain), spider=spider)
+            delay = max(2 * delay, self.get_retry_after(response), self.min_delay)
+        elif latency is not None:
+            if latency > delay:
+                # Slow responses: back off towards their latency
+                delay = (delay + latency) / 2
+            else:
+                delay = max(delay * self.decrease, latency)
+        delay = self.clamp(delay, domain)
+        self.delays[domain] = slot.delay = delay
+        stats.set_value('throttle/{}/delay'.format(domain), round(delay, 3), spider=spider)
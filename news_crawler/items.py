@@ -21,4 +21,6 @@ class NewsCrawlerItem(Item):
     news_keywords = Field()
     recommendations = Field()
     query_keywords = Field()
+    topics = Field() # topic -> query keywords found for the topic
     response_body = Field() # Stores response body to be saved as html
+    article_nums = Field() # topic -> number under which the article is stored
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+# Keyword stem matching for news_crawler project
+
+import re
+from bisect import bisect_right
+from html.entities import codepoint2name
+from itertools import accumulate
+from urllib.parse import unquote, urlsplit
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+
+
+# Spelling of umlauts and ß in URLs (e.g. 'fluechtlinge')
+TRANSLITERATION = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+
+# Words of a URL's path or of an anchor text, separated by punctuation (e.g. '-', '/', '_', '.')
+LINK_TOKEN = re.compile(r'[^\W_]+')
+
+
+class KeywordMatcher(object):
+    """
+    Matches a fixed set of keyword stems against a list of tokens in a single pass.
+
+    The stems are compiled once into a trie-shaped regular expression, which is evaluated at every position
+    of the text. Hence, overlapping stems (e.g. 'immigration' and 'migration') are all found, as they would be
+    by checking each stem against each token.
+
+    Args:
+        stems (:obj:`List[str]`):
+            Keyword stems. Compound keywords (e.g. 'bedingungslos einkommen') contribute each of their words.
+    """
+
+    def __init__(self, stems: List[str]):
+        self.stems = sorted(set(word for stem in stems for word in stem.lower().split()))
+        self.pattern = re.compile('(?=(' + self._build_trie_pattern(self.stems) + '))')
+
+        # The pattern reports the longest stem starting at a position; shorter stems starting there are its prefixes
+        self.prefixes = {stem: [other for other in self.stems if stem.startswith(other)] for stem in self.stems}
+
+        # Patterns for matching the stems in raw response bodies, compiled lazily per encoding
+        self.bytes_patterns = dict()
+
+    @staticmethod
+    def _build_trie_pattern(stems: List[str]) -> str:
+        """
+        Builds a regular expression from a character trie of the stems, such that common prefixes are only matched once.
+
+        Args:
+            stems (:obj:`List[str]`):
+                Keyword stems.
+
+        Returns:
+            :obj:`str`:
+                The regular expression, matching the longest stem at a given position.
+        """
+        trie = dict()
+        for stem in stems:
+            node = trie
+            for char in stem:
+                node = node.setdefault(char, dict())
+            node[''] = True
+
+        def build(node: Dict) -> str:
+            alternatives = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not alternatives:
+                return ''
+            pattern = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+            # Prefer the longer stem, but allow stopping where a shorter stem ends
+            return '(?:' + pattern + ')?' if '' in node else pattern
+
+        return build(trie)
+
+    def match(self, tokens: List[str]) -> Dict[int, Set[str]]:
+        """
+        Finds the keyword stems contained in each token.
+
+        Args:
+            tokens (:obj:`List[str]`):
+                The article's body of text as list of lowercased tokens.
+
+        Returns:
+            :obj:`Dict[int, Set[str]]`:
+                Mapping from the position of each token containing at least one stem to the stems it contains, in document order.
+        """
+        if not self.stems:
+            return dict()
+
+        text = ' '.join(tokens)
+        starts = list(accumulate((len(token) + 1 for token in tokens), initial=0))
+
+        hits = dict()
+        for match in self.pattern.finditer(text):
+            pos = bisect_right(starts, match.start()) - 1
+            hits.setdefault(pos, set()).update(self.prefixes[match.group(1)])
+        return hits
+
+    def count_in_bytes(self, body: bytes, encoding: str, limit: int) -> int:
+        """
+        Counts the occurrences of the stems in a raw response body, case-insensitively, up to a limit.
+
+        Every token of the extracted text which contains a stem has at least one occurrence in the raw body, 
+        unless markup splits the stem itself, so the count is an upper bound for the number of matching tokens.
+
+        Args:
+            body (:obj:`bytes`):
+                The raw response body.
+            encoding (:obj:`str`):
+                The encoding of the response body.
+            limit (:obj:`int`):
+                Number of occurrences after which to stop counting.
+
+        Returns:
+            :obj:`int`:
+                The number of occurrences found, at most `limit`.
+        """
+        if not encoding in self.bytes_patterns:
+            self.bytes_patterns[encoding] = self._build_bytes_pattern(encoding)
+        pattern = self.bytes_patterns[encoding]
+        if pattern is None:
+            # Stems cannot be matched in this encoding, so every occurrence is assumed
+            return limit
+
+        count = 0
+        for _ in pattern.finditer(body):
+            count += 1
+            if count >= limit:
+                break
+        return count
+
+    def _build_bytes_pattern(self, encoding: str) -> Optional[Pattern]:
+        """
+        Builds a case-insensitive pattern matching the stems in a raw response body. Non-ASCII characters 
+        also match their upper case and their HTML character references (e.g. 'ü', 'Ü', '&uuml;', '&#252;').
+
+        Args:
+            encoding (:obj:`str`):
+                The encoding of the response body.
+
+        Returns:
+            :obj:`Pattern`:
+                The compiled pattern, or :obj:`None` if the encoding is not ASCII-compatible.
+        """
+        try:
+            if 'a'.encode(encoding) != b'a':
+                return None
+        except LookupError:
+            return None
+
+        words = list()
+        for stem in self.stems:
+            parts = list()
+            for char in stem:
+                if char.isascii():
+                    parts.append(re.escape(char.encode('ascii')))
+                    continue
+                variants = set()
+                for variant in set([char, char.upper()]):
+                    try:
+                        variants.add(re.escape(variant.encode(encoding)))
+                    except UnicodeEncodeError:
+                        pass
+                    if len(variant) == 1:
+                        variants.add(b'&#%d;' % ord(variant))
+                        variants.add(b'&#x%x;' % ord(variant))
+                        if ord(variant) in codepoint2name:
+                            variants.add(b'&%s;' % codepoint2name[ord(variant)].encode('ascii'))
+                parts.append(b'(?:' + b'|'.join(sorted(variants)) + b')')
+            words.append(b''.join(parts))
+        return re.compile(b'|'.join(words), re.IGNORECASE)
+
+
+class LinkScorer(object):
+    """
+    Scores links by the keywords found in their URL's path and their anchor text, such that pages likely 
+    to be relevant can be requested first. A compound keyword (e.g. 'green deal') only counts where all of its 
+    words follow each other, and words shorter than `min_length` (e.g. 'eu') are left out, since they are 
+    contained in too many unrelated words (e.g. 'deutschland', 'steuer').
+
+    Args:
+        single_keywords (:obj:`Set[str]`):
+            The single-word keyword stems, both as written and as transliterated in URLs.
+        compound_keywords (:obj:`List[List[str]]`):
+            The words of each compound keyword, both as written and as transliterated in URLs.
+        matcher (:obj:`KeywordMatcher`):
+            Matcher compiled from the words of all keywords.
+    """
+
+    def __init__(self, keywords: List[str], min_length: int = 4):
+        self.single_keywords = set()
+        self.compound_keywords = list()
+        for keyword in keywords:
+            for spelling in set([keyword.lower(), keyword.lower().translate(TRANSLITERATION)]):
+                words = [word for word in spelling.split() if len(word) >= min_length]
+                if len(words) == 1:
+                    self.single_keywords.add(words[0])
+                elif words and words not in self.compound_keywords:
+                    self.compound_keywords.append(words)
+        self.matcher = KeywordMatcher(list(self.single_keywords) + [word for words in self.compound_keywords for word in words])
+
+    def score(self, url: str, text: str) -> int:
+        """
+        Args:
+            url (:obj:`str`):
+                The link's URL.
+            text (:obj:`str`):
+                The link's anchor text.
+
+        Returns:
+            :obj:`int`:
+                The number of words of the URL's path and of the anchor text containing a single-word keyword 
+                or starting a compound keyword.
+        """
+        tokens = LINK_TOKEN.findall(unquote(urlsplit(url).path).lower()) + LINK_TOKEN.findall(text.lower())
+        hits = self.matcher.match(tokens)
+        positions = set(pos for pos, stems in hits.items() if stems & self.single_keywords)
+        positions.update(pos for pos in hits for words in self.compound_keywords
+                if all(word in hits.get(pos+i, ()) for i, word in enumerate(words)))
+        return len(positions)
+
+
+class KeywordValidator(object):
+    """
+    Checks whether an article's body of text meets the keyword requirements of a topic.
+
+    Args:
+        keywords (:obj:`List[str]` or :obj:`List[List[str]]`):
+            Query keyword stems. Alternatively, three lists of keyword stems, such that an article is relevant if it contains 
+            stems from the first list, or stems from both the second and the third list.
+        min_frequency (:obj:`int`):
+            Minimum number of keyword stems that should be contained in a relevant article.
+        min_distance (:obj:`int`):
+            Minimum token difference between the first and the last word containing a keyword stem.
+        matcher (:obj:`KeywordMatcher`):
+            Matcher compiled from all keyword stems.
+        query_keywords (:obj:`List[str]`):
+            List of keyword stems found in the last valid article.
+    """
+
+    def __init__(self, keywords: List, min_frequency: int, min_distance: int):
+        self.min_frequency = min_frequency
+        self.min_distance = min_distance
+
+        self.keywords_combinations = keywords if type(keywords[0]) == list else list()
+        if self.keywords_combinations:
+            self.compound_keywords = [keyword for keyword in self.keywords_combinations[0] if len(keyword.split()) > 1]
+            self.single_keywords = set(keyword for keyword in self.keywords_combinations[0] if not keyword in self.compound_keywords)
+            self.combined_first_compound_keywords = [keyword for keyword in self.keywords_combinations[1] if len(keyword.split()) > 1]
+            self.combined_first_single_keywords = set(keyword for keyword in self.keywords_combinations[1] if not keyword in self.combined_first_compound_keywords)
+            self.combined_second_keywords = set(keyword for keyword in self.keywords_combinations[2] if len(keyword.split()) == 1)
+            self.matcher = KeywordMatcher([keyword for keywords in self.keywords_combinations for keyword in keywords])
+        else:
+            # Separate single-token and compound keywords (e.g. bedingungslos* einkommen*)
+            self.compound_keywords = [keyword for keyword in keywords if len(keyword.split()) > 1]
+            self.single_keywords = set(keyword for keyword in keywords if not keyword in self.compound_keywords)
+            self.double_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split()) == 2]
+            self.triple_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split()) == 3]
+            self.matcher = KeywordMatcher(keywords)
+
+        self.query_keywords = list()
+
+    def is_valid(self, tokens: List[str], hits: Dict[int, Set[str]] = None) -> bool:
+        """
+        Check if the keyword stems are found often enough in the tokens, and if the token distance between
+        the first and the last match meets the required minimum threshold. If so, update the list of found query keywords.
+
+        Texts are only rejected early: an accepted text is matched to its end even once both thresholds are met, 
+        since its query keywords list all stems found in it, including those after the first matches meeting the thresholds.
+
+        Args:
+            tokens (:obj:`List[str]`):
+                The article's body of text as list of lowercased tokens.
+            hits (:obj:`Dict[int, Set[str]]`, `optional`):
+                The keyword stems contained in each token, if already matched by a matcher covering all stems of this validator.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if keyword requirements met, :obj:`False` otherwise.
+        """
+        if hits is None:
+            hits = self.matcher.match(tokens)
+
+        # Every match starts at a token containing a stem, so stop early if these cannot meet the requirements
+        if not hits or len(hits) < self.min_frequency:
+            return False
+        hit_positions = list(hits)
+        if hit_positions[-1] - hit_positions[0] < self.min_distance:
+            return False
+
+        if self.keywords_combinations:
+            return self._is_valid_combinations(hits)
+        return self._is_valid_single(hits)
+
+    def _is_valid_single(self, hits: Dict[int, Set[str]]) -> bool:
+        """
+        Check if single or compound keywords meet the validity requirements.
+
+        Args:
+            hits (:obj:`Dict[int, Set[str]]`):
+                The keyword stems contained in each matching token, by position.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if keyword requirements met, :obj:`False` otherwise.
+        """
+        matching_positions = [pos for pos, stems in hits.items() if stems & self.single_keywords]
+        compound_query_keywords = set()
+
+        if self.double_keywords:
+            double_matches = self._match_compound_keywords(hits, self.double_keywords)
+            if double_matches:
+                double_positions = set(pos for (pos, _) in double_matches)
+
+                # Remove matches on the second word of a double keyword
+                matching_positions = [pos for pos in matching_positions if (pos-1) not in double_positions]
+                matching_positions.extend(double_positions)
+                compound_query_keywords.update(keyword for (_, keyword) in double_matches)
+
+        if self.triple_keywords:
+            triple_matches = self._match_compound_keywords(hits, self.triple_keywords)
+            if triple_matches:
+                triple_positions = set(pos for (pos, _) in triple_matches)
+
+                # Remove matches that might result from querying using both 'double keywords' and 'triple keywords'
+                matching_positions = [pos for pos in matching_positions if (pos not in triple_positions) and ((pos+1) not in triple_positions)]
+                matching_positions.extend(triple_positions)
+                compound_query_keywords.update(keyword for (_, keyword) in triple_matches)
+
+        if not self._meets_thresholds(sorted(matching_positions)):
+            return False
+
+        # Update the list of query keyword stems used
+        matching_stems = set().union(*[hits[pos] for pos in matching_positions])
+        self.query_keywords = list((self.single_keywords & matching_stems) | compound_query_keywords)
+        return True
+
+    def _is_valid_combinations(self, hits: Dict[int, Set[str]]) -> bool:
+        """
+        Check if keywords from the first list, or any combination of keywords from the second and third list, meet the validity requirements.
+
+        Args:
+            hits (:obj:`Dict[int, Set[str]]`):
+                The keyword stems contained in each matching token, by position.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if keyword requirements met, :obj:`False` otherwise.
+        """
+        matching_positions = [pos for pos, stems in hits.items() if stems & self.single_keywords]
+        compound_query_keywords = set()
+
+        if self.compound_keywords:
+            compound_matches = self._match_compound_keywords(hits, self.compound_keywords)
+            matching_positions.extend(pos for (pos, _) in compound_matches)
+            compound_query_keywords.update(keyword for (_, keyword) in compound_matches)
+
+        # Check if any combination of keywords is contained in the text
+        matching_comb_positions = [pos for pos, stems in hits.items() if stems & self.combined_first_single_keywords]
+        comb_compound_query_keywords = set()
+
+        if self.combined_first_compound_keywords:
+            comb_compound_matches = self._match_compound_keywords(hits, self.combined_first_compound_keywords)
+            matching_comb_positions.extend(pos for (pos, _) in comb_compound_matches)
+            comb_compound_query_keywords.update(keyword for (_, keyword) in comb_compound_matches)
+
+        # The combination only counts if the second keyword also occurs in the text
+        if matching_comb_positions:
+            matching_second_comb_positions = [pos for pos, stems in hits.items() if stems & self.combined_second_keywords]
+            if matching_second_comb_positions:
+                matching_positions.extend(matching_comb_positions)
+                matching_positions.extend(matching_second_comb_positions)
+
+        matching_positions = sorted(set(matching_positions))
+        if not self._meets_thresholds(matching_positions):
+            return False
+
+        # Update the list of query keyword stems used
+        matching_stems = set().union(*[hits[pos] for pos in matching_positions])
+        query_keywords = (self.single_keywords & matching_stems) | compound_query_keywords
+        if matching_comb_positions:
+            query_keywords |= (self.combined_first_single_keywords | self.combined_second_keywords) & matching_stems
+            query_keywords |= comb_compound_query_keywords
+        self.query_keywords = list(query_keywords)
+        return True
+
+    def _meets_thresholds(self, matching_positions: List[int]) -> bool:
+        """
+        Check the frequency of the matches and the token difference between the first and the last one.
+
+        Args:
+            matching_positions (:obj:`List[int]`):
+                The sorted positions of the matches.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if both thresholds are met, :obj:`False` otherwise.
+        """
+        if not matching_positions or len(matching_positions) < self.min_frequency:
+            return False
+        return matching_positions[-1] - matching_positions[0] >= self.min_distance
+
+    def _match_compound_keywords(self, hits: Dict[int, Set[str]], compound_keywords: List[str]) -> List[Tuple[int, str]]:
+        """
+        Find the tokens starting a compound keyword, i.e. whose following tokens contain the following words of the keyword.
+
+        Args:
+            hits (:obj:`Dict[int, Set[str]]`):
+                The keyword stems contained in each matching token, by position.
+            compound_keywords (:obj:`List[str]`):
+                The compound keywords to look for.
+
+        Returns:
+            :obj:`List[Tuple[int, str]]`:
+                The position and compound keyword of each match.
+        """
+        compound_words = [(keyword, keyword.split()) for keyword in compound_keywords]
+        return [(pos, keyword) for pos in hits for (keyword, words) in compound_words
+                if all(word in hits.get(pos+i, ()) for i, word in enumerate(words))]
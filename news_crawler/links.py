@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Link filtering for news_crawler project
+
+import re
+import copy
+import hashlib
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from scrapy.link import Link
+from scrapy.linkextractors import LinkExtractor
+from scrapy.spiders import Rule
+from typing import Iterable, List, Pattern, Sequence, Tuple
+
+
+def combine_patterns(patterns: List[Pattern]) -> List[Pattern]:
+    """
+    Merge regular expressions into a single alternation, such that a URL is searched once rather than once per expression.
+
+    Args:
+        patterns (:obj:`List[Pattern]`):
+            The compiled expressions of a link extractor's `allow` or `deny` argument.
+
+    Returns:
+        :obj:`List[Pattern]`:
+            The combined expression, or the given expressions if they cannot be combined (e.g. they have different
+            flags, or share the name of a group).
+    """
+    if len(patterns) < 2:
+        return patterns
+    flags = set(pattern.flags for pattern in patterns)
+    if len(flags) > 1:
+        return patterns
+    try:
+        return [re.compile('|'.join('(?:{})'.format(pattern.pattern) for pattern in patterns), flags.pop())]
+    except re.error:
+        return patterns
+
+
+class CompiledLinkExtractor(LinkExtractor):
+    """
+    Link extractor testing each link against a single combined `allow` and a single combined `deny` expression,
+    and caching its verdict by URL (already normalised by the extractor), since pages of an outlet share most of
+    their links (e.g. navigation, recommendations).
+
+    Args:
+        verdicts (:obj:`Dict[str, bool]`):
+            Whether each URL seen so far is allowed.
+    """
+
+    # Maximum number of cached verdicts, after which the cache is cleared
+    max_verdicts = 100000
+
+    @classmethod
+    def from_extractor(cls, extractor: LinkExtractor) -> 'CompiledLinkExtractor':
+        """ Compile a link extractor declared by a spider's rules, keeping all its other arguments. """
+        compiled = cls.__new__(cls)
+        compiled.__dict__.update(extractor.__dict__)
+        compiled.allow_res = combine_patterns(extractor.allow_res)
+        compiled.deny_res = combine_patterns(extractor.deny_res)
+        compiled.verdicts = dict()
+        return compiled
+
+    def _link_allowed(self, link: Link) -> bool:
+        if self.restrict_text:
+            # The verdict depends on the link's text
+            return super(CompiledLinkExtractor, self)._link_allowed(link)
+        verdict = self.verdicts.get(link.url)
+        if verdict is None:
+            if len(self.verdicts) >= self.max_verdicts:
+                self.verdicts.clear()
+            verdict = self.verdicts[link.url] = super(CompiledLinkExtractor, self)._link_allowed(link)
+        return verdict
+
+
+def compile_rules(rules: Sequence[Rule]) -> Tuple[Rule, ...]:
+    """
+    Args:
+        rules (:obj:`Sequence[Rule]`):
+            The rules declared by a spider.
+
+    Returns:
+        :obj:`Tuple[Rule, ...]`:
+            The rules, with their link extractors compiled. Extractors of other classes than Scrapy's `LinkExtractor`
+            (e.g. already compiled, or customised) are kept.
+    """
+    compiled = list()
+    for rule in rules:
+        if type(rule.link_extractor) is LinkExtractor:
+            rule = copy.copy(rule)
+            rule.link_extractor = CompiledLinkExtractor.from_extractor(rule.link_extractor)
+        compiled.append(rule)
+    return tuple(compiled)
+
+
+class LinkSet(object):
+    """
+    Compact set of URLs, each kept as a 64-bit hash rather than as a string. The hashes are kept in a sorted array 
+    (8 bytes each) searched by bisection, except for the recently added ones, which are kept in a set until they are 
+    merged into the array, once they amount to an eighth of it. Hence, a URL takes about 20 bytes, whereas a set takes 
+    about 70 bytes per int (and more per string).
+
+    Args:
+        hashes (:obj:`array`):
+            The sorted hashes of the URLs in the set, except for the recently added ones.
+        recent_hashes (:obj:`Set[int]`):
+            The hashes of the URLs added since the last merge.
+    """
+
+    # Minimum number of recently added hashes merged at once
+    min_merge = 1024
+
+    def __init__(self):
+        self.hashes = array('Q')
+        self.recent_hashes = set()
+
+    @staticmethod
+    def hash(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def _contains(self, value: int) -> bool:
+        if value in self.recent_hashes:
+            return True
+        index = bisect_left(self.hashes, value)
+        return index < len(self.hashes) and self.hashes[index] == value
+
+    def __contains__(self, url: str) -> bool:
+        return self._contains(self.hash(url))
+
+    def __len__(self) -> int:
+        return len(self.hashes) + len(self.recent_hashes)
+
+    def add(self, url: str):
+        value = self.hash(url)
+        if self._contains(value):
+            return
+        self.recent_hashes.add(value)
+        if len(self.recent_hashes) >= max(self.min_merge, len(self.hashes) // 8):
+            # Merged without building a list of all hashes
+            self.hashes = array('Q', merge(self.hashes, sorted(self.recent_hashes)))
+            self.recent_hashes = set()
+
+    def filter(self, links: Iterable[Link]) -> List[Link]:
+        """ The links whose URLs are not in the set. """
+        return [link for link in links if not self._contains(self.hash(link.url))]
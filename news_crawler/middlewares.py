@@ -5,9 +5,18 @@
 # See documentation in:
 # http://doc.scrapy.org/en/latest/topics/spider-middleware.html
 
-from random import choice
+import os
+import json
+from random import Random, choice
+from urllib.parse import urlsplit
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
+from scrapy.http import Request, Response
+from typing import Dict, List
+
+from news_crawler.items import NewsCrawlerItem
+from news_crawler.pipelines import get_data_folder
+from news_crawler.schedulers import request_failed
 
 
 class RotateUserAgentMiddleware(object):
@@ -35,3 +44,126 @@ class RotateUserAgentMiddleware(object):
         if not self.enabled or not self.user_agents:
             return 
         request.headers['user-agent'] = choice(self.user_agents)
+
+
+class FrontierMiddleware(object):
+    """ 
+    Downloader middleware reporting the requests for which a downloader middleware raises (e.g. `IgnoreRequest` for a
+    URL disallowed by robots.txt) to `SharedFrontierScheduler`, which deletes their claimed rows. Such requests may not 
+    reach the downloader, hence would stay claimed and be handed out again to the next process.
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler)
+
+    def process_exception(self, request, exception, spider):
+        self.crawler.signals.send_catch_log(signal=request_failed, request=request, spider=spider)
+
+
+class SectionYieldMiddleware(object):
+    """
+    Learns which sections of an outlet (i.e. the first segments of the URL paths, e.g. `/sport/` or `/politik/`) yield 
+    valid articles, and requests the links into productive sections first. 
+
+    The priority of a link's request is raised by Thompson sampling: the yield of its section (valid articles per 
+    fetched page) is drawn from its Beta posterior, and compared to the outlet's overall yield. Sections fetched 
+    rarely so far have uncertain yields, hence are still explored, whereas sections which never yield articles sink 
+    below the others, such that their pages are only fetched when nothing better is left.
+
+    Yields are learnt per topic, since a section may be productive for one topic only: each fetched page is counted 
+    for every crawled topic, and each article for the topics it is relevant for. A request is raised by its section's 
+    best sampled yield among the topics. The counts of each topic are saved in the directory of the topic when the 
+    spider closes, and taken as the topic's prior when the outlet is crawled again for the topic.
+
+    Args:
+        stats (:obj:`Dict`):
+            The crawler statistics.
+        depth (:obj:`int`):
+            The number of path segments identifying a section.
+        priority (:obj:`int`):
+            The priority added to the requests into a section with the outlet's overall yield.
+        counts (:obj:`Dict[str, Dict[str, List[int]]]`):
+            The pages and articles counted per section in previous crawls and this one, by topic.
+        totals (:obj:`Dict[str, List[int]]`):
+            The pages and articles counted in all sections in previous crawls and this one, by topic.
+        random (:obj:`Random`):
+            Draws the sampled yields.
+    """
+
+    # Name of the file of the counts, in the directory of each topic and outlet
+    file_name = 'section_yields.json'
+
+    def __init__(self, stats: Dict, depth: int, priority: int):
+        self.stats = stats
+        self.depth = depth
+        self.priority = priority
+        self.counts = dict()
+        self.totals = dict()
+        self.random = Random()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('SECTION_YIELD_ENABLED'):
+            raise NotConfigured
+        mw = cls(crawler.stats, crawler.settings.getint('SECTION_YIELD_DEPTH', 1), crawler.settings.getint('SECTION_YIELD_PRIORITY', 10))
+        crawler.signals.connect(mw.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(mw.spider_closed, signal=signals.spider_closed)
+        return mw
+
+    def get_section(self, url: str) -> str:
+        """ The section of a URL, e.g. `/politik/` for `https://www.welt.de/politik/deutschland/article123/x.html`. """
+        segments = [segment for segment in urlsplit(url).path.split('/')[:-1] if segment]
+        return '/' + ''.join(segment + '/' for segment in segments[:self.depth])
+
+    def spider_opened(self, spider):
+        for topic in spider.topics:
+            counts = dict()
+            path = os.path.join(get_data_folder(topic.name, spider.name), self.file_name)
+            if os.path.isfile(path):
+                with open(path) as file:
+                    counts = {section: list(section_counts) for section, section_counts in json.load(file).items()}
+            self.counts[topic.name] = counts
+            self.totals[topic.name] = [sum(pages for pages, _ in counts.values()), sum(items for _, items in counts.values())]
+
+    def spider_closed(self, spider):
+        for topic, counts in self.counts.items():
+            folder = get_data_folder(topic, spider.name)
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, self.file_name), 'w') as file:
+                json.dump(counts, file, sort_keys=True)
+
+    def prioritise(self, request: Request) -> Request:
+        """ Raise the request's priority by the best yield of its section sampled from the topics' posteriors, relative to their overall yields. """
+        section = self.get_section(request.url)
+        shift = 0
+        for topic, counts in self.counts.items():
+            pages, items = counts.get(section, (0, 0))
+            sampled_yield = self.random.betavariate(1 + items, 1 + max(pages - items, 0))
+            overall_yield = (1 + self.totals[topic][1]) / (2 + self.totals[topic][0])
+            shift = max(shift, min(round(self.priority * sampled_yield / overall_yield), 3 * self.priority))
+        return request.replace(priority=request.priority + shift)
+
+    def process_spider_output(self, response: Response, result, spider):
+        topics = list()
+        for element in result:
+            if isinstance(element, Request):
+                element = self.prioritise(element)
+            elif isinstance(element, NewsCrawlerItem):
+                topics.extend(element.get('topics') or ())
+            yield element
+
+        section = self.get_section(response.url)
+        name = section.strip('/') or '(root)'
+        for topic, counts in self.counts.items():
+            items = topics.count(topic)
+            section_counts = counts.setdefault(section, [0, 0])
+            section_counts[0] += 1
+            section_counts[1] += items
+            self.totals[topic][0] += 1
+            self.totals[topic][1] += items
+            self.stats.inc_value('sections/{}/{}/pages'.format(topic, name), spider=spider)
+            self.stats.inc_value('sections/{}/{}/item_scraped_count'.format(topic, name), items, spider=spider)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Extraction of articles in a process pool for news_crawler project
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Type
+
+from scrapy.http import Headers, Response
+from scrapy.settings import BaseSettings, Settings
+from scrapy.statscollectors import StatsCollector
+from twisted.internet.defer import Deferred, DeferredSemaphore
+from twisted.python.failure import Failure
+
+
+# The spider extracting the articles in a worker process
+_worker_spider = None
+
+
+class _WorkerCrawler(object):
+    """
+    Stands in for the crawler of a worker's spider, which only counts stats (returned with each page) and
+    neither starts an engine nor the project's extensions.
+    """
+
+    def __init__(self, settings: BaseSettings):
+        self.settings = settings
+        self.stats = StatsCollector(self)
+
+
+def _init_worker(spider_cls: Type, settings: Dict[str, Any]):
+    """ Create the spider of a worker process, with the settings of the crawler. """
+    global _worker_spider
+    settings = Settings(settings)
+    _worker_spider = spider_cls(settings)
+    _worker_spider.crawler = _WorkerCrawler(settings)
+    _worker_spider.settings = settings
+
+
+def _extract(response_cls: Type[Response], url: str, body: bytes, headers: Dict) -> Dict[str, Any]:
+    """
+    Validate and extract an article in a worker process, with the spider's own extraction code.
+
+    Returns:
+        :obj:`Dict[str, Any]`:
+            The item (without the response body, which the crawler already has) or :obj:`None`, the reason for
+            rejecting the page, the IDs related to dates by the process so far, and the stats counted while 
+            extracting the page.
+    """
+    spider = _worker_spider
+    response = response_cls(url, body=body, headers=Headers(headers))
+    item = spider.extract_item(response)
+    if item:
+        item = dict(item)
+        item.pop('response_body')
+
+    stats = spider.crawler.stats.get_stats()
+    spider.crawler.stats.set_stats(dict())
+    return {
+            'item': item,
+            'rejection': spider.rejection,
+            'url_ids': (spider.url_date_filter.max_id_before, spider.url_date_filter.min_id_after),
+            'stats': stats,
+            }
+
+
+class ExtractionPool(object):
+    """
+    Runs the extraction of articles (i.e. `BaseSpider.extract_item`) in a pool of processes, such that parsing
+    does not block the reactor thread, which keeps downloading meanwhile.
+
+    The number of pages being extracted or waiting for a process is bounded. Pages beyond the bound wait
+    in the reactor, where they still count as responses being processed by the spider, such that Scrapy
+    stops downloading when the pool falls behind.
+
+    Args:
+        spider_cls (:obj:`Type`):
+            The class of the spider, instantiated once in each process.
+        settings (:obj:`BaseSettings`):
+            The settings of the crawler, with which the spiders of the processes are configured.
+        processes (:obj:`Optional[int]`):
+            The number of processes, by default the number of CPUs.
+        max_pending (:obj:`int`):
+            The maximum number of pages submitted to the pool at once.
+    """
+
+    def __init__(self, spider_cls: Type, settings: BaseSettings, processes: Optional[int], max_pending: int):
+        # Processes are started fresh rather than forked from the running reactor
+        self.executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(spider_cls, settings.copy_to_dict())
+                )
+        self.semaphore = DeferredSemaphore(max_pending)
+
+    def extract(self, response: Response) -> Deferred:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+
+        Returns:
+            :obj:`Deferred`:
+                Fires with the result of the extraction (see `_extract`) once a process has handled the page.
+        """
+        return self.semaphore.run(self._submit, response)
+
+    def _submit(self, response: Response) -> Deferred:
+        from twisted.internet import reactor
+
+        future = self.executor.submit(_extract, type(response), response.url, response.body, dict(response.headers))
+        deferred = Deferred()
+
+        def done(future: Future):
+            # Called in a thread of the executor, hence the results are handed to the reactor thread
+            try:
+                result = future.result()
+            except BaseException as error:
+                reactor.callFromThread(deferred.errback, Failure(error))
+            else:
+                reactor.callFromThread(deferred.callback, result)
+
+        future.add_done_callback(done)
+        return deferred
+
+    def close(self):
+        """ Stop the processes once they are done with the submitted pages. """
+        self.executor.shutdown(wait=False, cancel_futures=True)
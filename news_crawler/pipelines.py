@@ -6,48 +6,100 @@
 # See: http://doc.scrapy.org/en/latest/topics/item-pipeline.html
 import os
 import json
-from scrapy.utils.project import get_project_settings
 
 
-class HtmlWriterPipeline(object):
-    """ Creates one directory per spider and stores each scraped page as html. """
+def get_data_folder(topic: str, spider_name: str) -> str:
+    """ Returns the directory in which the data of a spider is stored for the given topic. """
+    return os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', topic, spider_name)
+
+
+def get_last_article_num(folder: str) -> int:
+    """ 
+    Returns the highest number of the articles stored in the data directory of a spider and topic (e.g. 12 for `html/12.html` 
+    or `json/12.json`), or 0 if none is stored, such that a resumed or repeated crawl continues the numbering. 
+    """
+    last_num = 0
+    for subfolder in ('html', 'json'):
+        path = os.path.join(folder, subfolder)
+        if os.path.isdir(path):
+            for name in os.listdir(path):
+                stem = os.path.splitext(name)[0]
+                if stem.isdigit():
+                    last_num = max(last_num, int(stem))
+    return last_num
+
+
+def claim_article_num(folder: str, article_num: int) -> int:
+    """ 
+    Claims the number of an article by creating its (empty) json file, or the next free number if the file exists 
+    (e.g. created by another process crawling the outlet), and returns the number. The html and json files of an 
+    article are then written under the claimed number, such that they keep the same number whichever processes 
+    write into the directory.
+    """
+    while True:
+        try:
+            open(os.path.join(folder, 'json', str(article_num) + '.json'), 'x').close()
+            return article_num
+        except FileExistsError:
+            article_num += 1
+
+
+class ArticleWriterPipeline(object):
+    """ 
+    Base class of the pipelines storing the articles in one directory per topic and spider. The number of an article 
+    is claimed by the first of the pipelines for each topic, and passed on to the next one in the item.
+    """
+
+    # Subdirectory of the data directory in which the pipeline stores the articles
+    subfolder = None
+
     def open_spider(self, spider):
-        # Create directory for the given spider
-        settings = get_project_settings()
-        topic = settings.get('TOPIC')
-        self.folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', topic, spider.name, 'html')
-        if not os.path.isdir(self.folder):
-            os.makedirs(self.folder)
-        
-        # Keep track of how many articles have been parsed
-        self.article_num = 0
+        # Create directory for the given spider, for each topic
+        self.spider_name = spider.name
+        self.folders = dict()
+        for topic in spider.topics:
+            self.folders[topic.name] = os.path.join(get_data_folder(topic.name, spider.name), self.subfolder)
+            os.makedirs(self.folders[topic.name], exist_ok=True)
+            os.makedirs(os.path.join(get_data_folder(topic.name, spider.name), 'json'), exist_ok=True)
+
+        # Keep track of how many articles have been parsed for each topic, including those stored by previous crawls
+        self.article_nums = {topic.name: get_last_article_num(get_data_folder(topic.name, spider.name)) for topic in spider.topics}
+
+    def get_article_num(self, item, topic: str) -> int:
+        """ The number of the item's article for the topic, claimed if no previous pipeline has claimed it. """
+        article_nums = item.get('article_nums') or dict()
+        if topic not in article_nums:
+            self.article_nums[topic] = claim_article_num(get_data_folder(topic, self.spider_name), self.article_nums[topic] + 1)
+            article_nums[topic] = self.article_nums[topic]
+            item['article_nums'] = article_nums
+        return article_nums[topic]
+
+
+class HtmlWriterPipeline(ArticleWriterPipeline):
+    """ Creates one directory per topic and spider and stores each scraped page as html. """
+
+    subfolder = 'html'
 
     def process_item(self, item, spider):
-        """ Save article's body in HTML format and pass item to the next pipeline. """
-        self.article_num += 1
-        file = str(self.article_num) + '.html'
-        with open(os.path.join(self.folder, file), 'wb') as f:
-            f.write(item['response_body'])
+        """ Save article's body in HTML format, for each topic it is relevant for, and pass item to the next pipeline. """
+        for topic in item['topics']:
+            with open(os.path.join(self.folders[topic], '{}.html'.format(self.get_article_num(item, topic))), 'wb') as f:
+                f.write(item['response_body'])
         return item
         
 
-class JsonWriterPipeline(object):
-    """ Creates one directory per spider and writes each item into a new json file. """
-    def open_spider(self, spider):
-        # Create directory for the given spider
-        settings = get_project_settings()
-        topic = settings.get('TOPIC')
-        self.folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', topic, spider.name, 'json')
-        if not os.path.isdir(self.folder):
-            os.makedirs(self.folder)
+class JsonWriterPipeline(ArticleWriterPipeline):
+    """ Creates one directory per topic and spider and writes each item into a new json file. """
 
-        self.article_num = 0
+    subfolder = 'json'
 
     def process_item(self, item, spider):
-        """ Save item in JSON file. """
-        self.article_num += 1
-        file = str(self.article_num) + '.json'
+        """ Save item in JSON file, for each topic it is relevant for, with the query keywords found for that topic. """
         result = dict(item)
         result.pop('response_body')
-        with open(os.path.join(self.folder, file), 'w') as f:
-            json.dump(result, f)
+        result.pop('article_nums', None)
+        topics = result.pop('topics')
+        for topic, query_keywords in topics.items():
+            result['query_keywords'] = query_keywords
+            with open(os.path.join(self.folders[topic], '{}.json'.format(self.get_article_num(item, topic))), 'w') as f:
+                json.dump(result, f)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# Request scheduling for news_crawler project
+
+import os
+import time
+import pickle
+import sqlite3
+from scrapy import signals
+from scrapy.http import Request
+from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.job import job_dir
+from scrapy.utils.request import request_fingerprint, request_from_dict
+from typing import Optional
+
+
+# Requests are pending until a process claims them, and deleted once their response (or error) has arrived
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS requests (id INTEGER PRIMARY KEY, domain TEXT NOT NULL, priority INTEGER NOT NULL, data BLOB NOT NULL,
+    claimed_by INTEGER, claimed_at REAL);
+CREATE TABLE IF NOT EXISTS seen (fingerprint TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS domains (domain TEXT PRIMARY KEY, pending INTEGER NOT NULL DEFAULT 0, next_time REAL NOT NULL DEFAULT 0,
+    last_claim REAL NOT NULL DEFAULT 0) WITHOUT ROWID;
+'''
+
+INDEXES = '''
+DROP INDEX IF EXISTS requests_by_priority;
+CREATE INDEX IF NOT EXISTS pending_requests ON requests (domain, priority DESC, id) WHERE claimed_by IS NULL;
+CREATE INDEX IF NOT EXISTS claimed_requests ON requests (claimed_by) WHERE claimed_by IS NOT NULL;
+'''
+
+# Key of a request's meta under which the frontier keeps the id of its row
+FRONTIER_ID = 'frontier_id'
+
+# Signal sent by `FrontierMiddleware` when a downloader middleware raises for a request, e.g. `IgnoreRequest` for a URL 
+# disallowed by robots.txt, such that the request may not have reached the downloader
+request_failed = object()
+
+
+def is_running(pid: int) -> bool:
+    """ Whether a process with the pid is running. """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SharedFrontierScheduler(object):
+    """
+    Scheduler keeping the pending requests and the fingerprints of the requests seen of an outlet in an SQLite database
+    (in WAL mode), rather than in memory, such that several processes crawling the outlet (e.g. `scrapy crawl welt` run
+    several times) share them: each request is downloaded by one of the processes only, and links found by any process
+    are pending for all of them. Requests are handed out by priority, and for each domain at most once per download
+    delay across all processes, such that the outlet is crawled no faster than by a single process. The delay is the
+    current one of the domain's downloader slot (e.g. as adapted by the adaptive throttle), or `DOWNLOAD_DELAY` until
+    the domain has one.
+
+    A process whose frontier is empty keeps waiting while another process has taken a request recently, since the
+    page may link to further articles; the crawl therefore ends once all processes have been idle for the idle timeout.
+    The database is kept when the crawl ends, such that a crawl which is started again resumes from its frontier. Since
+    each request is saved when it is added, a crawl resumed after a crash does not lose its frontier. A request taken by
+    a process is only claimed (with the process's pid and the time), and deleted once its response or error has arrived,
+    including responses and errors of the downloader middlewares (e.g. a cached page, or a URL disallowed by robots.txt, 
+    which are reported by `FrontierMiddleware`);
+    the requests claimed by processes which are no longer running (e.g. crashed, or killed for exceeding their memory) are
+    released when a process opens the frontier, and those still claimed by a process when its spider closes are released
+    by it, such that no request is lost. A request made again by the downloader middlewares (i.e. a retry or a redirect)
+    takes the place of its claimed row.
+
+    Args:
+        path (:obj:`str`):
+            The file of the database.
+        delay (:obj:`float`):
+            The time between two requests to the same domain, in seconds.
+        idle_timeout (:obj:`float`):
+            The time for which a process waits for other processes to add requests, once the frontier is empty.
+        stats (:obj:`StatsCollector`):
+            The crawler statistics.
+        crawler (:obj:`Optional[Crawler]`):
+            The crawler whose downloader slots give the current delay of each domain.
+        connection (:obj:`Optional[sqlite3.Connection]`):
+            The connection to the database, while the spider is open.
+    """
+
+    def __init__(self, path: str, delay: float, idle_timeout: float, stats, crawler=None):
+        self.path = path
+        self.delay = delay
+        self.idle_timeout = idle_timeout
+        self.stats = stats
+        self.crawler = crawler
+        self.connection = None
+        self.spider = None
+        self.pid = os.getpid()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        # Kept with the state of a job, unless it is shared with other processes
+        folder = settings.get('FRONTIER_DIR') or job_dir(settings) or os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', 'frontier')
+        path = os.path.join(folder, '{}.sqlite'.format(crawler.spidercls.name))
+        delay = getattr(crawler.spidercls, 'download_delay', settings.getfloat('DOWNLOAD_DELAY'))
+        scheduler = cls(path, delay, settings.getfloat('FRONTIER_IDLE_TIMEOUT', 60), crawler.stats, crawler)
+        for signal in (signals.request_left_downloader, signals.response_received, request_failed):
+            crawler.signals.connect(scheduler.request_done, signal=signal)
+        return scheduler
+
+    def open(self, spider):
+        self.spider = spider
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Transactions are begun explicitly, such that requests are taken under the database's write lock
+        self.connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        # Frontiers saved before requests were claimed
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(requests)')]
+        if 'claimed_by' not in columns:
+            self.connection.execute('ALTER TABLE requests ADD COLUMN claimed_by INTEGER')
+            self.connection.execute('ALTER TABLE requests ADD COLUMN claimed_at REAL')
+        self.connection.executescript(INDEXES)
+
+        released = self.release_claims(dead_only=True)
+        if released:
+            spider.logger.info('Released {} requests claimed by processes which are no longer running'.format(released))
+        pending = self.connection.execute('SELECT COALESCE(SUM(pending), 0) FROM domains').fetchone()[0]
+        if pending:
+            spider.logger.info('Sharing the frontier {} ({} requests pending)'.format(self.path, pending))
+
+    def close(self, reason: str):
+        if self.connection is not None:
+            # Requests still downloading are requested again by the next process
+            self.release_claims(dead_only=False)
+            self.connection.close()
+            self.connection = None
+
+    def release_claims(self, dead_only: bool) -> int:
+        """
+        Make claimed requests pending again.
+
+        Args:
+            dead_only (:obj:`bool`):
+                Whether to release the requests claimed by processes which are no longer running (and by a previous 
+                process with the pid of this one), rather than those claimed by this process.
+
+        Returns:
+            :obj:`int`:
+                The number of requests released.
+        """
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            if dead_only:
+                owners = [pid for pid, in connection.execute('SELECT DISTINCT claimed_by FROM requests WHERE claimed_by IS NOT NULL')
+                        if pid == self.pid or not is_running(pid)]
+            else:
+                owners = [self.pid]
+            released = 0
+            for pid in owners:
+                for domain, count in connection.execute('SELECT domain, COUNT(*) FROM requests WHERE claimed_by = ? GROUP BY domain', (pid,)).fetchall():
+                    connection.execute('UPDATE domains SET pending = pending + ? WHERE domain = ?', (count, domain))
+                    released += count
+                connection.execute('UPDATE requests SET claimed_by = NULL, claimed_at = NULL WHERE claimed_by = ?', (pid,))
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        if released:
+            self.stats.inc_value('scheduler/released', released, spider=self.spider)
+        return released
+
+    def get_delay(self, domain: str) -> float:
+        """ The current delay of the domain's downloader slot, or the download delay if it has none yet. """
+        engine = getattr(self.crawler, 'engine', None)
+        slot = engine.downloader.slots.get(domain) if engine is not None else None
+        return slot.delay if slot is not None else self.delay
+
+    def request_done(self, request: Request, spider):
+        """ Delete the claimed row of a request whose response or error has arrived. """
+        request_id = request.meta.get(FRONTIER_ID)
+        if request_id is not None and self.connection is not None:
+            self.connection.execute('DELETE FROM requests WHERE id = ? AND claimed_by = ?', (request_id, self.pid))
+
+    def enqueue_request(self, request: Request) -> bool:
+        """ 
+        Add the request to the frontier, unless it has been seen by any process. A request made again from a claimed 
+        request (i.e. a retry or a redirect) replaces the row of the claimed one.
+        """
+        # The id of a request's row is not saved with it, hence made again requests are not mistaken for their origin
+        replaced_id = request.meta.pop(FRONTIER_ID, None)
+        fingerprint = request_fingerprint(request)
+        data = pickle.dumps(request.to_dict(spider=self.spider), protocol=4)
+        domain = urlparse_cached(request).hostname or ''
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            if replaced_id is not None:
+                connection.execute('DELETE FROM requests WHERE id = ? AND claimed_by = ?', (replaced_id, self.pid))
+            new = connection.execute('INSERT OR IGNORE INTO seen (fingerprint) VALUES (?)', (fingerprint,)).rowcount
+            if not new and not request.dont_filter:
+                connection.execute('COMMIT')
+                self.stats.inc_value('dupefilter/filtered', spider=self.spider)
+                return False
+            connection.execute('INSERT INTO requests (domain, priority, data) VALUES (?, ?, ?)', (domain, request.priority, data))
+            connection.execute('INSERT OR IGNORE INTO domains (domain) VALUES (?)', (domain,))
+            connection.execute('UPDATE domains SET pending = pending + 1 WHERE domain = ?', (domain,))
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self.stats.inc_value('scheduler/enqueued', spider=self.spider)
+        return True
+
+    def next_request(self) -> Optional[Request]:
+        """ Take the pending request with the highest priority among the domains whose delay has passed, if any. """
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            best = None
+            for domain, in connection.execute('SELECT domain FROM domains WHERE pending > 0 AND next_time <= ?', (now,)).fetchall():
+                row = connection.execute('SELECT id, priority, data FROM requests WHERE domain = ? AND claimed_by IS NULL ORDER BY priority DESC, id LIMIT 1',
+                        (domain,)).fetchone()
+                if row and (best is None or (row[1], -row[0]) > (best[1], -best[0])):
+                    best = row + (domain,)
+            if best is None:
+                connection.execute('COMMIT')
+                return None
+            request_id, _, data, domain = best
+            connection.execute('UPDATE requests SET claimed_by = ?, claimed_at = ? WHERE id = ?', (self.pid, now, request_id))
+            connection.execute('UPDATE domains SET pending = pending - 1, next_time = ?, last_claim = ? WHERE domain = ?', (now + self.get_delay(domain), now, domain))
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self.stats.inc_value('scheduler/dequeued', spider=self.spider)
+        request = request_from_dict(pickle.loads(data), spider=self.spider)
+        request.meta[FRONTIER_ID] = request_id
+        return request
+
+    def has_pending_requests(self) -> bool:
+        pending, last_claim = self.connection.execute('SELECT COALESCE(SUM(pending), 0), COALESCE(MAX(last_claim), 0) FROM domains').fetchone()
+        return pending > 0 or time.time() - last_claim < self.idle_timeout
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COALESCE(SUM(pending), 0) FROM domains').fetchone()[0]
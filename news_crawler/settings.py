@@ -13,6 +13,7 @@ BOT_NAME = 'news_crawler'
 
 SPIDER_MODULES = ['news_crawler.spiders']
 NEWSPIDER_MODULE = 'news_crawler.spiders'
+COMMANDS_MODULE = 'news_crawler.commands'
 
 # Run spider until item count or timeout
 CLOSESPIDER_ITEMCOUNT = 200 
@@ -31,6 +32,28 @@ TOPIC = 'refugees_migration'
 #TOPIC = 'legalization_soft_drugs'
 #TOPIC = 'klimawandel'
 
+# Multi-topic crawling: check each fetched page against several topic profiles in one run, and store articles in data/<topic>/<outlet>/.
+# A profile may override START_DATE, END_DATE, ARTICLE_LENGTH, KEYWORDS, KEYWORDS_MIN_FREQUENCY and KEYWORDS_MIN_DISTANCE, 
+# other values are taken from the settings below. If empty, only TOPIC is crawled.
+TOPICS = {}
+#TOPICS = {
+#        'refugees_migration': {
+#            'START_DATE': '01.01.2019', 
+#            'END_DATE': '20.10.2020', 
+#            'KEYWORDS': ['flüchtl', 'geflücht', 'asyl', 'zuwander', 'immigrant', 'immigration', 'migration', 'migrant',  'ausländer', 'einwander', 'refug', 'rapefug', 'invasor']
+#            },
+#        'grundeinkommen': {
+#            'START_DATE': '01.01.2015', 
+#            'END_DATE': '16.12.2020', 
+#            'KEYWORDS': ['grundeinkommen', 'bedingungslos einkommen']
+#            },
+#        'wind_power': {
+#            'START_DATE': '01.01.2015', 
+#            'END_DATE': '31.01.2021', 
+#            'KEYWORDS': ['windkraft', 'windenergie', 'windrad', 'windräder']
+#            },
+#        }
+
 START_DATE = "01.01.2019" # For topics 'refugees and migration', 'klimawandel'
 #START_DATE = "01.01.2015" # For topics 'Grundeinkommen', 'wind power', 'homeopathy', 'legalization_soft_drugs'
 #START_DATE = "01.12.2019" # For topic 'green deal'
@@ -46,6 +69,77 @@ ARTICLE_LENGTH = 150
 KEYWORDS_MIN_FREQUENCY = 2
 KEYWORDS_MIN_DISTANCE = 50
 
+# Reject pages whose raw body contains fewer than KEYWORDS_MIN_FREQUENCY keyword stems before parsing them
+KEYWORDS_PREFILTER_ENABLED = True
+
+# Drop links already followed from other pages before their requests are built, rather than leaving them to the dupefilter. 
+# The URLs followed are kept as 64-bit hashes (about 20 bytes per URL)
+LINK_DEDUP_ENABLED = True
+
+# Keep the fingerprints of requested pages in a compact Bloom filter per outlet instead of a set of strings. The filter is lossy: about 
+# one in 1/DUPEFILTER_ERROR_RATE pages not requested before is taken for a requested one and silently skipped. If DUPEFILTER_PERSIST 
+# is enabled, the filter is saved in DUPEFILTER_DIR (data/dupefilter if not set), such that repeated crawls of an outlet do not request 
+# the pages requested before; use another directory to crawl the same pages again, e.g. for a new topic.
+#DUPEFILTER_CLASS = 'news_crawler.dupefilters.BloomDupeFilter'
+DUPEFILTER_PERSIST = False
+DUPEFILTER_DIR = None
+DUPEFILTER_CAPACITY = 1000000 # Number of fingerprints of the first filter; further filters are added when it is full
+DUPEFILTER_ERROR_RATE = 0.001 # Maximum probability that a page not requested before is taken for a requested one
+
+# Checkpoint crawls run as jobs (with JOBDIR set, e.g. by `scrapy supervise`) every CHECKPOINT_INTERVAL seconds: their stats and the time 
+# for which they have run, such that a job resumed after a crash continues its item count and timeout. With the shared frontier 
+# scheduler below, the pending requests and the requests seen are kept in JOBDIR as they change; otherwise, they are saved on a clean close only.
+CHECKPOINT_ENABLED = True
+CHECKPOINT_INTERVAL = 300
+
+# Share the frontier and the dupefilter of an outlet between several processes crawling it (e.g. `scrapy crawl welt` run several times) 
+# in an SQLite database in FRONTIER_DIR (if not set, the JOBDIR of a job, or data/frontier). Requests to a domain are handed out at most once per delay 
+# of its downloader slot (DOWNLOAD_DELAY, or as adapted with ADAPTIVE_THROTTLE_ENABLED) across all processes; once the frontier is empty, a process waits FRONTIER_IDLE_TIMEOUT seconds for links found by the others.
+#SCHEDULER = 'news_crawler.schedulers.SharedFrontierScheduler'
+FRONTIER_DIR = None
+FRONTIER_IDLE_TIMEOUT = 60
+
+# Request the links whose URL or anchor text contain keywords of the topics first, by raising their priority by 
+# FOCUSED_CRAWL_PRIORITY for each keyword found (up to 3). Compound keywords count where all their words follow each other,
+# and words shorter than 4 characters are left out
+FOCUSED_CRAWL_ENABLED = False
+FOCUSED_CRAWL_PRIORITY = 10
+
+# Request up to RECOMMENDATIONS_FANOUT of the articles recommended by each valid article (e.g. "Mehr zum Thema"), with their priority 
+# raised by RECOMMENDATIONS_PRIORITY such that they are requested before the links found while crawling
+RECOMMENDATIONS_SEEDING_ENABLED = False
+RECOMMENDATIONS_FANOUT = 5
+RECOMMENDATIONS_PRIORITY = 100
+
+# Learn the yield of valid articles per fetched page for each section of an outlet (i.e. the first SECTION_YIELD_DEPTH segments 
+# of the URL paths) and request the links into productive sections first; the yields are learnt per topic, saved in the data directory 
+# of each topic and used as prior by the next crawl of the topic. A section with the outlet's overall yield gets SECTION_YIELD_PRIORITY (at most 3 times as much)
+SECTION_YIELD_ENABLED = False
+SECTION_YIELD_DEPTH = 1
+SECTION_YIELD_PRIORITY = 10
+
+# Drop links to articles whose URL dates them outside START_DATE and END_DATE, and deprioritise links possibly outside
+URL_DATE_FILTER_ENABLED = True
+
+# Extract articles in a pool of processes, such that parsing does not block downloading
+PROCESS_POOL_ENABLED = False
+PROCESS_POOL_SIZE = None # Number of processes; the number of CPUs if not set
+PROCESS_POOL_MAX_PENDING = None # Maximum number of pages submitted to the pool at once; CONCURRENT_REQUESTS if not set
+
+# Judge the articles of spiders declaring `head_first` on their first bytes while they are downloaded, and abort the download 
+# of pages which are out of date, paid, or not articles. The links of aborted pages are not followed.
+HEAD_FIRST_ENABLED = False
+HEAD_FIRST_MAX_BYTES = 65536 # Number of (decompressed) bytes on which a page is judged
+
+# Request the articles listed in the outlets' sitemaps (read from robots.txt, unless a spider declares `sitemap_urls`), leaving out
+# those which are outside START_DATE and END_DATE by their sitemap dates, rather than crawling from the homepage. 
+# Outlets whose sitemaps are missing, fail, or list no article in the range are crawled from their start URLs.
+SITEMAP_CRAWL_ENABLED = False
+
+# Request the articles listed on the outlets' archive pages for each day between START_DATE and END_DATE, for spiders declaring 
+# `archive_url_format`, rather than crawling from the homepage. Listing pages, articles, and items are counted per day (archive/<day>/*).
+ARCHIVE_CRAWL_ENABLED = False
+
 KEYWORDS = ['flüchtl', 'geflücht', 'asyl', 'zuwander', 'immigrant', 'immigration', 'migration', 'migrant',  'ausländer', 'einwander', 'refug', 'rapefug', 'invasor'] # For topic 'refugees and migration'
 #KEYWORDS = ['grundeinkommen', 'bedingungslos einkommen'] # For topic 'Grundeinkommen'
 #KEYWORDS = ['green deal', 'eu green deal', 'eu grüne deal'] # For topic 'green deal'
@@ -73,11 +167,19 @@ ROBOTSTXT_OBEY = True
 # Configure a delay for requests for the same website (default: 0)
 # See http://scrapy.readthedocs.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
+# The delay applies per domain, hence outlets run together by `scrapy crawl_all` are crawled in parallel
 DOWNLOAD_DELAY = 5
 # The download delay setting will honor only one of:
 #CONCURRENT_REQUESTS_PER_DOMAIN = 16
 #CONCURRENT_REQUESTS_PER_IP = 16
 
+# Adapt the delay of each domain to its responses between ADAPTIVE_THROTTLE_MIN_DELAY and ADAPTIVE_THROTTLE_MAX_DELAY (and not below
+# the Crawl-delay of its robots.txt), instead of DOWNLOAD_DELAY: it is doubled when the server answers 429 or 503, and decreases 
+# towards the latency of the responses otherwise. The delays reached are saved in data/throttle/ and used by the next crawl of the outlet.
+ADAPTIVE_THROTTLE_ENABLED = False
+ADAPTIVE_THROTTLE_MIN_DELAY = 1
+ADAPTIVE_THROTTLE_MAX_DELAY = 60
+
 # Disable cookies (enabled by default)
 COOKIES_ENABLED = False
 
@@ -92,14 +194,16 @@ COOKIES_ENABLED = False
 
 # Enable or disable spider middlewares
 # See http://scrapy.readthedocs.org/en/latest/topics/spider-middleware.html
-#SPIDER_MIDDLEWARES = {
-#    'news_crawler.middlewares.MyCustomSpiderMiddleware': 543,
-#}
+SPIDER_MIDDLEWARES = {
+    'news_crawler.middlewares.SectionYieldMiddleware': 543,
+}
 
 # Enable or disable downloader middlewares
 # See http://scrapy.readthedocs.org/en/latest/topics/downloader-middleware.html
 DOWNLOADER_MIDDLEWARES = {
     'news_crawler.middlewares.RotateUserAgentMiddleware': 110,
+    # Its process_exception comes before RetryMiddleware's (550), which ends the chain when it retries a request
+    'news_crawler.middlewares.FrontierMiddleware': 900,
 }
 
 #User agents used for rotation (most common agents)
@@ -118,8 +222,12 @@ USER_AGENT_CHOICES = [
 # See http://scrapy.readthedocs.org/en/latest/topics/extensions.html
 PERSIST_STATS_ENABLED = True
 EXTENSIONS = {
-        'scrapy.extensions.closespider.CloseSpider': 500,
-        'news_crawler.extensions.PersistStatsExtension': 500
+        'scrapy.extensions.closespider.CloseSpider': None,
+        'news_crawler.extensions.ResumableCloseSpider': 500,
+        'news_crawler.extensions.CheckpointExtension': 500,
+        'news_crawler.extensions.AdaptiveThrottleExtension': 500,
+        'news_crawler.extensions.PersistStatsExtension': 500,
+        'news_crawler.extensions.HeadFirstExtension': 500
 }
 
 # Configure item pipelines
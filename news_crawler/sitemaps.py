@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Sitemap parsing for news_crawler project
+
+import struct
+from gzip import GzipFile
+from io import BytesIO
+from lxml import etree
+from scrapy.http import Response, XmlResponse
+from scrapy.utils.gz import gzip_magic_number
+from typing import List, Optional, Tuple
+
+
+# Types of sitemaps, i.e. the tag of their root
+SITEMAP_INDEX = 'sitemapindex'
+URL_SET = 'urlset'
+
+
+class SitemapTooLarge(ValueError):
+    """ Raised when a gzipped sitemap decompresses to more than the maximum size. """
+
+
+def gunzip(data: bytes, max_size: int = 0) -> bytes:
+    """
+    Decompress gzipped data as `scrapy.utils.gz.gunzip` does, i.e. keeping as much data as possible if it is 
+    truncated or fails its checksum, but without decompressing more than the maximum size.
+
+    Args:
+        data (:obj:`bytes`):
+            The gzipped data.
+        max_size (:obj:`int`):
+            The maximum size of the decompressed data, or 0 if it is not limited.
+
+    Returns:
+        :obj:`bytes`:
+            The decompressed data.
+
+    Raises:
+        :obj:`SitemapTooLarge`:
+            If the data decompresses to more than the maximum size.
+    """
+    file = GzipFile(fileobj=BytesIO(data))
+    chunks = list()
+    size = 0
+    while True:
+        try:
+            chunk = file.read1(8196)
+        except (IOError, EOFError, struct.error):
+            # Complete only if some data has been decompressed
+            if chunks:
+                break
+            raise
+        if not chunk:
+            break
+        size += len(chunk)
+        if max_size and size > max_size:
+            raise SitemapTooLarge('Decompressed to more than {} bytes'.format(max_size))
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def get_sitemap_body(response: Response, max_size: int = 0) -> Optional[bytes]:
+    """
+    Args:
+        response (:obj:`Response`):
+            The downloaded sitemap.
+        max_size (:obj:`int`):
+            The maximum size of a gzipped sitemap once decompressed, or 0 if it is not limited (see DOWNLOAD_MAXSIZE).
+
+    Returns:
+        :obj:`Optional[bytes]`:
+            The XML of the sitemap, decompressed if the file is gzipped (e.g. `sitemap.xml.gz`), or :obj:`None`
+            if the response is not a sitemap.
+
+    Raises:
+        :obj:`SitemapTooLarge`:
+            If the gzipped sitemap decompresses to more than the maximum size.
+    """
+    if isinstance(response, XmlResponse):
+        return response.body
+    if gzip_magic_number(response):
+        try:
+            return gunzip(response.body, max_size)
+        except (IOError, EOFError, struct.error):
+            return None
+    if response.url.endswith('.xml'):
+        return response.body
+    return None
+
+
+def iter_sitemap(body: bytes) -> Tuple[Optional[str], List[Tuple[str, Optional[str], Optional[str]]]]:
+    """
+    Parse a sitemap or a sitemap index, including the publication dates of Google News sitemaps.
+
+    Args:
+        body (:obj:`bytes`):
+            The XML of the sitemap.
+
+    Returns:
+        :obj:`Tuple[Optional[str], List[Tuple[str, Optional[str], Optional[str]]]]`:
+            The type of the sitemap (`SITEMAP_INDEX`, `URL_SET`, or :obj:`None` if it cannot be parsed), and for each
+            entry its location, its `lastmod`, and its `news:publication_date`, as given in the sitemap.
+    """
+    parser = etree.XMLParser(recover=True, remove_comments=True, resolve_entities=False)
+    try:
+        root = etree.fromstring(body, parser=parser)
+    except etree.XMLSyntaxError:
+        return None, list()
+    if root is None:
+        return None, list()
+
+    entries = list()
+    for entry in root.iterchildren(tag=etree.Element):
+        values = dict()
+        for node in entry.iter(tag=etree.Element):
+            values.setdefault(etree.QName(node).localname, (node.text or '').strip())
+        if values.get('loc'):
+            entries.append((values['loc'], values.get('lastmod') or None, values.get('publication_date') or None))
+    return etree.QName(root).localname, entries
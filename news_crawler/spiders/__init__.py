@@ -1,93 +1,329 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime
-from itertools import combinations
+import re
+import time
+from lxml import etree
+from urllib.parse import urljoin, urlsplit
+from weakref import WeakKeyDictionary
+from datetime import date, datetime, timedelta
+from scrapy.http import Headers, HtmlResponse, Request, Response
+from scrapy import signals
+from scrapy.exceptions import DontCloseSpider
 from scrapy.spiders import CrawlSpider
-from scrapy.exceptions import NotConfigured
-from scrapy.utils.project import get_project_settings
-from typing import List
+from scrapy.utils.gz import gzip_magic_number
+from scrapy.utils.sitemap import sitemap_urls_from_robots
+from scrapy.utils.url import url_is_from_any_domain
+from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
+from scrapy.settings import BaseSettings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    # Faster parsing of the linked data, if installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from news_crawler.dates import parse_german_date
+from news_crawler.items import NewsCrawlerItem
+from news_crawler.keywords import KeywordMatcher, LinkScorer
+from news_crawler.links import LinkSet, compile_rules
+from news_crawler.offload import ExtractionPool
+from news_crawler.sitemaps import SITEMAP_INDEX, URL_SET, SitemapTooLarge, get_sitemap_body, iter_sitemap
+from news_crawler.topics import load_topics
+from news_crawler.url_dates import UrlDateFilter, OUT_OF_RANGE, UNCERTAIN
+from news_crawler.utils import remove_empty_paragraphs, split_sections
+
+
+# Selectors used by an outlet's schema when it does not declare its own. A selector is either an XPath expression, 
+# or a tuple of keys leading to the value in the page's linked data (e.g. `('@graph', 3, 'datePublished')`)
+SCHEMA_DEFAULTS = {
+        'news_outlet': None, # Name of the outlet in the items, if different from the spider's name
+        'paywall': None, # Selects elements only found on paid articles
+        'creation_date': None,
+        'last_modified': None, # If not given, the creation date is used
+        'date_format': 'iso', # 'iso', 'german', or a format for datetime.strptime
+        'paragraphs': None, # Selects the paragraphs of the article's body
+        'skip_paragraphs': 0, # Number of leading paragraphs which are not part of the body (e.g. the description)
+        'headlines': None, # Selects the headlines of the body's sections
+        'authors': None, # Selects the linked data's authors, both persons and organizations
+        'author_person': None,
+        'author_organization': None,
+        'news_keywords': None,
+        'news_keywords_separator': None, # If given, the keywords are selected as one string
+        'title': '//meta[@property="og:title"]/@content',
+        'title_suffix': None, # Outlet's name appended to the title
+        'description': '//meta[@property="og:description"]/@content',
+        'description_suffix': None,
+        'recommendations': None,
+        'recommendations_prefix': '', # Prepended to relative links
+        'recommendations_absolute': False, # Whether to resolve relative links against the article's URL
+        'recommendations_unique': False, # Whether to drop duplicate links
+        'json_ld': '//script[@type="application/ld+json"]/text()', # Selects the blocks of linked data
+        }
+
+# Keys of the schema whose values are selectors, i.e. XPath expressions compiled once per spider class
+SCHEMA_SELECTORS = (
+        'paywall', 'creation_date', 'last_modified', 'paragraphs', 'headlines', 'authors', 
+        'author_person', 'author_organization', 'news_keywords', 'title', 'description', 'recommendations', 'json_ld'
+        )
+
+# Evaluates the string value (i.e. the whole text) of a selected node
+STRING_VALUE = etree.XPath('string()', smart_strings=False)
+
+# Offset or UTC designator at the end of an ISO 8601 time
+ISO_TIMEZONE = re.compile(r'(Z|[+-]\d{2}(:?\d{2})?)$')
+
+
+def compile_schema(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate an outlet's extraction schema and complete it with the default selectors.
+
+    Args:
+        name (:obj:`str`):
+            The name of the spider declaring the schema.
+        schema (:obj:`Dict[str, Any]`):
+            The selectors and formats declared by the outlet.
+
+    Returns:
+        :obj:`Dict[str, Any]`:
+            The complete schema.
+    """
+    unknown = set(schema) - set(SCHEMA_DEFAULTS)
+    if unknown:
+        raise ValueError('Unknown keys in the schema of spider {}: {}'.format(name, ', '.join(sorted(unknown))))
+
+    compiled = dict(SCHEMA_DEFAULTS, **schema)
+    if not compiled['news_outlet']:
+        compiled['news_outlet'] = name
+    return compiled
+
+
+def compile_xpaths(schema: Dict[str, Any]) -> Dict[str, etree.XPath]:
+    """
+    Compile the XPath expressions of a complete schema, such that invalid expressions fail when the spider is defined.
+
+    Args:
+        schema (:obj:`Dict[str, Any]`):
+            The schema compiled by `compile_schema`.
+
+    Returns:
+        :obj:`Dict[str, etree.XPath]`:
+            The compiled evaluators, by expression.
+    """
+    return {
+            schema[key]: etree.XPath(schema[key], smart_strings=False) 
+            for key in SCHEMA_SELECTORS if isinstance(schema[key], str)
+            }
+
+
+def serialize(value: Any) -> str:
+    """ Convert a value selected by lxml to a string, as done by Scrapy's selectors (i.e. elements as HTML). """
+    if isinstance(value, etree._Element):
+        return etree.tostring(value, method='html', encoding='unicode', with_tail=False)
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    return str(value)
+
+
+def parse_iso_date(date: str) -> datetime:
+    """
+    Parse an ISO 8601 date, dropping fractions of seconds and the timezone, which are not used by the crawler.
+    The time may be separated from the day by `T` or by a space, and a day may be followed by its offset only.
+
+    Args:
+        date (:obj:`str`):
+            The date, e.g. `2021-03-04T10:15:00.000+01:00`, `2021-03-04 10:15:00+01:00` or `2021-03-04T09:15:00Z`.
+
+    Returns:
+        :obj:`datetime`:
+            The naive date as written on the page (i.e. in the outlet's local time), such that it compares with the 
+            naive dates of the topics.
+    """
+    day, separator, time = date[:10], date[10:11], date[11:]
+    time = ISO_TIMEZONE.sub('', time.strip()).strip().split('.')[0] if separator in ('T', ' ') else ''
+    return datetime.fromisoformat(day + 'T' + time if time else day)
 
 
 class BaseSpider(CrawlSpider):
     """
     Base class for all spiders; inherits from CrawlSpider and implements article validation methods.
+    An article is validated against every configured topic profile, and kept if it is relevant for any of them.
+
+    Outlets declare their selectors in the class attribute `schema`, which is compiled once per class, 
+    and `parse_item` runs the same extraction flow for all of them. Outlet-specific steps are overridden 
+    in the spiders (e.g. `get_authors`).
+
+    The XPath expressions are compiled once per class into lxml evaluators, and the values they select 
+    are memoised per response, such that steps sharing a selector do not evaluate it again. Likewise, the `allow` 
+    and `deny` expressions of the rules' link extractors are combined once per class (see `compile_rules`).
 
     Args:
-        start_date (:obj:`str`):
-            The date from which an article is relevant.
-        end_date (:obj:`str`):
-            The date until which an article is relevant.
-        article_length (:obj:`int`):
-            Minimum article length required.
-        keywords (:obj:`List[str]`):
-            Query keyword stems. 
+        settings (:obj:`BaseSettings`):
+            The settings of the crawler, from which the spider is configured.
+        topics (:obj:`List[Topic]`):
+            The topic profiles for which articles are crawled.
+        start_date (:obj:`datetime`):
+            The earliest date from which an article is relevant for any topic.
+        end_date (:obj:`datetime`):
+            The latest date until which an article is relevant for any topic.
+        keyword_matcher (:obj:`KeywordMatcher`):
+            Matcher compiled from the keyword stems of all topics.
         keywords_min_frequency (:obj:`int`):
-            Minimum number of keyword stems that should be contained in a relevant article.
-        keywords_min_distance (:obj:`int`):
-            Minimum token difference between any two words containing a keyword stem.
+            Minimum number of keyword stems that should be contained in an article relevant for any topic.
+        keywords_prefilter_enabled (:obj:`bool`):
+            Whether to reject pages whose raw body contains too few keyword stems before parsing them.
+        link_scorer (:obj:`Optional[LinkScorer]`):
+            Scores the links by the keywords in their URLs and anchor texts, if the relevant links are requested first.
+        focused_crawl_priority (:obj:`int`):
+            Priority added to a link's request for each word of its URL or anchor text containing a keyword stem.
+        recommendations_fanout (:obj:`int`):
+            The number of recommendations of a valid article which are requested, or 0 if they are not.
+        recommendations_priority (:obj:`int`):
+            Priority added to the requests for recommended articles.
+        url_date_filter (:obj:`UrlDateFilter`):
+            Judges from their URLs whether linked articles can be in the date range of any topic.
+        url_date_filter_enabled (:obj:`bool`):
+            Whether to drop the links to articles outside the date range, and to deprioritise the uncertain ones.
+        candidate_topics (:obj:`List[Topic]`):
+            The topics for which the current article has been valid so far.
+        valid_topics (:obj:`Dict[str, List[str]]`):
+            The topics for which the article is relevant, with the list of keyword stems found for each of them.
         query_keywords (:obj:`List[str]`):
             List of keyword stems found in the article.
+        rejection (:obj:`Optional[str]`):
+            The reason for rejecting the current page, if it is not a valid article.
+        process_pool_enabled (:obj:`bool`):
+            Whether to extract the articles in a pool of processes rather than on the reactor thread.
+        process_pool (:obj:`Optional[ExtractionPool]`):
+            The pool of processes, started with the first article.
+        sitemap_crawl_enabled (:obj:`bool`):
+            Whether to request the articles listed in the outlet's sitemaps rather than crawling from the start URLs.
+        sitemap_fallback_started (:obj:`bool`):
+            Whether the crawl from the start URLs has been started, since the outlet's sitemaps are not available.
+        sitemap_articles_found (:obj:`bool`):
+            Whether the outlet's sitemaps have listed any article which is requested.
+        sitemap_max_size (:obj:`int`):
+            The maximum size of a gzipped sitemap once decompressed, as of any download (see DOWNLOAD_MAXSIZE).
+        sitemap_warn_size (:obj:`int`):
+            The size of a gzipped sitemap once decompressed above which a warning is logged (see DOWNLOAD_WARNSIZE).
+        scheduled_links (:obj:`Optional[LinkSet]`):
+            The URLs of the links followed so far, if links already followed are dropped before their requests are built.
+        archive_crawl_enabled (:obj:`bool`):
+            Whether to request the articles listed on the outlet's archive pages for each day in the date range
+            rather than crawling from the start URLs.
     """
 
-    def __init__(self):
-        settings = get_project_settings()
-
-        if not settings.get('START_DATE'):
-            raise NotConfigured
-        self.start_date = settings.get('START_DATE')
-        self.start_date = datetime.strptime(self.start_date, '%d.%m.%Y')
-    
-        if not settings.get('END_DATE'):
-            raise NotConfigured
-        self.end_date = settings.get('END_DATE')
-        self.end_date = datetime.strptime(self.end_date, '%d.%m.%Y')
-        
-        if not settings.get('ARTICLE_LENGTH'):
-            raise NotConfigured
-        self.article_length = settings.get('ARTICLE_LENGTH')
-
-        if not settings.get('KEYWORDS'):
-            raise NotConfigured
-        self.keywords = settings.get('KEYWORDS')
-
-        self.keywords_combinations = self.keywords if type(self.keywords[0])==list else list()
-        
-        if not self.keywords_combinations:
-            # Check if there are compound keywords (e.g. bedingungslos* einkommen*), and if so, separate single-token and multiple-token keywords
-            self.compound_keywords = [keyword for keyword in self.keywords if len(keyword.split())>1]
-            if self.compound_keywords:
-                self.keywords = [keyword for keyword in self.keywords if not keyword in self.compound_keywords]
-        
-        if not settings.get('KEYWORDS_MIN_FREQUENCY'):
-            raise NotConfigured
-        self.keywords_min_frequency = settings.get('KEYWORDS_MIN_FREQUENCY')
-
-        if not settings.get('KEYWORDS_MIN_DISTANCE'):
-            raise NotConfigured
-        self.keywords_min_distance = settings.get('KEYWORDS_MIN_DISTANCE')
+    # Selectors and date format of the outlet's articles (see SCHEMA_DEFAULTS)
+    schema = dict()
+
+    # Compiled XPath evaluators of the class, by expression
+    _xpaths = dict()
 
+    # Maximum number of recommendations kept per article
+    max_recommendations = 5
+
+    # Regular expressions matching the publication date (named groups `year`, `month`, `day`) or an ID increasing 
+    # with the publication date (named group `id`) in the URLs of the outlet's articles, if any
+    url_date_pattern = None
+    url_id_pattern = None
+
+    # Priority of the requests for articles possibly outside the date range
+    uncertain_date_priority = -1
+
+    # Maximum number of words containing a keyword stem counted in a link (see FOCUSED_CRAWL_ENABLED)
+    focused_crawl_max_score = 3
+
+    # Whether the outlet's articles give their publication date and paywall marker within their first bytes, such that 
+    # pages are judged on them while they are downloaded, and aborted if they are not valid (see HEAD_FIRST_ENABLED)
+    head_first = False
+
+    # URLs of the outlet's sitemaps, or of the robots.txt listing them (see SITEMAP_CRAWL_ENABLED); 
+    # by default the robots.txt of the start URLs' sites
+    sitemap_urls = None
+
+    # URL of the outlet's archive page listing the articles of a day, formatted with the day (e.g. 
+    # `https://www.outlet.de/archiv/{day:%Y-%m-%d}/`), and the selector of the link to the next page of a day's 
+    # listing, if it is paginated (see ARCHIVE_CRAWL_ENABLED)
+    archive_url_format = None
+    archive_next_page = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._schema = compile_schema(getattr(cls, 'name', cls.__name__), cls.schema)
+        cls._xpaths = compile_xpaths(cls._schema)
+        cls.rules = compile_rules(cls.rules)
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        # Configured with the crawler's settings, including those given on the command line
+        return super(BaseSpider, cls).from_crawler(crawler, *args, settings=crawler.settings, **kwargs)
+
+    def __init__(self, settings: BaseSettings, *args, **kwargs):
+        self.topics = load_topics(settings)
+        self.start_date = min(topic.start_date for topic in self.topics)
+        self.end_date = max(topic.end_date for topic in self.topics)
+
+        # Compile the keyword stems of all topics once into a single matcher, such that each page is matched in one pass
+        self.keyword_matcher = KeywordMatcher([stem for topic in self.topics for stem in topic.keyword_validator.matcher.stems])
+        self.keywords_min_frequency = min(topic.keywords_min_frequency for topic in self.topics)
+        self.keywords_prefilter_enabled = settings.getbool('KEYWORDS_PREFILTER_ENABLED', True)
+
+        if settings.getbool('FOCUSED_CRAWL_ENABLED', False):
+            # Links are scored by whole keywords, including those of the lists of topics combining keywords
+            self.link_scorer = LinkScorer([keyword for topic in self.topics for keywords in (topic.keywords if type(topic.keywords[0]) == list else [topic.keywords]) for keyword in keywords])
+        else:
+            self.link_scorer = None
+        self.focused_crawl_priority = settings.getint('FOCUSED_CRAWL_PRIORITY', 10)
+        self.recommendations_fanout = settings.getint('RECOMMENDATIONS_FANOUT', 5) if settings.getbool('RECOMMENDATIONS_SEEDING_ENABLED', False) else 0
+        self.recommendations_priority = settings.getint('RECOMMENDATIONS_PRIORITY', 100)
+
+        self.url_date_filter = UrlDateFilter(self.start_date, self.end_date, self.url_date_pattern, self.url_id_pattern)
+        self.url_date_filter_enabled = settings.getbool('URL_DATE_FILTER_ENABLED', True)
+
+        self.process_pool_enabled = settings.getbool('PROCESS_POOL_ENABLED', False)
+        self.process_pool_size = int(settings.get('PROCESS_POOL_SIZE') or 0) or None
+        self.process_pool_max_pending = int(settings.get('PROCESS_POOL_MAX_PENDING') or 0) or settings.getint('CONCURRENT_REQUESTS')
+        self.process_pool = None
+
+        self.sitemap_crawl_enabled = settings.getbool('SITEMAP_CRAWL_ENABLED', False)
+        self.sitemap_fallback_started = False
+        self.sitemap_articles_found = False
+        self.sitemap_max_size = getattr(self, 'download_maxsize', settings.getint('DOWNLOAD_MAXSIZE'))
+        self.sitemap_warn_size = getattr(self, 'download_warnsize', settings.getint('DOWNLOAD_WARNSIZE'))
+        self.archive_crawl_enabled = settings.getbool('ARCHIVE_CRAWL_ENABLED', False)
+        self.scheduled_links = LinkSet() if settings.getbool('LINK_DEDUP_ENABLED', True) else None
+
+        self.candidate_topics = list()
+        self.valid_topics = dict()
         self.query_keywords= list()
+        self.rejection = None
+
+        # Values selected on the pages being parsed, by response and expression
+        self._selections = WeakKeyDictionary()
 
-        super(BaseSpider, self).__init__()
+        super(BaseSpider, self).__init__(*args, **kwargs)
 
 
-    def is_out_of_date(self, date: str) -> bool:
+    def is_out_of_date(self, date: datetime) -> bool:
         """ 
-        Check if the article's date is in the required range.
+        Check if the article's date is in the required range of any topic, and keep those topics as candidates.
 
         Args: 
-            date (:obj:`str`):
+            date (:obj:`datetime`):
                 The publication date of the article.
 
         Returns:
             :obj:`bool`:
-                "onj:`True` if date is inside required range, :obj:`False` otherwise.
+                :obj:`True` if date is outside the required range of all topics, :obj:`False` otherwise.
         """
-        return date < self.start_date or date > self.end_date
+        self.candidate_topics = [topic for topic in self.topics if topic.is_in_date_range(date)]
+        self.valid_topics = dict()
+        return not self.candidate_topics
 
     def has_min_length(self, text):
         """ 
-        Check if the article's length has minimum required length.
+        Check if the article's length has minimum required length for any candidate topic, and keep those topics as candidates.
 
         Args:
             text (:obj:`str`):
@@ -96,11 +332,13 @@ class BaseSpider(CrawlSpider):
             :obj:`bool`: 
                 :obj:`True` if the length meets minimum required length, :obj:`False` otherwise.
         """
-        return len(text.split()) >= self.article_length
+        length = len(text.split())
+        self.candidate_topics = [topic for topic in self.candidate_topics if length >= topic.article_length]
+        return bool(self.candidate_topics)
 
     def has_valid_keywords(self, text: str) -> bool:
         """ 
-        Check if any of the required keywords are found at least twice in the article.
+        Check if the required keywords of any candidate topic are found often enough in the article.
         If true, check if the token distance between them meets the required minimum threshold (i.e. valid article).
         If article if valid, update list of found query keywords.
 
@@ -113,160 +351,36 @@ class BaseSpider(CrawlSpider):
                 :obj:`True` if keyword requirements met, :obj:`False` otherwise.
         """
         tokens = text.lower().split()
-        if not self.keywords_combinations:
-            return self._has_valid_keywords(tokens)
-        else:
-            return self._has_valid_combinations_keywords(tokens)
-        
+        hits = self.keyword_matcher.match(tokens)
 
-    def _has_valid_keywords(self, tokens: List[str]) -> bool:
-        """
-        Check if single or compound keywords appear in the given list of tokens and meet the validity requirements.
+        self.valid_topics = dict()
+        for topic in self.candidate_topics:
+            if topic.keyword_validator.is_valid(tokens, hits):
+                self.valid_topics[topic.name] = topic.keyword_validator.query_keywords
+        if not self.valid_topics:
+            return False
 
-        Args: 
-            tokens (:obj:`List[str]`):
-                The article's body of text as list of tokens.
-        Returns: 
-            "obj:`bool`: 
-                "obj:`True` if keyword requirements met, :obj:`False` otherwise.
-        """
-        # Extract matching positions and tokens
-        matching_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in self.keywords)]
-
-        # Extract matching positions and tokens for compound keyword stems (e.g. bedingungslos* einkommen*)
-        compound_query_keywords = list()
-
-        if self.compound_keywords:
-            double_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split())==2]
-            triple_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split())==3]
-
-            if double_keywords:
-                matching_double_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in double_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
-                if matching_double_pos_tokens:
-                    matching_double_pos = [pos for (pos, _, _) in matching_double_pos_tokens]
-                
-                    # Remove matches that might result from querying using both 'keywords' and 'double keywords'
-                    matching_pos_tokens = [(pos, token) for (pos, token) in matching_pos_tokens if (pos-1) not in matching_double_pos]
-
-                    # Add matches from compound keywords to all matches
-                    matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_double_pos_tokens])))
-
-                    # Update used query compound keywords
-                    compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_double_pos_tokens])))
-
-            
-            if triple_keywords:
-                matching_triple_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in triple_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]) and (keyword.split()[-1] in tokens[tokens.index(token)+2]))]
-            
-                if matching_triple_pos_tokens:
-                    matching_triple_pos = [pos for (pos, _, _) in matching_triple_pos_tokens]
-                
-                    # Remove matches that might result from querying using both 'double keywords' and 'triple keywords'
-                    matching_pos_tokens = [(pos, token) for (pos, token) in matching_pos_tokens if ((pos not in matching_triple_pos) and ((pos+1) not in matching_triple_pos))]
-
-                    # Add matches from compound keywords to all matches
-                    matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_triple_pos_tokens])))
-
-                    # Update used query compound keywords
-                    compound_query_keywords.extend([keyword for (_, _, keyword) in matching_triple_pos_tokens])
-
-        # Check if there are any query keyword stems in the text
-        if matching_pos_tokens:
-            matching_positions, matching_tokens = map(list, zip(*matching_pos_tokens))
-
-            # Check the frequency of query keyword stems in the text
-            if len(matching_positions) >= self.keywords_min_frequency:
-                
-                # Check the token difference between query keyword stems 
-                if any(abs(pos_1-pos_2) >= self.keywords_min_distance for (pos_1, pos_2) in list(combinations(matching_positions, 2))):
-                    
-                    # Update the list of query keyword stems used
-                    self.query_keywords = list(set(filter(lambda x: any(x in token for token in matching_tokens), self.keywords)))
-                    if compound_query_keywords:
-                        self.query_keywords.extend(list(set(compound_query_keywords)))
-                    return True
-        return False
-
-    def _has_valid_combinations_keywords(self, tokens: List[str]) -> bool:
-        """
-        Check if any combination of keywords appears in the list of tokens and whether it meets the requirements.
+        self.query_keywords = sorted(set(keyword for query_keywords in self.valid_topics.values() for keyword in query_keywords))
+        return True
+
+    def has_candidate_keywords(self, response: Response) -> bool:
+        """
+        Check on the raw response body whether the page contains enough keyword stems to possibly be relevant,
+        before any selector is built.
 
         Args:
-            tokens (:obj:`List[str]`):
-                The article's body of text as list of tokens.
-        Returns: 
-            :obj:`bool`: 
-                :obj:`True` if keyword requirements met, :obj:`False` otherwise.
+            response (:obj:`Response`):
+                The downloaded page.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`False` if the page certainly does not meet the keyword requirements, :obj:`True` otherwise.
         """
-        compound_keywords = [keyword for keyword in self.keywords_combinations[0] if len(keyword.split())>1]
-        single_keywords = [keyword for keyword in self.keywords_combinations[0] if not keyword in compound_keywords]
-        combined_first_compound_keywords = [keyword for keyword in self.keywords_combinations[1] if len(keyword.split())>1]
-        combined_first_single_keywords = [keyword for keyword in self.keywords_combinations[1] if not keyword in combined_first_compound_keywords]
-        combined_second_keywords = self.keywords_combinations[2]
-
-        # Extract matching positions and tokens for single keywords
-        matching_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in single_keywords)]
-
-        # Extract matching positions and tokens for compound keyword stems (e.g. soft droge)
-        compound_query_keywords = list()
-        
-        if compound_keywords:
-            matching_compound_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in compound_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
-
-            if matching_compound_pos_tokens:
-                # Add matches from compound keywords to all matches
-                matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_compound_pos_tokens])))
-
-                # Update used query compound keywords
-                compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_compound_pos_tokens])))
-
-        # Check if any combination of keywords if contained in the text
-        flag = True
-        comb_compound_query_keywords = list()
-
-        matching_comb_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in combined_first_single_keywords)]                
-        if combined_first_compound_keywords:
-            matching_comb_compound_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in combined_first_compound_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
-            
-            if matching_comb_compound_pos_tokens:
-                matching_comb_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_comb_compound_pos_tokens])))
-                comb_compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_comb_compound_pos_tokens])))
-
-        # Check if second keyword from the combination also occurs in the text
-        if matching_comb_pos_tokens:
-            matching_second_comb_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in combined_second_keywords)]
-            if matching_second_comb_pos_tokens:
-                matching_comb_pos_tokens.extend(matching_second_comb_pos_tokens)
-            else:
-                flag = False
-
-        if flag:
-            matching_pos_tokens.extend(matching_comb_pos_tokens)
-
-        # Check if there are any query keyword stems in the text
-        if matching_pos_tokens:
-            matching_pos_tokens = list(set(matching_pos_tokens))
-            matching_positions, matching_tokens = map(list, zip(*matching_pos_tokens))
-
-            # Check the frequency of query keyword stems in the text
-            if len(matching_positions) >= self.keywords_min_frequency:
-                
-                # Check the token difference between query keyword stems 
-                if any(abs(pos_1-pos_2) >= self.keywords_min_distance for (pos_1, pos_2) in list(combinations(matching_positions, 2))):
-                    
-                    # Update the list of query keyword stems used
-                    self.query_keywords = list(set(filter(lambda x: any(x in token for token in matching_tokens), single_keywords)))
-                    if compound_query_keywords:
-                        self.query_keywords.extend(list(set(compound_query_keywords)))
-                    if matching_comb_pos_tokens:
-                       self.query_keywords.extend(list(set(filter(lambda x: any(x in token for token in matching_tokens), combined_first_single_keywords))))
-                       self.query_keywords.extend(list(set(filter(lambda x: any(x in token for token in matching_tokens), combined_second_keywords))))
-                       if combined_first_compound_keywords:
-                           self.query_keywords.extend(comb_compound_query_keywords)
-                    self.query_keywords = list(set(self.query_keywords))
-
-                    return True
-        return False
+        encoding = getattr(response, 'encoding', None)
+        if not encoding:
+            return True
+        count = self.keyword_matcher.count_in_bytes(response.body, encoding, self.keywords_min_frequency)
+        return count >= self.keywords_min_frequency
 
     def get_query_keywords(self) -> List:
         """
@@ -278,3 +392,857 @@ class BaseSpider(CrawlSpider):
 
     def parse(self, response):
         pass
+
+    def parse_item(self, response: Response):
+        """
+        Checks article validity. If valid, it parses it.
+        """
+        item = self.extract_item(response)
+        if item:
+            yield item
+
+    def reject(self, reason: str) -> None:
+        """ Keep and count the reason for rejecting the current page, e.g. `out_of_date`. """
+        self.rejection = reason
+        self.crawler.stats.inc_value('rejected/{}'.format(reason), spider=self)
+        return None
+
+    def extract_item(self, response: Response) -> Optional[NewsCrawlerItem]:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+
+        Returns:
+            :obj:`Optional[NewsCrawlerItem]`:
+                The article, with the topics it is relevant for, or :obj:`None` if the page is not a valid article; 
+                the reason is then kept in `rejection`.
+        """
+        self.rejection = None
+        if self.is_excluded(response):
+            return self.reject('excluded')
+
+        # Check date validity
+        creation_date = self.get_creation_date(response)
+        if not creation_date:
+            return self.reject('no_date')
+        self.url_date_filter.learn(response.url, creation_date)
+        if self.is_out_of_date(creation_date):
+            return self.reject('out_of_date')
+
+        # Extract the article's paragraphs
+        paragraphs = self.get_paragraphs(response)
+        text = ' '.join([para for para in paragraphs])
+
+        # Check article's length validity
+        if not self.has_min_length(text):
+            return self.reject('too_short')
+
+        # Check keywords validity
+        if not self.has_valid_keywords(text):
+            return self.reject('keywords')
+
+        # Parse the valid article
+        item = NewsCrawlerItem()
+
+        item['news_outlet'] = self._schema['news_outlet']
+        item['provenance'] = response.url
+        item['query_keywords'] = self.get_query_keywords()
+        item['topics'] = self.valid_topics
+
+        # Get creation, modification, and crawling dates
+        item['creation_date'] = creation_date.strftime('%d.%m.%Y')
+        item['last_modified'] = self.get_last_modified(response, creation_date).strftime('%d.%m.%Y')
+        item['crawl_date'] = datetime.now().strftime('%d.%m.%Y')
+
+        item['author_person'], item['author_organization'] = self.get_authors(response)
+        item['news_keywords'] = self.get_news_keywords(response)
+
+        # Body as dictionary: key = headline (if available, otherwise empty string), values = list of corresponding paragraphs
+        item['content'] = {
+                'title': self.get_title(response), 
+                'description': self.get_description(response), 
+                'body': self.get_body(response, paragraphs)
+                }
+
+        item['recommendations'] = self.get_recommendations(response)[:self.max_recommendations]
+        item['response_body'] = response.body
+
+        return item
+
+    def is_head_first(self, request: Request) -> bool:
+        """ Whether the requested page is judged on its first bytes, i.e. it is requested as an article. """
+        rule = request.meta.get('rule')
+        return self.head_first and rule is not None and self._rules[rule].callback == self.parse_item
+
+    def judge_head(self, request: Request, headers: Headers, head: bytes) -> Optional[str]:
+        """
+        Validate a page on its first bytes, as `extract_item` does on the whole page. A script cut off at the end 
+        (e.g. a block of linked data) is dropped, such that it is not taken for invalid. A page is only rejected for
+        lacking a date if its head is complete, since the date may be given in the rest of the head (e.g. in a long 
+        block of linked data).
+
+        Args:
+            request (:obj:`Request`):
+                The request of the page.
+            headers (:obj:`Headers`):
+                The headers of the response.
+            head (:obj:`bytes`):
+                The first (decompressed) bytes of the page.
+
+        Returns:
+            :obj:`Optional[str]`:
+                The reason for rejecting the page (i.e. `excluded`, `no_date`, or `out_of_date`), or :obj:`None` if 
+                it is possibly a valid article.
+        """
+        lowered = head.lower()
+        head_complete = b'</head' in lowered
+        script = lowered.rfind(b'<script')
+        if script > lowered.rfind(b'</script'):
+            head = head[:script]
+        response = HtmlResponse(request.url, headers=headers, body=head, request=request)
+
+        if self.is_excluded(response):
+            reason = 'excluded'
+        else:
+            creation_date = self.get_creation_date(response)
+            if not creation_date:
+                reason = 'no_date' if head_complete else None
+            else:
+                self.url_date_filter.learn(request.url, creation_date)
+                in_range = any(topic.is_in_date_range(creation_date) for topic in self.topics)
+                reason = None if in_range else 'out_of_date'
+        if reason:
+            self.reject(reason)
+        return reason
+
+    @classmethod
+    def compile_xpath(cls, query: str) -> etree.XPath:
+        """
+        Args:
+            query (:obj:`str`):
+                An XPath expression.
+
+        Returns:
+            :obj:`etree.XPath`:
+                The evaluator of the expression, compiled on its first use by the class.
+        """
+        xpath = cls._xpaths.get(query)
+        if xpath is None:
+            xpath = cls._xpaths[query] = etree.XPath(query, smart_strings=False)
+        return xpath
+
+    def memoise(self, response: Response, key: Tuple[str, str], evaluate: Callable[[], Any]) -> Any:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            key (:obj:`Tuple[str, str]`):
+                The kind of selection and its XPath expression.
+            evaluate (:obj:`Callable[[], Any]`):
+                Computes the selection, if it has not been computed on the page yet.
+
+        Returns:
+            :obj:`Any`:
+                The selection, computed once per page.
+        """
+        selections = self._selections.get(response)
+        if selections is None:
+            selections = self._selections[response] = dict()
+        if key not in selections:
+            selections[key] = evaluate()
+        return selections[key]
+
+    def evaluate(self, response: Response, query: str) -> List[Any]:
+        """
+        Returns:
+            :obj:`List[Any]`:
+                The elements, strings, or the number selected by the expression, as returned by lxml.
+        """
+        def evaluate():
+            result = self.compile_xpath(query)(response.selector.root)
+            return result if isinstance(result, list) else [result]
+        return self.memoise(response, ('evaluate', query), evaluate)
+
+    def select(self, response: Response, query: str) -> List[str]:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            query (:obj:`str`):
+                The XPath expression, selecting text or attribute values.
+
+        Returns:
+            :obj:`List[str]`:
+                The values selected by the expression.
+        """
+        values = self.memoise(response, ('select', query), lambda: [serialize(value) for value in self.evaluate(response, query)])
+        return list(values)
+
+    def select_first(self, response: Response, query: str) -> Optional[str]:
+        """
+        Returns:
+            :obj:`Optional[str]`:
+                The first value selected by the expression, or :obj:`None` if there is none.
+        """
+        values = self.evaluate(response, query)
+        return serialize(values[0]) if values else None
+
+    def select_strings(self, response: Response, query: str) -> List[str]:
+        """
+        Returns:
+            :obj:`List[str]`:
+                The stripped string values (i.e. the whole text) of the nodes selected by the expression.
+        """
+        def evaluate():
+            return [
+                    (STRING_VALUE(node) if isinstance(node, etree._Element) else serialize(node)).strip() 
+                    for node in self.evaluate(response, query)
+                    ]
+        return list(self.memoise(response, ('strings', query), evaluate))
+
+    def parse_date(self, date: str) -> Optional[datetime]:
+        """
+        Parse a date in the outlet's format, which is either `iso`, `german` (i.e. as in `3. März 2021` or 
+        `03.03.2021 um 10:00`), or a format string for `datetime.strptime`. How German dates are parsed is 
+        counted in the crawl stats, such that outlets whose dates fall back to dateparser are noticed.
+
+        Args:
+            date (:obj:`str`):
+                The date as extracted from the page.
+
+        Returns:
+            :obj:`Optional[datetime]`:
+                The parsed date, or :obj:`None` if the page gives no date.
+        """
+        date = date.strip()
+        if not date:
+            return None
+        date_format = self._schema['date_format']
+        if date_format == 'iso':
+            return parse_iso_date(date)
+        if date_format == 'german':
+            parsed_date, parsed_by = parse_german_date(date)
+            self.crawler.stats.inc_value('dates/{}'.format(parsed_by), spider=self)
+            return parsed_date
+        return datetime.strptime(date, date_format)
+
+    def get_json_ld_blocks(self, response: Response) -> List[Any]:
+        """
+        Returns:
+            :obj:`List[Any]`:
+                The page's blocks of linked data (ld+json) selected by the schema, parsed once per page. 
+                Blocks which are not valid JSON are skipped.
+        """
+        def parse():
+            blocks = list()
+            for data_json in self.select(response, self._schema['json_ld']):
+                block = self.load_json(response, data_json)
+                if block is not None:
+                    blocks.append(block)
+            return blocks
+        return self.memoise(response, ('json_ld', self._schema['json_ld']), parse)
+
+    def load_json(self, response: Response, data_json: str) -> Optional[Any]:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            data_json (:obj:`str`):
+                JSON embedded in the page, e.g. a block of linked data or the data attribute of an element.
+
+        Returns:
+            :obj:`Optional[Any]`:
+                The parsed data, or :obj:`None` if it is not valid JSON.
+        """
+        try:
+            return json_loads(data_json)
+        except ValueError:
+            self.logger.debug('Skipping invalid JSON on {}'.format(response.url))
+            return None
+
+    def get_json_ld(self, response: Response) -> Optional[Any]:
+        """
+        Returns:
+            :obj:`Optional[Any]`:
+                The page's first block of linked data, or :obj:`None` if there is none.
+        """
+        blocks = self.get_json_ld_blocks(response)
+        return blocks[0] if blocks else None
+
+    def get_json_ld_entities(self, response: Response) -> List[Any]:
+        """
+        Returns:
+            :obj:`List[Any]`:
+                The blocks of linked data, each followed by its members (i.e. the items of a list, or the entities of `@graph`).
+        """
+        def flatten():
+            entities = list()
+            for block in self.get_json_ld_blocks(response):
+                entities.append(block)
+                members = block.get('@graph') if isinstance(block, dict) else block
+                if isinstance(members, list):
+                    entities.extend(members)
+            return entities
+        return self.memoise(response, ('json_ld_entities', self._schema['json_ld']), flatten)
+
+    def select_value(self, response: Response, selector) -> Optional[Any]:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            selector (:obj:`Union[str, Tuple]`):
+                An XPath expression, or the keys leading to the value in the page's linked data. The keys are followed 
+                from each block and member of the linked data in turn, starting with the first block.
+
+        Returns:
+            :obj:`Optional[Any]`:
+                The first value selected by the selector, or :obj:`None` if there is none.
+        """
+        if not isinstance(selector, tuple):
+            return self.select_first(response, selector)
+        for value in self.get_json_ld_entities(response):
+            try:
+                for key in selector:
+                    value = value[key]
+            except (KeyError, IndexError, TypeError):
+                continue
+            if value is not None:
+                return value
+        return None
+
+    def select_date(self, response: Response, selector) -> Optional[datetime]:
+        """
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            selector (:obj:`Union[str, Tuple]`):
+                An XPath expression, or the keys leading to the date in the page's linked data.
+
+        Returns:
+            :obj:`Optional[datetime]`:
+                The selected date, or :obj:`None` if the page gives none. Dates in the linked data are 
+                always in ISO 8601, whatever the outlet's date format.
+        """
+        date = self.select_value(response, selector)
+        if not isinstance(date, str):
+            return None
+        if isinstance(selector, tuple):
+            date = date.strip()
+            return parse_iso_date(date) if date else None
+        return self.parse_date(date)
+
+    def is_excluded(self, response: Response) -> bool:
+        """
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if the page is not a (free) article, e.g. paid articles, :obj:`False` otherwise.
+        """
+        paywall = self._schema['paywall']
+        return bool(paywall and self.evaluate(response, paywall))
+
+    def get_creation_date(self, response: Response) -> Optional[datetime]:
+        """ The publication date of the article, or :obj:`None` if the page is not an article. """
+        return self.select_date(response, self._schema['creation_date'])
+
+    def get_last_modified(self, response: Response, creation_date: datetime) -> datetime:
+        """ The modification date of the article, or its creation date if the outlet does not publish it. """
+        if self._schema['last_modified']:
+            return self.select_date(response, self._schema['last_modified']) or creation_date
+        return creation_date
+
+    def get_paragraphs(self, response: Response) -> List[str]:
+        """ The stripped, non-empty paragraphs of the article's body. """
+        paragraphs = self.select_strings(response, self._schema['paragraphs'])
+        return remove_empty_paragraphs(paragraphs[self._schema['skip_paragraphs']:])
+
+    def get_authors(self, response: Response) -> Tuple[List[str], List[str]]:
+        """
+        Returns:
+            :obj:`Tuple[List[str], List[str]]`:
+                The names of the persons and of the organizations who authored the article.
+        """
+        if self._schema['authors']:
+            return self.get_json_ld_authors(self.select_value(response, self._schema['authors']))
+        author_person = self._schema['author_person']
+        author_organization = self._schema['author_organization']
+        return (
+                self.select(response, author_person) if author_person else list(), 
+                self.select(response, author_organization) if author_organization else list()
+                )
+
+    def get_json_ld_authors(self, authors: Any) -> Tuple[List[str], List[str]]:
+        """
+        Args:
+            authors (:obj:`Any`):
+                The `author` entry of the linked data, i.e. one author or a list of authors, each given as an entity 
+                or by its name.
+
+        Returns:
+            :obj:`Tuple[List[str], List[str]]`:
+                The stripped names of the persons and of the organizations (including their subtypes, e.g. 
+                `NewsMediaOrganization`) who authored the article. Authors without a type are taken as persons.
+        """
+        author_person, author_organization = list(), list()
+        if not authors:
+            return author_person, author_organization
+        if not isinstance(authors, list):
+            authors = [authors]
+        for author in authors:
+            if isinstance(author, str):
+                name, types = author, ['Person']
+            elif isinstance(author, dict):
+                name, types = author.get('name'), author.get('@type', 'Person')
+                types = types if isinstance(types, list) else [types]
+            else:
+                continue
+            if not isinstance(name, str) or not name.strip():
+                continue
+            if 'Person' in types:
+                author_person.append(name.strip())
+            elif any(isinstance(author_type, str) and author_type.endswith('Organization') for author_type in types):
+                author_organization.append(name.strip())
+        return author_person, author_organization
+
+    def get_news_keywords(self, response: Response) -> List[str]:
+        """ 
+        The keywords of the article, either listed one per node, listed in the linked data, or, 
+        if the schema declares a separator, in a single string (e.g. the keywords meta tag).
+        """
+        selector = self._schema['news_keywords']
+        if not selector:
+            return list()
+        separator = self._schema['news_keywords_separator']
+        if isinstance(selector, tuple):
+            news_keywords = self.select_value(response, selector)
+        elif separator:
+            news_keywords = self.select_first(response, selector)
+        else:
+            return self.select(response, selector)
+        if not news_keywords:
+            return list()
+        if isinstance(news_keywords, str):
+            return news_keywords.split(separator) if separator else [news_keywords]
+        return news_keywords
+
+    def get_title(self, response: Response) -> Optional[str]:
+        """ The article's headline, without the outlet's name. """
+        title = self.select_first(response, self._schema['title'])
+        if title and self._schema['title_suffix']:
+            title = title.split(self._schema['title_suffix'])[0]
+        return title.strip() if title else title
+
+    def get_description(self, response: Response) -> Optional[str]:
+        """ The article's abstract (lead paragraph). """
+        if not self._schema['description']:
+            return ''
+        description = self.select_first(response, self._schema['description'])
+        if description and self._schema['description_suffix']:
+            description = description.split(self._schema['description_suffix'])[0]
+        return description.strip() if description else description
+
+    def get_headlines(self, response: Response) -> List[str]:
+        """ The stripped headlines of the body's sections, in document order. """
+        if not self._schema['headlines']:
+            return list()
+        return self.select_strings(response, self._schema['headlines'])
+
+    def get_sections(self, response: Response) -> List[Tuple[str, bool]]:
+        """
+        The paragraphs and headlines of the article in document order, found by one walk over the document 
+        (a union of both selectors takes quadratic time in libxml2 on long pages). Nodes are recognized as headlines 
+        by identity rather than by text, such that paragraphs with the text of a headline are kept, and paragraphs 
+        which only wrap a headline (e.g. `<p><strong>headline</strong></p>`) are dropped.
+
+        Returns:
+            :obj:`List[Tuple[str, bool]]`:
+                The stripped text of each paragraph and headline, with whether it is a headline.
+        """
+        paragraph_nodes = self.evaluate(response, self._schema['paragraphs'])
+        headline_nodes = self.evaluate(response, self._schema['headlines'])
+        texts = dict(zip(paragraph_nodes, self.select_strings(response, self._schema['paragraphs'])))
+        texts.update(zip(headline_nodes, self.select_strings(response, self._schema['headlines'])))
+        headline_texts = set(self.get_headlines(response))
+        headlines = set(headline_nodes)
+
+        # Selected ancestors of a headline whose text is the headline's
+        wrappers = set()
+        for node in headlines:
+            for ancestor in node.iterancestors():
+                if ancestor not in headlines and texts.get(ancestor) == texts[node]:
+                    wrappers.add(ancestor)
+
+        return [
+                (texts[node], node in headlines and texts[node] in headline_texts) 
+                for node in response.selector.root.iter() if node in texts and node not in wrappers
+                ]
+
+    def get_body(self, response: Response, paragraphs: List[str]) -> Dict[str, List[str]]:
+        """
+        Split the article's paragraphs into sections by its headlines.
+
+        Args:
+            response (:obj:`Response`):
+                The downloaded article.
+            paragraphs (:obj:`List[str]`):
+                The article's paragraphs.
+
+        Returns:
+            :obj:`Dict[str, List[str]]`:
+                The paragraphs by headline; paragraphs before the first headline are stored under the empty string.
+        """
+        if not self.get_headlines(response):
+            # The article has no headlines, just paragraphs
+            return {'': paragraphs}
+        return split_sections(self.get_sections(response))
+
+    def get_recommendations(self, response: Response) -> List[str]:
+        """ Links to other articles suggested by the outlet. """
+        if not self._schema['recommendations']:
+            return list()
+        recommendations = self.select(response, self._schema['recommendations'])
+        if self._schema['recommendations_unique']:
+            recommendations = list(dict.fromkeys(recommendations))
+        if self._schema['recommendations_absolute']:
+            return [response.urljoin(link) for link in recommendations]
+        prefix = self._schema['recommendations_prefix']
+        return [prefix + link for link in recommendations]
+
+    def process_results(self, response: Response, results):
+        """ 
+        Count the parsed articles for each topic they are relevant for, for the archive day listing them, and if they 
+        have been recommended by another article. The recommendations of each article are requested after it.
+        """
+        day = response.meta.get('archive_day')
+        recommended = response.meta.get('recommended')
+        for result in results:
+            if isinstance(result, NewsCrawlerItem):
+                for topic in result['topics']:
+                    self.crawler.stats.inc_value('topics/{}/item_scraped_count'.format(topic), spider=self)
+                if day:
+                    self.crawler.stats.inc_value('archive/{}/item_scraped_count'.format(day), spider=self)
+                if recommended:
+                    self.crawler.stats.inc_value('recommendations/item_scraped_count', spider=self)
+                yield result
+                yield from self.recommendation_requests(response, result['recommendations'])
+            else:
+                yield result
+
+    def recommendation_requests(self, response: Response, recommendations: List[str]):
+        """
+        Request the articles recommended by a valid article (e.g. "Mehr zum Thema"), up to the configured fan-out, 
+        since they are likely to be relevant as well. Their requests get a high priority, such that they are queued 
+        apart from (and ahead of) the links found while crawling. Recommendations already followed are not requested 
+        again, nor are links (resolved against the article) which are not web pages of the outlet's domains, are not 
+        articles, or are outside the date range according to their URLs.
+        """
+        stats = self.crawler.stats
+        allowed_domains = getattr(self, 'allowed_domains', None)
+        for url in recommendations[:self.recommendations_fanout]:
+            url = response.urljoin(url)
+            if urlsplit(url).scheme not in ('http', 'https') or (allowed_domains and not url_is_from_any_domain(url, allowed_domains)):
+                stats.inc_value('recommendations/invalid', spider=self)
+                continue
+            if self.scheduled_links is not None:
+                if url in self.scheduled_links:
+                    stats.inc_value('recommendations/already_scheduled', spider=self)
+                    continue
+                self.scheduled_links.add(url)
+            index = self.get_article_rule(url)
+            if index is None:
+                stats.inc_value('recommendations/not_allowed', spider=self)
+                continue
+            request = Request(url, callback=self._callback, errback=self._errback, priority=self.recommendations_priority, meta={'rule': index, 'recommended': True})
+            request = self.filter_by_url_date(request)
+            if request:
+                stats.inc_value('recommendations/scheduled', spider=self)
+                yield request
+
+    def filter_by_url_date(self, request: Request) -> Optional[Request]:
+        """ 
+        Drop the request for an article which is certainly outside the date range, according to its URL, 
+        and deprioritise it if it possibly is.
+        """
+        verdict = self.url_date_filter.judge(request.url) if self.url_date_filter_enabled else None
+        if verdict == OUT_OF_RANGE:
+            self.crawler.stats.inc_value('url_dates/dropped', spider=self)
+            return None
+        if verdict == UNCERTAIN:
+            self.crawler.stats.inc_value('url_dates/deprioritised', spider=self)
+            return request.replace(priority=request.priority + self.uncertain_date_priority)
+        return request
+
+    def _requests_to_follow(self, response: Response):
+        """ 
+        Build the requests for the page's links as `CrawlSpider` does, but drop the links already followed from 
+        other pages (e.g. navigation and teasers shared by all pages) before their requests are built, rather than 
+        leaving them to the dupefilter. The requests for linked articles are then filtered by the dates in their URLs.
+        The link extraction is timed, and the requests not built are counted per page.
+        """
+        if not isinstance(response, HtmlResponse):
+            return
+        start = time.perf_counter()
+        requests = list()
+        seen = set()
+        dropped = 0
+        for rule_index, rule in enumerate(self._rules):
+            links = [link for link in rule.link_extractor.extract_links(response) if link not in seen]
+            if self.scheduled_links is not None:
+                new_links = self.scheduled_links.filter(links)
+                dropped += len(links) - len(new_links)
+                links = new_links
+            for link in rule.process_links(links):
+                seen.add(link)
+                if self.scheduled_links is not None:
+                    self.scheduled_links.add(link.url)
+                requests.append(rule.process_request(self._build_request(rule_index, link), response))
+        elapsed = (time.perf_counter() - start) * 1000
+
+        stats = self.crawler.stats
+        stats.inc_value('link_extractor/pages', spider=self)
+        stats.inc_value('link_extractor/time_ms', elapsed, spider=self)
+        stats.max_value('link_extractor/max_time_ms', elapsed, spider=self)
+        if self.scheduled_links is not None:
+            stats.inc_value('link_dedup/requests_not_built', dropped, spider=self)
+            stats.max_value('link_dedup/max_requests_not_built_per_page', dropped, spider=self)
+            stats.set_value('link_dedup/scheduled_links', len(self.scheduled_links), spider=self)
+
+        for request in requests:
+            request = self.filter_by_url_date(request) if request else None
+            if request and self.link_scorer is not None:
+                request = self.prioritise_by_keywords(request)
+            if request:
+                yield request
+
+    def prioritise_by_keywords(self, request: Request) -> Request:
+        """ Raise the priority of a link's request by the keyword stems in its URL and anchor text. """
+        score = min(self.link_scorer.score(request.url, request.meta.get('link_text', '')), self.focused_crawl_max_score)
+        self.crawler.stats.inc_value('focused_crawl/scored', spider=self)
+        if not score:
+            return request
+        self.crawler.stats.inc_value('focused_crawl/prioritised', spider=self)
+        return request.replace(priority=request.priority + score * self.focused_crawl_priority)
+
+    def _set_crawler(self, crawler):
+        super(BaseSpider, self)._set_crawler(crawler)
+        if self.sitemap_crawl_enabled:
+            crawler.signals.connect(self.sitemaps_exhausted, signal=signals.spider_idle)
+
+    def start_requests(self):
+        """ Start from the outlet's archive pages or sitemaps, if enabled, or from the start URLs. """
+        if self.archive_crawl_enabled and self.archive_url_format:
+            yield from self.archive_requests()
+            return
+        if not self.sitemap_crawl_enabled:
+            yield from super(BaseSpider, self).start_requests()
+            return
+        for url in self.sitemap_urls or [urljoin(url, '/robots.txt') for url in self.start_urls]:
+            if url.endswith('/robots.txt'):
+                yield Request(url, callback=self.parse_robots, errback=self.fall_back_to_rules)
+            else:
+                yield Request(url, callback=self.parse_sitemap)
+
+    def get_archive_urls(self, day: date) -> List[str]:
+        """
+        Args:
+            day (:obj:`date`):
+                A day in the date range.
+
+        Returns:
+            :obj:`List[str]`:
+                The URLs of the outlet's archive pages listing the articles of the day; overridden by outlets 
+                with several listings per day (e.g. one per section).
+        """
+        return [self.archive_url_format.format(day=day)] if self.archive_url_format else list()
+
+    def archive_requests(self):
+        """ 
+        Request the archive pages of every day in the date range at once, such that the days are crawled in parallel. 
+        The day of each page is kept in the request, such that the pages and articles are counted per day.
+        """
+        day = self.start_date.date()
+        while day <= self.end_date.date():
+            for url in self.get_archive_urls(day):
+                yield Request(url, callback=self.parse_archive, meta={'archive_day': day.isoformat()})
+            day += timedelta(days=1)
+
+    def parse_archive(self, response: Response):
+        """ 
+        Request the articles listed on an archive page, and the next page of the day's listing. The links of 
+        the articles are not followed, since the archive lists the articles.
+        """
+        day = response.meta['archive_day']
+        self.crawler.stats.inc_value('archive/{}/listing_pages'.format(day), spider=self)
+        for request in self._requests_to_follow(response):
+            if self._rules[request.meta['rule']].callback != self.parse_item:
+                continue
+            request.meta.update(listed=True, archive_day=day)
+            self.crawler.stats.inc_value('archive/{}/articles'.format(day), spider=self)
+            yield request
+
+        next_page = self.select_first(response, self.archive_next_page) if self.archive_next_page else None
+        if next_page:
+            yield Request(response.urljoin(next_page), callback=self.parse_archive, meta={'archive_day': day})
+
+    def fall_back_to_rules(self, failure: Optional[Failure] = None):
+        """ Crawl from the start URLs by the rules, once, if the outlet's sitemaps are not available. """
+        if self.sitemap_fallback_started:
+            return
+        self.sitemap_fallback_started = True
+        self.crawler.stats.inc_value('sitemaps/fallback', spider=self)
+        self.logger.info('No articles found in the sitemaps, crawling from the start URLs')
+        yield from super(BaseSpider, self).start_requests()
+
+    def sitemaps_exhausted(self, spider):
+        """ 
+        Crawl from the start URLs by the rules once the crawl of the sitemaps ends without any article, i.e. if robots.txt 
+        and the sitemaps failed, were invalid, or listed no article in the date range.
+        """
+        if self.sitemap_fallback_started or self.sitemap_articles_found or self.archive_crawl_enabled and self.archive_url_format:
+            return
+        for request in self.fall_back_to_rules():
+            self.crawler.engine.crawl(request)
+        raise DontCloseSpider
+
+    def parse_robots(self, response: Response):
+        """ Request the sitemaps listed in robots.txt. """
+        sitemap_urls = list(sitemap_urls_from_robots(response.text, base_url=response.url))
+        if not sitemap_urls:
+            yield from self.fall_back_to_rules()
+        for url in sitemap_urls:
+            yield Request(url, callback=self.parse_sitemap)
+
+    def parse_sitemap(self, response: Response):
+        """
+        Request the sitemaps listed in a sitemap index, and the articles listed in a sitemap, leaving out those 
+        which are certainly outside the date range according to their publication date, or their last modification 
+        (an article modified before the range was also published before it).
+        """
+        try:
+            body = get_sitemap_body(response, self.sitemap_max_size)
+        except SitemapTooLarge:
+            self.crawler.stats.inc_value('sitemaps/too_large', spider=self)
+            self.logger.warning('Skipping sitemap {} larger than {} bytes once decompressed'.format(response.url, self.sitemap_max_size))
+            return
+        # Larger plain sitemaps have already been warned about by the downloader
+        if body and gzip_magic_number(response) and self.sitemap_warn_size and len(body) > self.sitemap_warn_size:
+            self.logger.warning('Sitemap {} is larger than {} bytes once decompressed'.format(response.url, self.sitemap_warn_size))
+        sitemap_type, entries = iter_sitemap(body) if body else (None, list())
+        if sitemap_type not in (SITEMAP_INDEX, URL_SET):
+            self.crawler.stats.inc_value('sitemaps/invalid', spider=self)
+            self.logger.debug('Skipping invalid sitemap {}'.format(response.url))
+            return
+        self.crawler.stats.inc_value('sitemaps/parsed', spider=self)
+
+        for url, lastmod, publication_date in entries:
+            last_modified = self.parse_sitemap_date(lastmod)
+            if last_modified and last_modified < self.start_date:
+                self.crawler.stats.inc_value('sitemaps/out_of_date', spider=self)
+                continue
+            if sitemap_type == SITEMAP_INDEX:
+                yield Request(url, callback=self.parse_sitemap)
+                continue
+
+            creation_date = self.parse_sitemap_date(publication_date)
+            if creation_date and not any(topic.is_in_date_range(creation_date) for topic in self.topics):
+                self.crawler.stats.inc_value('sitemaps/out_of_date', spider=self)
+                continue
+            request = self.build_sitemap_request(url)
+            if request:
+                self.sitemap_articles_found = True
+                self.crawler.stats.inc_value('sitemaps/articles', spider=self)
+                yield request
+
+    def parse_sitemap_date(self, date: Optional[str]) -> Optional[datetime]:
+        """ Parse a date of a sitemap (i.e. in ISO 8601), or return :obj:`None` if it is missing or incomplete. """
+        if not date:
+            return None
+        try:
+            return parse_iso_date(date)
+        except ValueError:
+            return None
+
+    def get_article_rule(self, url: str) -> Optional[int]:
+        """ The index of the first rule extracting articles whose links allow the URL, or :obj:`None` if no rule does. """
+        for index, rule in enumerate(self._rules):
+            if rule.callback == self.parse_item and rule.link_extractor.matches(url):
+                return index
+        return None
+
+    def build_sitemap_request(self, url: str) -> Optional[Request]:
+        """
+        Args:
+            url (:obj:`str`):
+                The URL of an article listed in a sitemap.
+
+        Returns:
+            :obj:`Optional[Request]`:
+                The request for the article, handled by the first rule extracting articles whose links 
+                allow the URL, or :obj:`None` if no rule allows it or its URL dates it outside the range. 
+                The links of the article are not followed, since the sitemaps list the articles.
+        """
+        index = self.get_article_rule(url)
+        if index is None:
+            self.crawler.stats.inc_value('sitemaps/not_allowed', spider=self)
+            return None
+        request = Request(url, callback=self._callback, errback=self._errback, meta={'rule': index, 'listed': True})
+        return self.filter_by_url_date(request)
+
+    def extract_in_pool(self, response: Response, follow: bool) -> Deferred:
+        """
+        Extract the article in the process pool, then follow the page's links as `_parse_response` does.
+
+        Args:
+            response (:obj:`Response`):
+                The downloaded page.
+            follow (:obj:`bool`):
+                Whether to follow the page's links.
+
+        Returns:
+            :obj:`Deferred`:
+                Fires with the article, if valid, and the requests for the page's links.
+        """
+        if self.process_pool is None:
+            self.process_pool = ExtractionPool(type(self), self.settings, self.process_pool_size, self.process_pool_max_pending)
+
+        def collect(result):
+            for key, value in result['stats'].items():
+                self.crawler.stats.inc_value(key, value, spider=self)
+            self.url_date_filter.merge(*result['url_ids'])
+            items = [NewsCrawlerItem(result['item'], response_body=response.body)] if result['item'] else list()
+            return list(self._parse_response(response, lambda response: items, dict(), follow))
+
+        return self.process_pool.extract(response).addCallback(collect)
+
+    def closed(self, reason: str):
+        stats = self.crawler.stats
+        recommended = stats.get_value('recommendations/item_scraped_count', 0, spider=self)
+        if recommended:
+            # Share of the items of the crawl found through the recommendations of other items
+            stats.set_value('recommendations/item_share', round(recommended / stats.get_value('item_scraped_count', recommended, spider=self), 4), spider=self)
+        if self.process_pool is not None:
+            self.process_pool.close()
+
+    def _callback(self, response: Response, **cb_kwargs):
+        """ 
+        Apply the keyword pre-filter before the rule's callback, such that irrelevant pages are not parsed. 
+        Links of rejected pages are still followed, but not on pages whose download has been aborted (which are 
+        only partly downloaded and already counted as rejected), nor on articles listed in the sitemaps or archive pages.
+        """
+        rule = self._rules[response.meta['rule']]
+        if 'archive_day' in response.meta:
+            self.crawler.stats.inc_value('archive/{}/article_pages'.format(response.meta['archive_day']), spider=self)
+        if 'download_stopped' in response.flags:
+            self.crawler.stats.inc_value('head_first/pages_not_parsed', spider=self)
+            return self._parse_response(response, None, dict(), False)
+        callback = rule.callback
+        if callback and self.keywords_prefilter_enabled:
+            if self.has_candidate_keywords(response):
+                self.crawler.stats.inc_value('prefilter/passed', spider=self)
+            else:
+                self.crawler.stats.inc_value('prefilter/rejected', spider=self)
+                callback = None
+        follow = rule.follow and not response.meta.get('listed')
+        if callback and self.process_pool_enabled and callback == self.parse_item:
+            return self.extract_in_pool(response, follow)
+        return self._parse_response(response, callback, {**rule.cb_kwargs, **cb_kwargs}, follow)
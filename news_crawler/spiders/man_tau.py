@@ -1,120 +1,46 @@
-# -*- coding: utf-8 -*-
-
-import os
-import sys
-from news_crawler.spiders import BaseSpider
-from scrapy.spiders import Rule
-from scrapy.linkextractors import LinkExtractor
-from datetime import datetime
-
-sys.path.insert(0, os.path.join(os.getcwd(), "..",))
-from news_crawler.items import NewsCrawlerItem
-from news_crawler.utils import remove_empty_paragraphs
-
-
-class ManTau(BaseSpider):
-    """Spider for ManTau"""
-    name = 'man_tau'
-    rotate_user_agent = True
-    allowed_domains = ['man-tau.com']
-    start_urls = ['https://man-tau.com/']
-
-    # Exclude pages without relevant articles
-    rules = (
-            Rule(
-                LinkExtractor(
-                    allow=(r'man\-tau\.com\/\d+\/\d+\/\d+\/\w.*'),
-                    deny=(r'man\-tau\.com\/\d+\/\d+\/\d+\/\w.*\/\?replytocom\=\d+$'
-                        r'man\-tau\.com\/infos\/',
-                        r'man\-tau\.com\/mitmachen\/',
-                        r'man\-tau\.com\/banner\-und\-e\-mail\-signaturen\/'
-                        )
-                    ),
-                callback='parse_item',
-                follow=True
-                ),
-            )
-
-    def parse_item(self, response):
-        """
-        Checks article validity. If valid, it parses it.
-        """
-        
-        # Check date validity
-        creation_date = response.xpath('//meta[@property="article:published_time"]/@content').get()
-        if not creation_date:
-            return
-        creation_date = datetime.fromisoformat(creation_date.split('+')[0])
-        if self.is_out_of_date(creation_date):
-            return
-
-        # Extract the article's paragraphs
-        paragraphs = [node.xpath('string()').get().strip() for node in response.xpath('//div[@class="entry-content"]/p[@style="text-align: justify;"] | //div[@class="entry-content"]/blockquote/p[@style="text-align: justify;"]')]
-        paragraphs = remove_empty_paragraphs(paragraphs)
-        text = ' '.join([para for para in paragraphs])
-
-        # Check article's length validity
-        if not self.has_min_length(text):
-            return
-
-        # Check keywords validity
-        if not self.has_valid_keywords(text):
-            return
-
-        # Parse the valid article
-        item = NewsCrawlerItem()
-
-        item['news_outlet'] = 'man tau'
-        item['provenance'] = response.url
-        item['query_keywords'] = self.get_query_keywords()
-
-        # Get creation, modification, and crawling dates
-        item['creation_date'] = creation_date.strftime('%d.%m.%Y')
-        last_modified = response.xpath('//meta[@property="article:modified_time"]/@content').get()
-        item['last_modified'] = datetime.fromisoformat(last_modified.split('+')[0]).strftime('%d.%m.%Y')
-        item['crawl_date'] = datetime.now().strftime('%d.%m.%Y')
-
-        # Get authors
-        authors = response.xpath('//meta[@itemprop="author"]/@content').getall()
-        item['author_person'] = authors if authors else list()
-        item['author_organization'] = list()
-
-        # Extract keywords, if available
-        news_keywords = response.xpath('//meta[@property="article:section"]/@content').getall()
-        item['news_keywords'] = news_keywords if news_keywords else list()
-
-        # Get title, description, and body of article
-        title = response.xpath('//meta[@property="og:title"]/@content').get().strip()
-        description = response.xpath('//meta[@property="og:description"]/@content').get().strip().replace('\r\n', '')
-
-        # Body as dictionary: key = headline (if available, otherwise empty string), values = list of corresponding paragraphs
-        body = dict()
-        if response.xpath('//h4[@style="text-align: center;"]'):
-            # Extract headlines
-            headlines = [h4.xpath('string()').get().strip() for h4 in response.xpath('//h4[@style="text-align: center;"]')]
-
-            # Extract the paragraphs and headlines together
-            text = [node.xpath('string()').get().strip() for node in response.xpath('//div[@class="entry-content"]/p[@style="text-align: justify;"] | //div[@class="entry-content"]/blockquote/p[@style="text-align: justify;"] | //h4[@style="text-align: center;"]')]
-          
-            # Extract paragraphs between the abstract and the first headline
-            body[''] = remove_empty_paragraphs(text[:text.index(headlines[0])])
-
-            # Extract paragraphs corresponding to each headline, except the last one
-            for i in range(len(headlines)-1):
-                body[headlines[i]] = remove_empty_paragraphs(text[text.index(headlines[i])+1:text.index(headlines[i+1])])
-
-            # Extract the paragraphs belonging to the last headline
-            body[headlines[-1]] = remove_empty_paragraphs(text[text.index(headlines[-1])+1:])
-
-        else:
-            # The article has no headlines, just paragraphs
-            body[''] = paragraphs
-
-        item['content'] = {'title': title, 'description': description, 'body':body}
-
-        # Extract first 5 recommendations towards articles from the same news outlet, if available
-        item['recommendations'] = list()
-
-        item['response_body'] = response.body
-
-        yield item
+# -*- coding: utf-8 -*-
+
+from news_crawler.spiders import BaseSpider
+from scrapy.spiders import Rule
+from scrapy.linkextractors import LinkExtractor
+
+
+class ManTau(BaseSpider):
+    """Spider for ManTau"""
+    name = 'man_tau'
+    rotate_user_agent = True
+    allowed_domains = ['man-tau.com']
+    start_urls = ['https://man-tau.com/']
+
+    # Publication date in the URLs of articles
+    url_date_pattern = r'man\-tau\.com\/(?P<year>\d{4})\/(?P<month>\d{2})\/(?P<day>\d{2})\/'
+
+    # Exclude pages without relevant articles
+    rules = (
+            Rule(
+                LinkExtractor(
+                    allow=(r'man\-tau\.com\/\d+\/\d+\/\d+\/\w.*'),
+                    deny=(r'man\-tau\.com\/\d+\/\d+\/\d+\/\w.*\/\?replytocom\=\d+$'
+                        r'man\-tau\.com\/infos\/',
+                        r'man\-tau\.com\/mitmachen\/',
+                        r'man\-tau\.com\/banner\-und\-e\-mail\-signaturen\/'
+                        )
+                    ),
+                callback='parse_item',
+                follow=True
+                ),
+            )
+
+    schema = {
+            'news_outlet': 'man tau',
+            'creation_date': '//meta[@property="article:published_time"]/@content',
+            'last_modified': '//meta[@property="article:modified_time"]/@content',
+            'paragraphs': '//div[@class="entry-content"]/p[@style="text-align: justify;"] | //div[@class="entry-content"]/blockquote/p[@style="text-align: justify;"]',
+            'headlines': '//h4[@style="text-align: center;"]',
+            'author_person': '//meta[@itemprop="author"]/@content',
+            'news_keywords': '//meta[@property="article:section"]/@content',
+            }
+
+    def get_description(self, response):
+        description = super().get_description(response)
+        return description.replace('\r\n', '') if description else description
@@ -1,15 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import os
-import sys
 from news_crawler.spiders import BaseSpider
-from scrapy.spiders import Rule 
+from scrapy.spiders import Rule
 from scrapy.linkextractors import LinkExtractor
-from datetime import datetime
-
-sys.path.insert(0, os.path.join(os.getcwd(), "..",))
-from news_crawler.items import NewsCrawlerItem
-from news_crawler.utils import remove_empty_paragraphs
 
 
 class NeuesDeutschlandSpider(BaseSpider):
@@ -18,6 +11,9 @@ class NeuesDeutschlandSpider(BaseSpider):
     rotate_user_agent = True
     allowed_domains = ['www.nd-aktuell.de']
     start_urls = ['https://www.nd-aktuell.de/']
+
+    # Article IDs in the URLs, increasing with the publication date
+    url_id_pattern = r'\/artikel\/(?P<id>\d+)\.'
     
     # Exclude pages without relevant articles 
     rules = (
@@ -45,104 +41,25 @@ class NeuesDeutschlandSpider(BaseSpider):
                 ),
             )
 
-    def parse_item(self, response):
-        """
-        Checks article validity. If valid, it parses it.
-        """
-        # Check if page is duplicate
-        if 'html?' in response.url:
-            return
-        
-        # Check date validity 
-        creation_date = response.xpath('//meta[@name="date"]/@content').get()
-        if not creation_date:
-            return
-        creation_date = datetime.strptime(creation_date, '%Y-%m-%d')
-        if self.is_out_of_date(creation_date):
-            return
-
-        # Extract the article's paragraphs
-        paragraphs = [node.xpath('string()').get().strip() for node in response.xpath('//h2[preceding-sibling::h1] | //div[@class="Content"]/p')]
-        paragraphs = remove_empty_paragraphs(paragraphs)
-        text = ' '.join([para for para in paragraphs])
-
-        # Check article's length validity
-        if not self.has_min_length(text):
-            return
-
-        # Check keywords validity
-        if not self.has_valid_keywords(text):
-            return
-
-        # Parse the valid article
-        item = NewsCrawlerItem()
-
-        item['news_outlet'] = 'neues_deutschland'
-        item['provenance'] = response.url
-        item['query_keywords'] = self.get_query_keywords()
-        
-        # Get creation, modification, and crawling dates
-        item['creation_date'] = creation_date.strftime('%d.%m.%Y')
-        item['last_modified'] = creation_date.strftime('%d.%m.%Y')
-        item['crawl_date'] = datetime.now().strftime('%d.%m.%Y')
-        
-        # Get authors
-        authors = response.xpath('//meta[@name="author"]/@content').get()
+    schema = {
+            'creation_date': '//meta[@name="date"]/@content',
+            'date_format': '%Y-%m-%d',
+            'paragraphs': '//h2[preceding-sibling::h1] | //div[@class="Content"]/p',
+            'headlines': '//h4[not(ancestor::div[@class="Wrap" or @class="ndPLUS-Abowerbung"])] | //h3[not(descendant::*)]',
+            'news_keywords': '//meta[@name="news_keywords"]/@content',
+            'news_keywords_separator': ', ',
+            'title_suffix': ' (neues deutschland)',
+            'recommendations': '//div[@id="List-Similar-Articles"]//a/@href',
+            'recommendations_prefix': 'https://www.nd-aktuell.de',
+            }
+
+    def is_excluded(self, response):
+        return 'html?' in response.url
+
+    def get_authors(self, response):
+        authors = self.select_first(response, '//meta[@name="author"]/@content')
+        if not authors:
+            return list(), list()
         if 'neues deutschland' in authors:
-            item['author_person'] = list()
-            item['author_organization'] = authors.split(', ')
-        elif authors:
-            item['author_person'] = authors.split(', ')
-            item['author_organization'] = list()
-        else:
-            item['author_person'] = list()
-            item['author_organization'] = list()
-
-        # Extract keywords
-        news_keywords = response.xpath('//meta[@name="news_keywords"]/@content').get()
-        item['news_keywords'] = news_keywords.split(', ') if news_keywords else list()
-        
-        # Get title, description, and body of article
-        title = response.xpath('//meta[@property="og:title"]/@content').get()
-        if '(neues deutschland)' in title:
-            title = title.split(' (neues deutschland)')[0]
-        description = response.xpath('//meta[@property="og:description"]/@content').get()
-
-        # Body as dictionary: key = headline (if available, otherwise empty string), values = list of corresponding paragraphs
-        body = dict()
-        if response.xpath('//h4[not(ancestor::div[@class="Wrap" or @class="ndPLUS-Abowerbung"])] | //h3[not(descendant::*)]'):
-            # Extract headlines
-            headlines = [h.xpath('string()').get().strip() for h in response.xpath('//h4[not(ancestor::div[@class="Wrap" or @class="ndPLUS-Abowerbung"])] | //h3[not(descendant::*)]')]
-
-            # Extract paragraphs with headlines
-            text = [node.xpath('string()').get().strip() for node in response.xpath('//h2[preceding-sibling::h1] | //div[@class="Content"]/p | //h4[not(ancestor::div[@class="Wrap" or @class="ndPLUS-Abowerbung"])] | //h3[not(descendant::*)]')]
-
-            # Extract paragraphs between the abstract and the first headline
-            body[''] = remove_empty_paragraphs(text[:text.index(headlines[0])])
-
-            # Extract paragraphs corresponding to each headline, except the last one
-            for i in range(len(headlines)-1):
-                body[headlines[i]] = remove_empty_paragraphs(text[text.index(headlines[i])+1:text.index(headlines[i+1])])
-
-            # Extract the paragraphs belonging to the last headline
-            body[headlines[-1]] = remove_empty_paragraphs(text[text.index(headlines[-1])+1:])
-
-        else:
-            # The article has no headlines, just paragraphs
-            body[''] = paragraphs
-
-        item['content'] = {'title': title, 'description': description, 'body':body}
-      
-        # Extract the first 5 recommendations related to the article
-        recommendations = response.xpath('//div[@id="List-Similar-Articles"]//a/@href').getall()
-        if recommendations:
-            if len(recommendations) > 5:
-                recommendations = recommendations[:5]
-            recommendations = ['https://www.nd-aktuell.de' + rec for rec in recommendations]
-            item['recommendations'] = recommendations
-        else:
-            item['recommendations'] = list()
-
-        item['response_body'] = response.body
-
-        yield item
+            return list(), authors.split(', ')
+        return authors.split(', '), list()
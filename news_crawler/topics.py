@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Topic profiles for news_crawler project
+
+from datetime import datetime
+from scrapy.exceptions import NotConfigured
+from scrapy.settings import Settings
+from typing import List
+
+from news_crawler.keywords import KeywordValidator
+
+
+TOPIC_SETTINGS = ['START_DATE', 'END_DATE', 'ARTICLE_LENGTH', 'KEYWORDS', 'KEYWORDS_MIN_FREQUENCY', 'KEYWORDS_MIN_DISTANCE']
+
+
+class Topic(object):
+    """
+    Profile of a topic, i.e. the requirements an article has to meet to be relevant for the topic.
+
+    Args:
+        name (:obj:`str`):
+            The name of the topic, used as name of its data directory.
+        start_date (:obj:`str`):
+            The date from which an article is relevant.
+        end_date (:obj:`str`):
+            The date until which an article is relevant.
+        article_length (:obj:`int`):
+            Minimum article length required.
+        keywords (:obj:`List[str]`):
+            Query keyword stems.
+        keywords_min_frequency (:obj:`int`):
+            Minimum number of keyword stems that should be contained in a relevant article.
+        keywords_min_distance (:obj:`int`):
+            Minimum token difference between the first and the last word containing a keyword stem.
+        keyword_validator (:obj:`KeywordValidator`):
+            Validator checking the keyword requirements of an article.
+    """
+
+    def __init__(self, name: str, start_date: str, end_date: str, article_length: int, keywords: List, keywords_min_frequency: int, keywords_min_distance: int):
+        self.name = name
+        self.start_date = datetime.strptime(start_date, '%d.%m.%Y')
+        self.end_date = datetime.strptime(end_date, '%d.%m.%Y')
+        self.article_length = article_length
+        self.keywords = keywords
+        self.keywords_min_frequency = keywords_min_frequency
+        self.keywords_min_distance = keywords_min_distance
+        self.keyword_validator = KeywordValidator(keywords, keywords_min_frequency, keywords_min_distance)
+
+    def is_in_date_range(self, date: datetime) -> bool:
+        """
+        Args:
+            date (:obj:`datetime`):
+                The publication date of the article.
+
+        Returns:
+            :obj:`bool`:
+                :obj:`True` if date is inside the topic's range, :obj:`False` otherwise.
+        """
+        return self.start_date <= date <= self.end_date
+
+
+def load_topics(settings: Settings) -> List[Topic]:
+    """
+    Loads the topic profiles to crawl from the settings. Each profile in TOPICS may override any of the 
+    topic-specific settings, whereas missing values are taken from the global settings. If TOPICS is empty, 
+    a single profile named after TOPIC is created from the global settings.
+
+    Args:
+        settings (:obj:`Settings`):
+            The project settings.
+
+    Returns:
+        :obj:`List[Topic]`:
+            The topic profiles.
+    """
+    profiles = settings.getdict('TOPICS')
+    if not profiles:
+        if not settings.get('TOPIC'):
+            raise NotConfigured
+        profiles = {settings.get('TOPIC'): dict()}
+
+    topics = list()
+    for name, profile in profiles.items():
+        values = list()
+        for key in TOPIC_SETTINGS:
+            value = profile.get(key, settings.get(key))
+            if not value:
+                raise NotConfigured('{} not set for topic {}'.format(key, name))
+            values.append(value)
+        topics.append(Topic(name, *values))
+    return topics
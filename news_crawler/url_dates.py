@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Date filtering of links for news_crawler project
+
+import re
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+# Verdicts on the publication date of a linked article
+IN_RANGE = 'in_range'
+OUT_OF_RANGE = 'out_of_range'
+UNCERTAIN = 'uncertain'
+
+
+class UrlDateFilter(object):
+    """
+    Judges from the URL of a linked article whether it can be in the crawled date range, before it is requested.
+
+    Outlets either encode the publication date in their URLs (e.g. `/2020/03/04/`), in which case articles
+    outside the range are known for certain, or a numeric ID increasing with the publication date
+    (e.g. `?p=123456`). IDs are related to dates by the articles parsed during the crawl: an ID lower than
+    the one of an article published before the range is likely too old, and an ID higher than the one
+    of an article published after the range is likely too new. Since IDs are assigned when an article
+    is created rather than published, such articles are only uncertain.
+
+    Args:
+        start_date (:obj:`datetime`):
+            The earliest date from which an article is relevant.
+        end_date (:obj:`datetime`):
+            The latest date until which an article is relevant.
+        date_pattern (:obj:`Optional[str]`):
+            Regular expression matching the date in the URLs, with the named groups `year`, and optionally
+            `month` and `day`.
+        id_pattern (:obj:`Optional[str]`):
+            Regular expression matching the article's ID in the URLs, with the named group `id`.
+        max_id_before (:obj:`Optional[int]`):
+            The highest ID of the parsed articles published before the range.
+        min_id_after (:obj:`Optional[int]`):
+            The lowest ID of the parsed articles published after the range.
+    """
+
+    def __init__(self, start_date: datetime, end_date: datetime, date_pattern: Optional[str] = None, id_pattern: Optional[str] = None):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.date_pattern = re.compile(date_pattern) if date_pattern else None
+        self.id_pattern = re.compile(id_pattern) if id_pattern else None
+        self.max_id_before = None
+        self.min_id_after = None
+
+    def get_period(self, url: str) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Args:
+            url (:obj:`str`):
+                The URL of an article.
+
+        Returns:
+            :obj:`Optional[Tuple[datetime, datetime]]`:
+                The start and the (exclusive) end of the year, month, or day given in the URL, or :obj:`None`
+                if the URL gives no date.
+        """
+        match = self.date_pattern.search(url) if self.date_pattern else None
+        if not match:
+            return None
+        groups = match.groupdict()
+        year = int(groups['year'])
+        try:
+            if not groups.get('month'):
+                return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+            month = int(groups['month'])
+            start = datetime(year, month, int(groups['day'])) if groups.get('day') else datetime(year, month, 1)
+        except ValueError:
+            # Not a date, e.g. an ID matching the pattern
+            return None
+        if groups.get('day'):
+            return start, datetime.fromordinal(start.toordinal() + 1)
+        return start, datetime(year + month // 12, month % 12 + 1, 1)
+
+    def get_id(self, url: str) -> Optional[int]:
+        """ The article's ID given in the URL, or :obj:`None` if there is none. """
+        match = self.id_pattern.search(url) if self.id_pattern else None
+        return int(match.group('id')) if match else None
+
+    def learn(self, url: str, date: datetime):
+        """
+        Relate the ID of a parsed article to its publication date.
+
+        Args:
+            url (:obj:`str`):
+                The URL of the article.
+            date (:obj:`datetime`):
+                The publication date of the article.
+        """
+        article_id = self.get_id(url)
+        if article_id is None:
+            return
+        if date < self.start_date and (self.max_id_before is None or article_id > self.max_id_before):
+            self.max_id_before = article_id
+        elif date > self.end_date and (self.min_id_after is None or article_id < self.min_id_after):
+            self.min_id_after = article_id
+
+    def merge(self, max_id_before: Optional[int], min_id_after: Optional[int]):
+        """ Take over the IDs related to dates by another filter, e.g. of a process extracting articles. """
+        if max_id_before is not None and (self.max_id_before is None or max_id_before > self.max_id_before):
+            self.max_id_before = max_id_before
+        if min_id_after is not None and (self.min_id_after is None or min_id_after < self.min_id_after):
+            self.min_id_after = min_id_after
+
+    def judge(self, url: str) -> Optional[str]:
+        """
+        Args:
+            url (:obj:`str`):
+                The URL of a linked article.
+
+        Returns:
+            :obj:`Optional[str]`:
+                `OUT_OF_RANGE` if the article is certainly outside the date range, `IN_RANGE` if it is certainly inside,
+                `UNCERTAIN` if it is possibly outside, or :obj:`None` if the URL tells nothing about the date.
+        """
+        period = self.get_period(url)
+        if period:
+            start, end = period
+            if end <= self.start_date or start > self.end_date:
+                return OUT_OF_RANGE
+            if self.start_date <= start and end <= self.end_date:
+                return IN_RANGE
+            return UNCERTAIN
+
+        article_id = self.get_id(url)
+        if article_id is None:
+            return None
+        if self.max_id_before is not None and article_id <= self.max_id_before:
+            return UNCERTAIN
+        if self.min_id_after is not None and article_id >= self.min_id_after:
+            return UNCERTAIN
+        return None
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Utils for news_crawler project
 
-from typing import List
+from typing import Dict, List, Tuple
 
 
 def remove_empty_paragraphs(paragraphs: List[str]) -> List[str]:
@@ -17,3 +17,26 @@ def remove_empty_paragraphs(paragraphs: List[str]) -> List[str]:
             The list of paragraphs without empty paragraphs.
     """
     return [para for para in paragraphs if para != ' ' and para != '']
+
+
+def split_sections(sections: List[Tuple[str, bool]]) -> Dict[str, List[str]]:
+    """
+    Splits an article's paragraphs into sections by its headlines, in a single pass over the article.
+
+    Args:
+        sections (:obj:`List[Tuple[str, bool]]`):
+            The paragraphs and headlines of an article in document order, each with whether it is a headline.
+
+    Returns:
+        :obj:`Dict[str, List[str]]`:
+            The non-empty paragraphs by headline; paragraphs before the first headline are stored under the empty string.
+            The paragraphs of headlines occurring several times are joined in their order.
+    """
+    body = {'': list()}
+    paragraphs = body['']
+    for text, is_headline in sections:
+        if is_headline:
+            paragraphs = body.setdefault(text, list())
+        elif text != ' ' and text != '':
+            paragraphs.append(text)
+    return body
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Tests of the German date parsing for news_crawler project
+
+import dateparser
+import pytest
+from datetime import datetime
+
+from news_crawler.dates import NOT_PARSED, PARSED_BY_DATEPARSER, PARSED_BY_PATTERN, parse_german_date
+
+
+@pytest.mark.parametrize('date, parsed', [
+    # Month names, abbreviated with or without a dot, and in upper case
+    ('12. März 2020', datetime(2020, 3, 12)),
+    ('12. Mär. 2020', datetime(2020, 3, 12)),
+    ('12. MÄRZ 2020', datetime(2020, 3, 12)),
+    ('3. Sept. 2019 um 10:00', datetime(2019, 9, 3, 10, 0)),
+    ('4 Mär 2020', datetime(2020, 3, 4)),
+    ('Mo, 02 Mär 2020 10:00', datetime(2020, 3, 2, 10, 0)),
+    ('Mittwoch, 4. März 2020, 16:00 Uhr', datetime(2020, 3, 4, 16, 0)),
+    # Numeric dates, with two or four digits of the year
+    ('12.03.2020', datetime(2020, 3, 12)),
+    ('12.03.2020 um 10:00', datetime(2020, 3, 12, 10, 0)),
+    ('12.03.20, 16:00 Uhr', datetime(2020, 3, 12, 16, 0)),
+    ('12.03.2020 / 06:00', datetime(2020, 3, 12, 6, 0)),
+    ('2.3.2020 - 10:15:30', datetime(2020, 3, 2, 10, 15, 30)),
+    ])
+def test_patterns_agree_with_dateparser(date, parsed):
+    assert parse_german_date(date) == (parsed, PARSED_BY_PATTERN)
+    # As parsed by dateparser in German (without a language, it reads some numeric dates month first, e.g. 12.03.2020)
+    assert dateparser.parse(date, languages=['de']) == parsed
+
+
+@pytest.mark.parametrize('date, parsed', [
+    ('2020-03-04 10:00', datetime(2020, 3, 4, 10, 0)),
+    ('04/03/2020', datetime(2020, 3, 4)),
+    ('Mittwoch, den 4. März 2020', None),
+    # Not a valid date, hence not parsed by the patterns either
+    ('31.02.2020', None),
+    # Restricted to German
+    ('March 4, 2020', None),
+    ('keine Angabe', None),
+    ])
+def test_dateparser_parses_the_other_dates(date, parsed):
+    assert parse_german_date(date) == (parsed, PARSED_BY_DATEPARSER if parsed else NOT_PARSED)
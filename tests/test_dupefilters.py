@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Tests of the duplicate request filtering for news_crawler project
+
+import io
+import os
+import hashlib
+import pytest
+from typing import List
+
+from twisted.internet import reactor
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.http import Request
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.dupefilters import BloomDupeFilter, BloomSlice, ScalableBloomFilter, next_prime, split_fingerprint
+
+
+class OutletSpider(Spider):
+    name = 'outlet'
+
+
+def get_dupefilter(**settings) -> BloomDupeFilter:
+    project_settings = get_project_settings()
+    project_settings.setdict(settings, priority='cmdline')
+    dupefilter = BloomDupeFilter.from_crawler(Crawler(OutletSpider, project_settings))
+    dupefilter.open()
+    return dupefilter
+
+
+def test_job_resumed_after_crash_requests_the_pending_pages(tmp_path):
+    job = {'JOBDIR': str(tmp_path), 'CHECKPOINT_ENABLED': True, 'CHECKPOINT_INTERVAL': 0.01}
+    delayed_calls = len(reactor.getDelayedCalls())
+    dupefilter = get_dupefilter(**job)
+    # Not saved while the crawl runs
+    assert len(reactor.getDelayedCalls()) == delayed_calls
+    requests = [Request('https://www.welt.de/artikel{}.html'.format(i)) for i in range(100)]
+    assert not any(dupefilter.request_seen(request) for request in requests)
+    # The crawl crashes before it closes, losing Scrapy's queue of the pending requests
+    assert not os.path.exists(os.path.join(str(tmp_path), 'requests.bloom'))
+
+    resumed = get_dupefilter(**job)
+    assert not any(resumed.request_seen(request) for request in requests)
+    resumed.close('shutdown')
+
+    # A job stopped cleanly keeps its queue, hence the requests seen are filtered when it is resumed
+    assert all(get_dupefilter(**job).request_seen(request) for request in requests)
+
+
+def get_fingerprints(start: int, stop: int) -> List[str]:
+    return [hashlib.sha1(str(i).encode()).hexdigest() for i in range(start, stop)]
+
+
+def test_bloom_slice_sizes_and_contains():
+    bloom_slice = BloomSlice(1000, 0.01)
+    # About 9.6 bits and 7 hashes per fingerprint, with a prime number of bits
+    assert bloom_slice.num_bits == next_prime(bloom_slice.num_bits) and 9500 < bloom_slice.num_bits < 9700
+    assert bloom_slice.num_hashes == 7
+    added = [split_fingerprint(fingerprint) for fingerprint in get_fingerprints(0, 1000)]
+    for hashes in added:
+        bloom_slice.add(hashes)
+    assert bloom_slice.is_full()
+    assert all(bloom_slice.contains(hashes) for hashes in added)
+    false_positives = sum(bloom_slice.contains(split_fingerprint(fingerprint)) for fingerprint in get_fingerprints(1000, 11000))
+    assert false_positives < 200
+
+
+def test_scalable_bloom_filter_grows_within_its_error_rate():
+    fingerprints = ScalableBloomFilter(1000, 0.01)
+    # Fingerprints taken for added ones are not added
+    taken = sum(fingerprints.add(fingerprint) for fingerprint in get_fingerprints(0, 5000))
+    assert taken < 50 and len(fingerprints) == 5000 - taken
+    # Slices of 1000, 2000 and 4000 fingerprints, with halved error rates
+    assert [(bloom_slice.capacity, bloom_slice.error_rate) for bloom_slice in fingerprints.slices] == [(1000, 0.005), (2000, 0.0025), (4000, 0.00125)]
+    assert all(fingerprint in fingerprints for fingerprint in get_fingerprints(0, 5000))
+    assert all(fingerprints.add(fingerprint) for fingerprint in get_fingerprints(0, 100))
+    false_positives = sum(fingerprint in fingerprints for fingerprint in get_fingerprints(5000, 25000))
+    assert false_positives < 400
+
+
+def test_scalable_bloom_filter_save_and_load():
+    fingerprints = ScalableBloomFilter(1000, 0.01)
+    for fingerprint in get_fingerprints(0, 1500):
+        fingerprints.add(fingerprint)
+    file = io.BytesIO()
+    fingerprints.save(file)
+
+    loaded = ScalableBloomFilter(1000, 0.01)
+    loaded.load(io.BytesIO(file.getvalue()))
+    assert len(loaded) == len(fingerprints)
+    assert [bloom_slice.bits for bloom_slice in loaded.slices] == [bloom_slice.bits for bloom_slice in fingerprints.slices]
+    assert all(fingerprint in loaded for fingerprint in get_fingerprints(0, 1500))
+
+    with pytest.raises(ValueError):
+        ScalableBloomFilter(1000, 0.01).load(io.BytesIO(file.getvalue()[:-1]))
+    with pytest.raises(ValueError):
+        ScalableBloomFilter(1000, 0.01).load(io.BytesIO(b'not a filter'))
+
+
+def test_invalid_saved_filter_is_ignored(tmp_path):
+    path = os.path.join(str(tmp_path), 'requests.bloom')
+    dupefilter = get_dupefilter(JOBDIR=str(tmp_path))
+    dupefilter.request_seen(Request('https://www.welt.de/artikel.html'))
+    dupefilter.close('shutdown')
+    with open(path, 'rb') as file:
+        saved = file.read()
+    # Truncated in the header of a slice, and in its bits
+    for truncated in (saved[:len(saved) // 2], saved[:20]):
+        with open(path, 'wb') as file:
+            file.write(truncated)
+        assert not get_dupefilter(JOBDIR=str(tmp_path)).request_seen(Request('https://www.welt.de/artikel.html'))
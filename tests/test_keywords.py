@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Tests of the keyword validation for news_crawler project
+
+import pytest
+from itertools import combinations
+from typing import List
+
+from news_crawler.keywords import KeywordValidator, LinkScorer
+
+
+REFUGEES = ['flüchtl', 'geflücht', 'asyl', 'zuwander', 'immigrant', 'immigration', 'migration', 'migrant', 'ausländer', 'einwander', 'refug', 'rapefug', 'invasor']
+BASIC_INCOME = ['grundeinkommen', 'bedingungslos einkommen']
+GREEN_DEAL = ['green deal', 'eu green deal', 'eu grüne deal']
+CANNABIS = [
+        ['weich droge', 'soft drug', 'soft droge', 'entkriminalisierung'],
+        ['marihuana', 'cannabis', 'hanf', 'haschisch', 'tetrahydrocannabinol', 'thc', 'weed', 'psilocybin', 'psilocin', 'magic mushroom', 'zauberpilz', 'halluzinogen pilz'],
+        ['legal', 'entkriminalisierung']
+        ]
+
+MIN_FREQUENCY = 2
+MIN_DISTANCE = 50
+
+# Words containing none of the keyword stems above
+FILLER = 'der stadtrat hat am montag lange über den haushalt beraten und dabei viele fragen offen gelassen'.split()
+
+
+def text(*parts) -> str:
+    """ Joins words and runs of filler words (given by their number) into an article's body of text. """
+    words = list()
+    for part in parts:
+        if isinstance(part, int):
+            words.extend(FILLER[i % len(FILLER)] for i in range(part))
+        else:
+            words.extend(part.split())
+    return ' '.join(words)
+
+
+class LegacyValidator(object):
+    """ The keyword validation of BaseSpider before KeywordValidator, as reference. """
+
+    def __init__(self, keywords: List, min_frequency: int, min_distance: int):
+        self.keywords = keywords
+        self.keywords_combinations = keywords if type(keywords[0]) == list else list()
+        if not self.keywords_combinations:
+            self.compound_keywords = [keyword for keyword in keywords if len(keyword.split()) > 1]
+            if self.compound_keywords:
+                self.keywords = [keyword for keyword in keywords if not keyword in self.compound_keywords]
+        self.keywords_min_frequency = min_frequency
+        self.keywords_min_distance = min_distance
+        self.query_keywords = list()
+
+    def is_valid(self, tokens: List[str]) -> bool:
+        if not self.keywords_combinations:
+            return self._has_valid_keywords(tokens)
+        return self._has_valid_combinations_keywords(tokens)
+
+    def _has_valid_keywords(self, tokens: List[str]) -> bool:
+        matching_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in self.keywords)]
+        compound_query_keywords = list()
+
+        if self.compound_keywords:
+            double_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split()) == 2]
+            triple_keywords = [keyword for keyword in self.compound_keywords if len(keyword.split()) == 3]
+
+            if double_keywords:
+                matching_double_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in double_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
+                if matching_double_pos_tokens:
+                    matching_double_pos = [pos for (pos, _, _) in matching_double_pos_tokens]
+                    matching_pos_tokens = [(pos, token) for (pos, token) in matching_pos_tokens if (pos-1) not in matching_double_pos]
+                    matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_double_pos_tokens])))
+                    compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_double_pos_tokens])))
+
+            if triple_keywords:
+                matching_triple_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in triple_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]) and (keyword.split()[-1] in tokens[tokens.index(token)+2]))]
+                if matching_triple_pos_tokens:
+                    matching_triple_pos = [pos for (pos, _, _) in matching_triple_pos_tokens]
+                    matching_pos_tokens = [(pos, token) for (pos, token) in matching_pos_tokens if ((pos not in matching_triple_pos) and ((pos+1) not in matching_triple_pos))]
+                    matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_triple_pos_tokens])))
+                    compound_query_keywords.extend([keyword for (_, _, keyword) in matching_triple_pos_tokens])
+
+        if matching_pos_tokens:
+            matching_positions, matching_tokens = map(list, zip(*matching_pos_tokens))
+            if len(matching_positions) >= self.keywords_min_frequency:
+                if any(abs(pos_1-pos_2) >= self.keywords_min_distance for (pos_1, pos_2) in list(combinations(matching_positions, 2))):
+                    self.query_keywords = list(set(filter(lambda x: any(x in token for token in matching_tokens), self.keywords)))
+                    if compound_query_keywords:
+                        self.query_keywords.extend(list(set(compound_query_keywords)))
+                    return True
+        return False
+
+    def _has_valid_combinations_keywords(self, tokens: List[str]) -> bool:
+        compound_keywords = [keyword for keyword in self.keywords_combinations[0] if len(keyword.split()) > 1]
+        single_keywords = [keyword for keyword in self.keywords_combinations[0] if not keyword in compound_keywords]
+        combined_first_compound_keywords = [keyword for keyword in self.keywords_combinations[1] if len(keyword.split()) > 1]
+        combined_first_single_keywords = [keyword for keyword in self.keywords_combinations[1] if not keyword in combined_first_compound_keywords]
+        combined_second_keywords = self.keywords_combinations[2]
+
+        matching_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in single_keywords)]
+        compound_query_keywords = list()
+
+        if compound_keywords:
+            matching_compound_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in compound_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
+            if matching_compound_pos_tokens:
+                matching_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_compound_pos_tokens])))
+                compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_compound_pos_tokens])))
+
+        flag = True
+        comb_compound_query_keywords = list()
+
+        matching_comb_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in combined_first_single_keywords)]
+        if combined_first_compound_keywords:
+            matching_comb_compound_pos_tokens = [(tokens.index(token), token, keyword) for token in tokens for keyword in combined_first_compound_keywords if ((keyword.split()[0] in token) and (keyword.split()[1] in tokens[tokens.index(token)+1]))]
+            if matching_comb_compound_pos_tokens:
+                matching_comb_pos_tokens.extend(list(set([(pos, token) for (pos, token, _) in matching_comb_compound_pos_tokens])))
+                comb_compound_query_keywords.extend(list(set([keyword for (_, _, keyword) in matching_comb_compound_pos_tokens])))
+
+        if matching_comb_pos_tokens:
+            matching_second_comb_pos_tokens = [(tokens.index(token), token) for token in tokens if any(keyword in token for keyword in combined_second_keywords)]
+            if matching_second_comb_pos_tokens:
+                matching_comb_pos_tokens.extend(matching_second_comb_pos_tokens)
+            else:
+                flag = False
+
+        if flag:
+            matching_pos_tokens.extend(matching_comb_pos_tokens)
+
+        if matching_pos_tokens:
+            matching_pos_tokens = list(set(matching_pos_tokens))
+            matching_positions, matching_tokens = map(list, zip(*matching_pos_tokens))
+            if len(matching_positions) >= self.keywords_min_frequency:
+                if any(abs(pos_1-pos_2) >= self.keywords_min_distance for (pos_1, pos_2) in list(combinations(matching_positions, 2))):
+                    self.query_keywords = list(set(filter(lambda x: any(x in token for token in matching_tokens), single_keywords)))
+                    if compound_query_keywords:
+                        self.query_keywords.extend(list(set(compound_query_keywords)))
+                    if matching_comb_pos_tokens:
+                        self.query_keywords.extend(list(set(filter(lambda x: any(x in token for token in matching_tokens), combined_first_single_keywords))))
+                        self.query_keywords.extend(list(set(filter(lambda x: any(x in token for token in matching_tokens), combined_second_keywords))))
+                        if combined_first_compound_keywords:
+                            self.query_keywords.extend(comb_compound_query_keywords)
+                    self.query_keywords = list(set(self.query_keywords))
+                    return True
+        return False
+
+
+# Articles without repeated matching tokens, on which both validators agree
+CORPUS = [
+        (REFUGEES, text('die flüchtlinge', 60, 'das asylverfahren', 10)),
+        (REFUGEES, text(5, 'zuwanderung', 30, 'ausländerbehörde', 70, 'migrantinnen', 3)),
+        (REFUGEES, text('die flüchtlinge', 20, 'das asylverfahren', 10)),
+        (REFUGEES, text(40, 'einwanderer', 80)),
+        (REFUGEES, text(120)),
+        (BASIC_INCOME, text('ein bedingungsloses einkommen', 70, 'das grundeinkommen', 5)),
+        (BASIC_INCOME, text('das grundeinkommen', 55, 'ein bedingungsloses einkommen', 5)),
+        (BASIC_INCOME, text('ein bedingungsloses', 10, 'einkommen', 60)),
+        (BASIC_INCOME, text('das grundeinkommen', 30, 'ein bedingungsloses einkommen', 5)),
+        (GREEN_DEAL, text('der green deal', 60, 'den eu-kommission', 3, 'dem eu green deal', 4)),
+        (GREEN_DEAL, text('der green deal', 20, 'das ziel', 60)),
+        (CANNABIS, text('die entkriminalisierung', 60, 'von weichen drogen', 5)),
+        (CANNABIS, text('cannabis', 55, 'soll legalisiert werden', 5)),
+        (CANNABIS, text('cannabis', 55, 'und hanfprodukte', 5)),
+        (CANNABIS, text('marihuana', 30, 'ist', 30, 'legal', 5)),
+        ]
+
+
+@pytest.mark.parametrize('keywords, article', CORPUS)
+def test_agrees_with_legacy_validator(keywords, article):
+    tokens = article.lower().split()
+    legacy = LegacyValidator(keywords, MIN_FREQUENCY, MIN_DISTANCE)
+    validator = KeywordValidator(keywords, MIN_FREQUENCY, MIN_DISTANCE)
+
+    valid = legacy.is_valid(tokens)
+    assert validator.is_valid(tokens) == valid
+    if valid:
+        assert sorted(validator.query_keywords) == sorted(legacy.query_keywords)
+
+
+def test_corpus_covers_valid_and_invalid_articles():
+    results = [LegacyValidator(keywords, MIN_FREQUENCY, MIN_DISTANCE).is_valid(article.split()) for keywords, article in CORPUS]
+    assert any(results) and not all(results)
+
+
+def test_repeated_token_keeps_its_own_position():
+    # The legacy validator took the position of a repeated token's first occurrence, hence found no distance here
+    tokens = text('flüchtlinge', 60, 'flüchtlinge', 5).split()
+    assert not LegacyValidator(REFUGEES, MIN_FREQUENCY, MIN_DISTANCE).is_valid(tokens)
+
+    validator = KeywordValidator(REFUGEES, MIN_FREQUENCY, MIN_DISTANCE)
+    assert validator.is_valid(tokens)
+    assert validator.query_keywords == ['flüchtl']
+
+
+def test_repeated_compound_keyword_keeps_its_own_position():
+    tokens = text('bedingungsloses einkommen', 60, 'bedingungsloses einkommen', 5).split()
+    assert not LegacyValidator(BASIC_INCOME, MIN_FREQUENCY, MIN_DISTANCE).is_valid(tokens)
+
+    validator = KeywordValidator(BASIC_INCOME, MIN_FREQUENCY, MIN_DISTANCE)
+    assert validator.is_valid(tokens)
+    assert validator.query_keywords == ['bedingungslos einkommen']
+
+
+def test_query_keywords_include_stems_after_thresholds_are_met():
+    validator = KeywordValidator(REFUGEES, MIN_FREQUENCY, MIN_DISTANCE)
+    assert validator.is_valid(text('flüchtlinge', 60, 'flüchtlinge', 100, 'asylbewerber', 5).split())
+    assert sorted(validator.query_keywords) == ['asyl', 'flüchtl']
+
+
+def test_compound_keyword_started_by_last_token():
+    # The legacy validator looked up the token after the last one, and raised IndexError
+    tokens = text('das grundeinkommen', 60, 'ist bedingungslos').split()
+    with pytest.raises(IndexError):
+        LegacyValidator(BASIC_INCOME, MIN_FREQUENCY, MIN_DISTANCE).is_valid(tokens)
+
+    assert not KeywordValidator(BASIC_INCOME, MIN_FREQUENCY, MIN_DISTANCE).is_valid(tokens)
+
+
+def test_compound_keyword_counts_once():
+    # Both words of 'bedingungslos einkommen' contain stems, but the keyword is a single match
+    validator = KeywordValidator(BASIC_INCOME, 3, MIN_DISTANCE)
+    assert not validator.is_valid(text('das grundeinkommen', 60, 'ein bedingungsloses einkommen').split())
+
+
+def test_link_scorer_ignores_short_words_of_compound_keywords():
+    scorer = LinkScorer(GREEN_DEAL)
+    # 'eu' is contained in 'deutschland', 'neue', 'steuer' and 'europa'
+    assert scorer.score('https://www.welt.de/politik/deutschland/neue-steuer-fuer-europa.html', 'Neue Steuer') == 0
+    assert scorer.score('https://www.welt.de/politik/eu-green-deal-der-kommission.html', '') == 1
+    assert scorer.score('https://www.welt.de/politik/gruene-deal.html', 'Der Green Deal') == 2
+
+
+def test_link_scorer_requires_all_words_of_compound_keywords():
+    scorer = LinkScorer(BASIC_INCOME)
+    assert scorer.score('https://www.taz.de/ein-bedingungsloses-einkommen/', '') == 1
+    assert scorer.score('https://www.taz.de/bedingungslos-gluecklich/', 'Mehr Einkommen') == 0
+    assert scorer.score('https://www.taz.de/grundeinkommen/', 'Grundeinkommen') == 2
+
+
+def test_link_scorer_matches_transliterated_stems():
+    scorer = LinkScorer(REFUGEES)
+    assert scorer.score('https://www.taz.de/fluechtlinge-an-der-grenze/', 'Asylbewerber') == 2
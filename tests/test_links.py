@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Tests of the link filtering for news_crawler project
+
+from scrapy.crawler import Crawler
+from scrapy.http import HtmlResponse, Request
+from scrapy.spiderloader import SpiderLoader
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.links import LinkSet
+
+
+def test_link_set_keeps_urls_across_merges():
+    links = LinkSet()
+    urls = ['https://www.welt.de/politik/article{}/Asyl.html'.format(i) for i in range(5000)]
+    for url in urls + urls[:100]:
+        links.add(url)
+    assert len(links) == 5000
+    # Merged into the sorted array once the recent hashes amount to an eighth of it
+    assert len(links.hashes) > 4000 and list(links.hashes) == sorted(links.hashes)
+    assert all(url in links for url in urls)
+    assert not any(url + '?seite=2' in links for url in urls)
+
+
+def get_page(url: str, paths: list) -> HtmlResponse:
+    anchors = ''.join('<a href="{}">Artikel</a>'.format(path) for path in paths)
+    return HtmlResponse(url, body='<html><body>{}</body></html>'.format(anchors).encode('utf-8'), request=Request(url))
+
+
+def get_spider(**settings):
+    project_settings = get_project_settings()
+    project_settings.setdict(settings, priority='cmdline')
+    spidercls = SpiderLoader.from_settings(project_settings).load('welt')
+    return spidercls.from_crawler(Crawler(spidercls, project_settings))
+
+
+def test_links_followed_from_other_pages_are_not_requested_again():
+    # Teasers shared by both pages, and a link given twice on the second page
+    shared = ['/politik/article200000001/Asyl.html', '/politik/article200000002/Migration.html']
+    spider = get_spider(URL_DATE_FILTER_ENABLED=False)
+    first = list(spider._requests_to_follow(get_page('https://www.welt.de/', shared)))
+    second = list(spider._requests_to_follow(get_page('https://www.welt.de/politik/', shared + ['/politik/article200000003/Asyl.html'] * 2)))
+
+    assert [request.url for request in first] == ['https://www.welt.de' + path for path in shared]
+    assert [request.url for request in second] == ['https://www.welt.de/politik/article200000003/Asyl.html']
+    stats = spider.crawler.stats
+    assert stats.get_value('link_dedup/requests_not_built') == 2
+    assert stats.get_value('link_dedup/scheduled_links') == 3
+
+    # Without the dedup, the dupefilter is left to drop them
+    spider = get_spider(URL_DATE_FILTER_ENABLED=False, LINK_DEDUP_ENABLED=False)
+    list(spider._requests_to_follow(get_page('https://www.welt.de/', shared)))
+    assert len(list(spider._requests_to_follow(get_page('https://www.welt.de/politik/', shared)))) == 2
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Tests of the request scheduling for news_crawler project
+
+import os
+import subprocess
+import sys
+
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.exceptions import IgnoreRequest
+from scrapy.http import Request
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.middlewares import FrontierMiddleware
+from news_crawler.schedulers import FRONTIER_ID, SharedFrontierScheduler
+
+
+class OutletSpider(Spider):
+    name = 'outlet'
+
+
+def open_frontier(folder: str):
+    """ A scheduler (and a crawler with its middleware) sharing the frontier in the folder, like another process would. """
+    settings = get_project_settings()
+    settings.setdict({'FRONTIER_DIR': folder, 'DOWNLOAD_DELAY': 0}, priority='cmdline')
+    crawler = Crawler(OutletSpider, settings)
+    spider = OutletSpider.from_crawler(crawler)
+    crawler.stats.open_spider(spider)
+    scheduler = SharedFrontierScheduler.from_crawler(crawler)
+    scheduler.open(spider)
+    return scheduler, crawler, spider
+
+
+def get_rows(scheduler: SharedFrontierScheduler):
+    return scheduler.connection.execute('SELECT id, claimed_by FROM requests ORDER BY id').fetchall()
+
+
+def test_requests_are_claimed_until_their_response_arrives(tmp_path):
+    scheduler, crawler, spider = open_frontier(str(tmp_path))
+    for i in range(3):
+        assert scheduler.enqueue_request(Request('https://www.welt.de/artikel{}.html'.format(i)))
+    assert not scheduler.enqueue_request(Request('https://www.welt.de/artikel0.html'))
+
+    request = scheduler.next_request()
+    assert len(scheduler) == 2
+    assert (request.meta[FRONTIER_ID], os.getpid()) in get_rows(scheduler)
+    scheduler.request_done(request, spider)
+    assert len(get_rows(scheduler)) == 2
+
+    # Ignored by a downloader middleware (e.g. disallowed by robots.txt), hence never downloaded
+    request = scheduler.next_request()
+    FrontierMiddleware.from_crawler(crawler).process_exception(request, IgnoreRequest(), spider)
+    assert request.meta[FRONTIER_ID] not in [row[0] for row in get_rows(scheduler)]
+    scheduler.close('finished')
+
+
+def test_retry_replaces_its_claimed_request(tmp_path):
+    scheduler, crawler, spider = open_frontier(str(tmp_path))
+    scheduler.enqueue_request(Request('https://www.welt.de/artikel.html'))
+    request = scheduler.next_request()
+    assert scheduler.enqueue_request(request.replace(dont_filter=True))
+    rows = get_rows(scheduler)
+    assert len(rows) == 1 and rows[0][1] is None
+    assert scheduler.next_request().url == request.url
+    scheduler.close('finished')
+
+
+def test_claims_are_released_when_closing_and_after_a_crash(tmp_path):
+    scheduler, crawler, spider = open_frontier(str(tmp_path))
+    for i in range(2):
+        scheduler.enqueue_request(Request('https://www.welt.de/artikel{}.html'.format(i)))
+    downloading = scheduler.next_request()
+    scheduler.close('shutdown')
+
+    scheduler, crawler, spider = open_frontier(str(tmp_path))
+    assert len(scheduler) == 2
+    crashed = scheduler.next_request()
+    assert crashed.url == downloading.url
+    # Claimed by a process which is no longer running
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait()
+    scheduler.connection.execute('UPDATE requests SET claimed_by = ? WHERE id = ?', (dead.pid, crashed.meta[FRONTIER_ID]))
+
+    other, _, _ = open_frontier(str(tmp_path))
+    assert len(other) == 2
+    assert other.stats.get_value('scheduler/released') == 1
+    assert {other.next_request().url, other.next_request().url} == {'https://www.welt.de/artikel0.html', 'https://www.welt.de/artikel1.html'}
+    other.close('finished')
+    scheduler.close('finished')
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Tests of the sitemap crawl for news_crawler project
+
+import gzip
+import pytest
+
+from scrapy.crawler import Crawler
+from scrapy.http import Request, Response, XmlResponse
+from scrapy.spiderloader import SpiderLoader
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.sitemaps import SitemapTooLarge, get_sitemap_body
+
+
+SITEMAP_INDEX = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.welt.de/sitemaps/2018-12.xml.gz</loc><lastmod>2018-12-31T23:00:00+01:00</lastmod></sitemap>
+  <sitemap><loc>https://www.welt.de/sitemaps/2019-01.xml.gz</loc><lastmod>2019-01-31T23:00:00+01:00</lastmod></sitemap>
+  <sitemap><loc>https://www.welt.de/sitemaps/news.xml</loc></sitemap>
+</sitemapindex>'''
+
+NEWS_SITEMAP = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url>
+    <loc>https://www.welt.de/politik/deutschland/article200000001/Asyl.html</loc>
+    <news:news><news:publication_date>2019-05-04T10:15:00+02:00</news:publication_date></news:news>
+  </url>
+  <url>
+    <loc>https://www.welt.de/politik/deutschland/article180000001/Asyl.html</loc>
+    <news:news><news:publication_date>2018-05-04T10:15:00+02:00</news:publication_date></news:news>
+  </url>
+  <url>
+    <loc>https://www.welt.de/politik/deutschland/article200000002/Migration.html</loc>
+    <lastmod>2018-05-04T10:15:00+02:00</lastmod>
+  </url>
+  <url><loc>https://www.welt.de/politik/deutschland/plus200000003/Asyl.html</loc></url>
+  <url><loc>https://www.welt.de/politik/deutschland/article200000004/Zuwanderung.html</loc></url>
+</urlset>'''
+
+
+def get_spider(**settings):
+    project_settings = get_project_settings()
+    project_settings.setdict({'SITEMAP_CRAWL_ENABLED': True, **settings}, priority='cmdline')
+    spidercls = SpiderLoader.from_settings(project_settings).load('welt')
+    return spidercls.from_crawler(Crawler(spidercls, project_settings))
+
+
+def parse_sitemap(spider, url: str, body: bytes):
+    response_cls = XmlResponse if url.endswith('.xml') else Response
+    return list(spider.parse_sitemap(response_cls(url, body=body, request=Request(url))))
+
+
+def test_sitemap_index_leaves_out_sitemaps_modified_before_the_range():
+    spider = get_spider()
+    requests = parse_sitemap(spider, 'https://www.welt.de/sitemaps/index.xml', SITEMAP_INDEX)
+    assert [request.url for request in requests] == ['https://www.welt.de/sitemaps/2019-01.xml.gz', 'https://www.welt.de/sitemaps/news.xml']
+    assert spider.crawler.stats.get_value('sitemaps/out_of_date') == 1
+    assert not spider.sitemap_articles_found
+
+
+@pytest.mark.parametrize('url, body', [
+    ('https://www.welt.de/sitemaps/news.xml', NEWS_SITEMAP),
+    ('https://www.welt.de/sitemaps/2019-01.xml.gz', gzip.compress(NEWS_SITEMAP)),
+    ])
+def test_sitemap_requests_the_articles_in_the_range(url, body):
+    spider = get_spider()
+    requests = parse_sitemap(spider, url, body)
+    # Published or modified before the range, and paid articles are left out
+    assert [request.url for request in requests] == [
+            'https://www.welt.de/politik/deutschland/article200000001/Asyl.html',
+            'https://www.welt.de/politik/deutschland/article200000004/Zuwanderung.html'
+            ]
+    assert all(request.meta['listed'] for request in requests)
+    assert spider.sitemap_articles_found
+    assert spider.crawler.stats.get_value('sitemaps/out_of_date') == 2
+    assert spider.crawler.stats.get_value('sitemaps/not_allowed') == 1
+
+
+def test_truncated_gzipped_sitemap_keeps_the_articles_decompressed():
+    spider = get_spider()
+    requests = parse_sitemap(spider, 'https://www.welt.de/sitemaps/2019-01.xml.gz', gzip.compress(NEWS_SITEMAP)[:-100])
+    assert [request.url for request in requests] == ['https://www.welt.de/politik/deutschland/article200000001/Asyl.html']
+
+
+def test_gzipped_sitemap_is_limited_to_the_download_maxsize():
+    url = 'https://www.welt.de/sitemaps/2019-01.xml.gz'
+    body = gzip.compress(NEWS_SITEMAP + b' ' * 100000)
+    assert len(body) < 2000
+
+    with pytest.raises(SitemapTooLarge):
+        get_sitemap_body(Response(url, body=body), max_size=len(NEWS_SITEMAP))
+    assert get_sitemap_body(Response(url, body=body), max_size=len(NEWS_SITEMAP) + 100000) == NEWS_SITEMAP + b' ' * 100000
+
+    spider = get_spider(DOWNLOAD_MAXSIZE=50000)
+    assert parse_sitemap(spider, url, body) == []
+    assert spider.crawler.stats.get_value('sitemaps/too_large') == 1
+    assert spider.crawler.stats.get_value('sitemaps/parsed') is None
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# Tests of the article extraction of the spiders for news_crawler project
+
+import os
+import json
+import pytest
+from datetime import datetime
+
+from scrapy.crawler import Crawler
+from scrapy.http import Headers, HtmlResponse, Request
+from scrapy.spiderloader import SpiderLoader
+from scrapy.utils.project import get_project_settings
+
+from news_crawler.offload import ExtractionPool, _extract
+from news_crawler.spiders import parse_iso_date
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+
+# Hand-made pages with the markup of the outlets' articles (including the elements which the spiders' overrides skip or
+# split, e.g. ads, donation calls, captions, agency lines), one per page as `<spider>[-<variant>].html`, and the URL and
+# item of each as extracted by the spiders before they declared their selectors as schemas (without the crawl date and
+# the body of the response; the query keywords, which were collected in a set, sorted)
+with open(os.path.join(FIXTURES, 'expected.json'), encoding='utf-8') as file:
+    EXPECTED = json.load(file)
+
+
+def parse_fixture(name: str):
+    """ The items extracted by a spider from its page. """
+    settings = get_project_settings()
+    spidercls = SpiderLoader.from_settings(settings).load(name.split('-')[0])
+    spider = spidercls.from_crawler(Crawler(spidercls, settings))
+    url = EXPECTED[name]['url']
+    with open(os.path.join(FIXTURES, name + '.html'), 'rb') as file:
+        response = HtmlResponse(url, body=file.read(), request=Request(url), encoding='utf-8')
+    return list(spider.parse_item(response) or [])
+
+
+def test_extraction_pool_uses_the_crawlers_settings():
+    settings = get_project_settings()
+    settings.set('KEYWORDS_MIN_FREQUENCY', 1000, priority='cmdline')
+    spidercls = SpiderLoader.from_settings(settings).load('welt')
+    spider = spidercls.from_crawler(Crawler(spidercls, settings))
+    pool = ExtractionPool(spidercls, spider.settings, 1, 1)
+    with open(os.path.join(FIXTURES, 'welt.html'), 'rb') as file:
+        result = pool.executor.submit(_extract, HtmlResponse, EXPECTED['welt']['url'], file.read(), dict()).result()
+    pool.close()
+    assert result['item'] is None and result['rejection'] == 'keywords'
+    assert result['stats'] == {'rejected/keywords': 1}
+
+
+def get_expected_item(name: str) -> dict:
+    """ The item extracted by the previous spider, with the deliberate changes since. """
+    item = dict(EXPECTED[name]['item'])
+    if name == 'compact_online':
+        # Authors were nested in lists
+        item['author_person'] = [author for authors in item['author_person'] for author in authors]
+        item['author_organization'] = [author for authors in item['author_organization'] for author in authors]
+    if name.split('-')[0] == 'welt':
+        # Recommendations lacked their scheme, e.g. 'welt.de/politik/...'
+        item['recommendations'] = ['https://www.' + link for link in item['recommendations']]
+    return item
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_extraction_matches_previous_spiders(name):
+    items = parse_fixture(name)
+    assert len(items) == 1
+    item = {key: value for key, value in items[0].items() if key not in ('crawl_date', 'response_body', 'topics')}
+    item['query_keywords'] = sorted(item['query_keywords'])
+    assert item == get_expected_item(name)
+
+
+@pytest.mark.parametrize('date, parsed', [
+    ('2020-05-04', datetime(2020, 5, 4)),
+    ('2020-05-04T10:15:00', datetime(2020, 5, 4, 10, 15)),
+    ('2020-05-04T10:15:00.000+02:00', datetime(2020, 5, 4, 10, 15)),
+    ('2020-05-04T10:15:00Z', datetime(2020, 5, 4, 10, 15)),
+    ('2020-05-04 10:15:00+02:00', datetime(2020, 5, 4, 10, 15)),
+    ('2020-05-04 10:15:00 +0200', datetime(2020, 5, 4, 10, 15)),
+    ('2020-05-04+02:00', datetime(2020, 5, 4)),
+    ])
+def test_parse_iso_date_is_naive(date, parsed):
+    result = parse_iso_date(date)
+    assert result == parsed
+    assert result.tzinfo is None
+    # Compares with the naive dates of the topics
+    assert datetime(2019, 1, 1) < result
+
+
+@pytest.mark.parametrize('name, recommendations, requested', [
+    ('welt', ['/politik/article1/Titel.html', 'https://www.welt.de/politik/article2/Titel.html', 'https://www.spiegel.de/politik/a-1.html'],
+        ['https://www.welt.de/politik/article1/Titel.html', 'https://www.welt.de/politik/article2/Titel.html']),
+    # Without allowed domains
+    ('opposition24', ['/2021/05/artikel/', 'mailto:redaktion@opposition24.com'], ['https://opposition24.com/2021/05/artikel/']),
+    ])
+def test_recommendations_are_resolved_against_the_article(name, recommendations, requested):
+    settings = get_project_settings()
+    settings.set('RECOMMENDATIONS_SEEDING_ENABLED', True, priority='cmdline')
+    spidercls = SpiderLoader.from_settings(settings).load(name)
+    spider = spidercls.from_crawler(Crawler(spidercls, settings))
+    url = spider.start_urls[0] + 'artikel'
+    response = HtmlResponse(url, body=b'<html></html>', request=Request(url))
+    assert [request.url for request in spider.recommendation_requests(response, recommendations)] == requested
+    assert spider.crawler.stats.get_value('recommendations/invalid') == 1
+
+
+def get_spider(name: str):
+    settings = get_project_settings()
+    spidercls = SpiderLoader.from_settings(settings).load(name)
+    return spidercls.from_crawler(Crawler(spidercls, settings))
+
+
+def linked_data(date: str) -> str:
+    return '<script type="application/ld+json">{{"@type": "NewsArticle", "datePublished": "{}"}}</script>'.format(date)
+
+
+@pytest.mark.parametrize('head, reason', [
+    # Cut off before the end of the head, e.g. before the linked data
+    ('<html><head><title>Titel</title>' + '<meta name="x" content="{}">'.format('x' * 1000) * 64, None),
+    ('<html><head><title>Titel</title>' + linked_data('2020-05-04T10:15:00+02:00')[:60], None),
+    ('<html><head><title>Titel</title></head><body><p>Text</p>', 'no_date'),
+    ('<html><head><title>Titel</title>' + linked_data('2020-05-04T10:15:00+02:00'), None),
+    ('<html><head><title>Titel</title>' + linked_data('2010-05-04T10:15:00+02:00'), 'out_of_date'),
+    ])
+def test_judge_head(head, reason):
+    spider = get_spider('bild')
+    url = 'https://www.bild.de/politik/inland/artikel-70000000.bild.html'
+    assert spider.judge_head(Request(url), Headers({'Content-Type': 'text/html; charset=utf-8'}), head.encode('utf-8')) == reason